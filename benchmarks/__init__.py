@@ -0,0 +1 @@
+"""DataManager 및 이벤트 핸들러 벤치마크"""
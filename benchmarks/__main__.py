@@ -0,0 +1,102 @@
+"""벤치마크 실행
+
+    python -m benchmarks                    # 실행 후 baseline.json과 비교
+    python -m benchmarks --update-baseline  # 현재 결과를 기준선으로 저장
+    python -m benchmarks --scale 0.1 --only dm.search
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from utils.data_manager import DataManager
+from . import bench_data_manager, bench_handlers
+from .harness import Runner, compare, load_results, save_results, settings_mismatch
+from .seed import seed_database
+
+BENCH_DIR = Path(__file__).parent
+DEFAULT_BASELINE = BENCH_DIR / "baseline.json"
+DEFAULT_OUTPUT = BENCH_DIR / "results.json"
+
+
+async def _run(args: argparse.Namespace) -> int:
+    runner = Runner(scale=args.scale, only=args.only)
+
+    with tempfile.TemporaryDirectory(prefix="stack-bench-") as tmp:
+        dm = DataManager(None, db_path=Path(tmp) / "bench.db")
+        await dm.init_db()
+        if not dm.pool.is_open:
+            print("데이터베이스를 열지 못했습니다.", file=sys.stderr)
+            return 2
+        try:
+            started = time.perf_counter()
+            seed = await seed_database(dm, args.profiles, args.mappings)
+            print(
+                f"시드 완료: 프로필 {len(seed.profile_ids)}개, 반응 역할 {len(seed.reaction_ids)}개 "
+                f"({time.perf_counter() - started:.1f}초)\n"
+            )
+
+            await bench_data_manager.run(runner, dm, seed)
+            await bench_handlers.run(runner, dm, seed)
+        finally:
+            await dm.close()
+
+    meta = {"profiles": args.profiles, "mappings": args.mappings, "scale": args.scale, "only": args.only}
+    save_results(args.output, runner.results, meta)
+    print(f"\n결과 저장: {args.output}")
+
+    if args.update_baseline:
+        save_results(args.baseline, runner.results, meta)
+        print(f"기준선 갱신: {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print("기준선이 없어 비교를 건너뜁니다. (--update-baseline으로 생성)")
+        return 0
+
+    baseline = load_results(args.baseline)
+    data_diff, run_diff = settings_mismatch(baseline, meta)
+    if data_diff:
+        print("\n⚠️ 기준선과 시드 데이터 설정이 달라 비교를 건너뜁니다:", file=sys.stderr)
+        for line in data_diff:
+            print(f"  - {line}", file=sys.stderr)
+        return 0
+    if run_diff:
+        print("\n⚠️ 기준선과 실행 설정이 달라 p50만 비교합니다:", file=sys.stderr)
+        for line in run_diff:
+            print(f"  - {line}", file=sys.stderr)
+
+    regressions = compare(runner.results, baseline, args.tolerance, check_p99=not run_diff)
+    if regressions:
+        print(f"\n❌ 성능 회귀 {len(regressions)}건 (허용치 {args.tolerance:.0%})", file=sys.stderr)
+        for line in regressions:
+            print(f"  - {line}", file=sys.stderr)
+        return 1
+
+    print(f"✅ 기준선 대비 회귀 없음 (허용치 {args.tolerance:.0%})")
+    return 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="DataManager/핸들러 벤치마크")
+    parser.add_argument("--profiles", type=int, default=100_000, help="시드할 프로필 수")
+    parser.add_argument("--mappings", type=int, default=10_000, help="시드할 반응 역할 매핑 수")
+    parser.add_argument("--scale", type=float, default=1.0, help="반복 횟수 배율")
+    parser.add_argument("--only", help="이름에 이 문자열이 포함된 벤치마크만 실행")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--tolerance", type=float, default=0.5, help="허용 지연 증가율 (0.5 = p50 1.5배)")
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args()
+
+    # 핸들러의 경고/오류 로그만 표시
+    logging.getLogger().setLevel(logging.WARNING)
+    sys.exit(asyncio.run(_run(args)))
+
+
+if __name__ == "__main__":
+    main()
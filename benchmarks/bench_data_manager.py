@@ -0,0 +1,111 @@
+"""DataManager 메서드 벤치마크"""
+from __future__ import annotations
+import random
+
+from utils.data_manager import DataManager
+from .harness import Runner
+from .seed import SNOWFLAKE_BASE, SeedInfo
+
+__all__ = ["run"]
+
+
+async def run(runner: Runner, dm: DataManager, seed: SeedInfo) -> None:
+    """DataManager 공개 메서드 측정"""
+    rng = random.Random(7)
+    ids = seed.profile_ids
+    random_ids = [rng.choice(ids) for _ in range(20000)]
+    hot_ids = ids[:100]
+    guild_id = seed.guild_ids[0]
+
+    # 프로필 조회 (캐시 미스는 매번 캐시를 비워 DB 경로를 측정)
+    def get_profile_cold(i: int):
+        dm.profile_cache.clear()
+        return dm.get_profile(random_ids[i % len(random_ids)])
+
+    await runner.bench("dm.get_profile.cold", get_profile_cold, 3000)
+    await runner.bench("dm.get_profile.hot", lambda i: dm.get_profile(hot_ids[i % len(hot_ids)]), 20000)
+    await runner.bench("dm.count_profiles", lambda i: dm.count_profiles(), 300)
+
+    # 키셋 페이지네이션: 첫 페이지, 깊은 페이지, 마지막 페이지
+    deep_keys = sorted(zip(seed.nicknames, ids))
+    middle_key = deep_keys[len(deep_keys) // 2]
+    await runner.bench("dm.get_profiles_page.first", lambda i: dm.get_profiles_page(10), 3000)
+    await runner.bench("dm.get_profiles_page.deep", lambda i: dm.get_profiles_page(10, middle_key), 3000)
+    await runner.bench("dm.get_profiles_page.last", lambda i: dm.get_profiles_page(10, backward=True), 3000)
+
+    # 검색: trigram(3글자 이상), 짧은 접두어, 지역, 자동완성(닉네임만)
+    long_queries = [name[:3] for name in seed.nicknames if len(name) >= 3][:500]
+    short_queries = [name[:2] for name in seed.nicknames[:500]]
+    await runner.bench(
+        "dm.search_profiles.trigram", lambda i: dm.search_profiles(long_queries[i % len(long_queries)]), 2000
+    )
+    await runner.bench(
+        "dm.search_profiles.prefix", lambda i: dm.search_profiles(short_queries[i % len(short_queries)], nickname_only=True), 2000
+    )
+    await runner.bench("dm.search_profiles.region", lambda i: dm.search_profiles("서울"), 2000)
+    await runner.bench(
+        "dm.search_profiles.autocomplete",
+        lambda i: dm.search_profiles(long_queries[i % len(long_queries)], nickname_only=True),
+        2000,
+    )
+
+    # 쓰기
+    await runner.bench(
+        "dm.register_profile.update",
+        lambda i: dm.register_profile(random_ids[i % len(random_ids)], "bench", f"벤치{i}", "2000", "남", "서울"),
+        1000,
+    )
+    await runner.bench(
+        "dm.register_profile.insert",
+        lambda i: dm.register_profile(SNOWFLAKE_BASE * 6 + i, "bench", f"신규{i}", "2000", "여", "부산"),
+        1000,
+        warmup=0,
+    )
+    await runner.bench("dm.add_warning", lambda i: dm.add_warning(random_ids[i % len(random_ids)]), 1000)
+    await runner.bench("dm.remove_warning", lambda i: dm.remove_warning(random_ids[i % len(random_ids)]), 1000)
+    await runner.bench("dm.set_admin_memo", lambda i: dm.set_admin_memo(random_ids[i % len(random_ids)], f"메모 {i}"), 1000)
+
+    # 서버 설정
+    await runner.bench("dm.get_log_channel", lambda i: dm.get_log_channel(seed.guild_ids[i % len(seed.guild_ids)]), 20000)
+    await runner.bench(
+        "dm.set_log_channel",
+        lambda i: dm.set_log_channel(guild_id, seed.channel_ids[guild_id][i % 5]),
+        1000,
+    )
+
+    # 반응 역할
+    mappings = seed.mappings
+    await runner.bench(
+        "dm.get_role_for_reaction",
+        lambda i: dm.get_role_for_reaction(mappings[i % len(mappings)][0], mappings[i % len(mappings)][1]),
+        50000,
+    )
+    await runner.bench("dm.get_all_reaction_roles.guild", lambda i: dm.get_all_reaction_roles(guild_id), 300)
+    await runner.bench(
+        "dm.get_reaction_role_by_id",
+        lambda i: dm.get_reaction_role_by_id(seed.reaction_ids[i % len(seed.reaction_ids)]),
+        3000,
+    )
+    new_message = SNOWFLAKE_BASE * 7
+    channel_id = seed.channel_ids[guild_id][0]
+    added: list[str] = []
+
+    async def add_reaction_role(i: int) -> None:
+        added.append(await dm.add_reaction_role(guild_id, new_message + i, channel_id, "✅", SNOWFLAKE_BASE * 8))
+
+    await runner.bench("dm.add_reaction_role", add_reaction_role, 1000, warmup=0)
+    await runner.bench(
+        "dm.add_reaction_roles.batch100",
+        lambda i: dm.add_reaction_roles(
+            guild_id,
+            [(new_message + 100000 + i * 100 + j, channel_id, "🎮", SNOWFLAKE_BASE * 8) for j in range(100)],
+        ),
+        50,
+        warmup=0,
+    )
+    await runner.bench(
+        "dm.remove_reaction_by_id",
+        lambda i: dm.remove_reaction_by_id(added[i % len(added)]),
+        len(added),
+        warmup=0,
+    )
@@ -0,0 +1,77 @@
+"""이벤트 핸들러/명령어 벤치마크 (가짜 Discord 객체 사용)"""
+from __future__ import annotations
+from datetime import datetime
+from types import MethodType
+
+import discord
+
+from commands.event_logger import EventLogger
+from commands.profile import ProfileCommands
+from main import StackBot
+from utils.data_manager import DataManager
+from utils.log_dispatcher import LogDispatcher
+from utils.log_spool import LogSpool
+from utils.reaction_debouncer import ReactionDebouncer
+from utils.rest_scheduler import RestScheduler
+from .fakes import FakeBot, FakeContext, reaction_payload
+from .harness import Runner
+from .seed import SeedInfo
+
+__all__ = ["run"]
+
+
+async def run(runner: Runner, dm: DataManager, seed: SeedInfo) -> None:
+    """on_raw_reaction_add, 인증 안내 DM, EventLogger.send_log, /프로필목록 측정"""
+    bot = FakeBot(dm)
+    for guild_id in seed.guild_ids:
+        guild = bot.add_guild(guild_id)
+        for channel_id in seed.channel_ids[guild_id]:
+            guild.add_channel(channel_id)
+    dm.bot = bot
+    bot.rest_scheduler = RestScheduler()
+    # 반응은 병합 후 실행되므로 StackBot의 처리 메서드를 가짜 봇에 연결
+    bot.reaction_debouncer = ReactionDebouncer(window=0)
+    bot._send_verification_prompt = MethodType(StackBot._send_verification_prompt, bot)
+
+    # 역할 반응이 걸린 메시지 (병합 대기열 등록) / 관계없는 메시지 (인덱스에서 바로 반환)
+    mappings = seed.mappings
+    user_ids = seed.profile_ids
+
+    def reaction_hit(i: int):
+        message_id, emoji, guild_id = mappings[i % len(mappings)]
+        payload = reaction_payload(guild_id, message_id, user_ids[i % len(user_ids)], emoji)
+        return StackBot.on_raw_reaction_add(bot, payload)
+
+    def reaction_miss(i: int):
+        payload = reaction_payload(seed.guild_ids[0], 1, user_ids[i % len(user_ids)], "✅")
+        return StackBot.on_raw_reaction_add(bot, payload)
+
+    await runner.bench("handler.on_raw_reaction_add.mapped", reaction_hit, 3000)
+    await runner.bench("handler.on_raw_reaction_add.unmapped", reaction_miss, 20000)
+    await bot.reaction_debouncer.close()
+
+    def verification_prompt(i: int):
+        message_id, emoji, guild_id = mappings[i % len(mappings)]
+        payload = reaction_payload(guild_id, message_id, user_ids[i % len(user_ids)], emoji)
+        return StackBot._send_verification_prompt(bot, payload, 1)
+
+    await runner.bench("handler.verification_prompt", verification_prompt, 3000)
+
+    # send_log는 스풀에 기록만 하므로 남은 로그는 끝에서 모두 전송
+    bot.log_dispatcher = LogDispatcher(bot, LogSpool(dm.db_path.parent / "log_spool.db"))
+    await bot.log_dispatcher.start()
+    event_logger = EventLogger(bot)
+    embed = discord.Embed(title="벤치마크", description="로그 전송", timestamp=datetime.now())
+    await runner.bench(
+        "handler.EventLogger.send_log",
+        lambda i: event_logger.send_log(bot.get_guild(seed.guild_ids[i % len(seed.guild_ids)]), embed),
+        5000,
+    )
+    await bot.log_dispatcher.close()
+
+    profile_commands = ProfileCommands(bot)
+    list_profiles = profile_commands.list_profiles.callback
+    guild = bot.get_guild(seed.guild_ids[0])
+    await runner.bench(
+        "command.list_profiles", lambda i: list_profiles(profile_commands, FakeContext(bot, guild)), 300
+    )
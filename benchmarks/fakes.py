@@ -0,0 +1,119 @@
+"""벤치마크용 가짜 Discord 객체
+
+게이트웨이/REST 없이 핸들러 코드 경로만 실행하도록 필요한 속성과 메서드만
+흉내 냅니다. 전송 계열 메서드는 호출 횟수만 세고 바로 반환합니다.
+"""
+from __future__ import annotations
+from types import SimpleNamespace
+from typing import Any
+
+import discord
+
+__all__ = ["FakeBot", "FakeChannel", "FakeContext", "FakeGuild", "FakeUser", "reaction_payload"]
+
+
+class FakeUser:
+    """DM을 받을 수 있는 유저"""
+
+    def __init__(self, user_id: int):
+        self.id = user_id
+        self.bot = False
+        self.mention = f"<@{user_id}>"
+        self.sent = 0
+
+    async def send(self, *args: Any, **kwargs: Any) -> None:
+        self.sent += 1
+
+
+class FakeChannel:
+    """메시지를 보낼 수 있는 텍스트 채널"""
+
+    def __init__(self, channel_id: int, guild: "FakeGuild"):
+        self.id = channel_id
+        self.guild = guild
+        self.mention = f"<#{channel_id}>"
+        self.sent = 0
+
+    async def send(self, *args: Any, **kwargs: Any) -> None:
+        self.sent += 1
+
+
+class FakeGuild:
+    """채널 조회만 지원하는 서버"""
+
+    def __init__(self, guild_id: int):
+        self.id = guild_id
+        self.channels: dict[int, FakeChannel] = {}
+        self.filesize_limit = 25 * 1024 * 1024
+
+    def add_channel(self, channel_id: int) -> FakeChannel:
+        channel = self.channels[channel_id] = FakeChannel(channel_id, self)
+        return channel
+
+    def get_channel(self, channel_id: int) -> FakeChannel | None:
+        return self.channels.get(channel_id)
+
+    def get_member(self, user_id: int) -> None:
+        return None
+
+    def get_role(self, role_id: int) -> None:
+        return None
+
+
+class FakeBot:
+    """StackBot 핸들러가 사용하는 속성만 가진 봇"""
+
+    def __init__(self, data_manager: Any, user_id: int = 1):
+        self.data_manager = data_manager
+        self.user = SimpleNamespace(id=user_id, name="bench")
+        self.guilds: dict[int, FakeGuild] = {}
+        self.users: dict[int, FakeUser] = {}
+
+    def add_guild(self, guild_id: int) -> FakeGuild:
+        guild = self.guilds[guild_id] = FakeGuild(guild_id)
+        return guild
+
+    def get_guild(self, guild_id: int) -> FakeGuild | None:
+        return self.guilds.get(guild_id)
+
+    def get_channel(self, channel_id: int) -> FakeChannel | None:
+        for guild in self.guilds.values():
+            channel = guild.get_channel(channel_id)
+            if channel:
+                return channel
+        return None
+
+    def get_user(self, user_id: int) -> FakeUser:
+        user = self.users.get(user_id)
+        if user is None:
+            user = self.users[user_id] = FakeUser(user_id)
+        return user
+
+    async def fetch_user(self, user_id: int) -> FakeUser:
+        return self.get_user(user_id)
+
+
+class FakeContext:
+    """슬래시 명령어 ApplicationContext 대용"""
+
+    def __init__(self, bot: FakeBot, guild: FakeGuild, author_id: int = 2):
+        self.bot = bot
+        self.guild = guild
+        self.author = FakeUser(author_id)
+        self.responses = 0
+
+    async def defer(self, *args: Any, **kwargs: Any) -> None:
+        pass
+
+    async def respond(self, *args: Any, **kwargs: Any) -> None:
+        self.responses += 1
+
+
+def reaction_payload(guild_id: int, message_id: int, user_id: int, emoji: str) -> Any:
+    """on_raw_reaction_add에 넘길 RawReactionActionEvent 대용"""
+    return SimpleNamespace(
+        guild_id=guild_id,
+        message_id=message_id,
+        user_id=user_id,
+        emoji=discord.PartialEmoji(name=emoji),
+    )
@@ -0,0 +1,158 @@
+"""벤치마크 측정 및 기준선 비교"""
+from __future__ import annotations
+import inspect
+import json
+import platform
+import sqlite3
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable
+
+__all__ = ["BenchResult", "Runner", "compare", "load_results", "save_results", "settings_mismatch"]
+
+# 이보다 작은 차이는 측정 잡음으로 보고 회귀로 판단하지 않음
+MIN_DELTA_MS = 0.05
+# p99는 GC/스케줄러 지연 한 번에도 크게 튀므로 (캐시 적중처럼 수 μs인 항목) 더 큰 차이만 회귀로 봄
+P99_MIN_DELTA_MS = 0.5
+
+# 값이 다르면 결과를 그대로 비교할 수 없는 실행 설정
+_DATA_SETTINGS = ("profiles", "mappings")
+# 값이 다르면 반복 횟수/측정 대상이 달라져 p99를 비교할 수 없는 실행 설정
+_RUN_SETTINGS = ("scale", "only")
+
+
+@dataclass(slots=True)
+class BenchResult:
+    """벤치마크 하나의 결과 (시간 단위는 ms)"""
+
+    name: str
+    iterations: int
+    ops_per_sec: float
+    p50_ms: float
+    p99_ms: float
+    max_ms: float
+
+
+def _percentile(samples: list[float], q: float) -> float:
+    """정렬된 표본의 백분위수 (nearest-rank)"""
+    index = min(len(samples) - 1, max(0, int(round(q * len(samples) + 0.5)) - 1))
+    return samples[index]
+
+
+class Runner:
+    """이름별로 호출을 반복 측정해 결과를 모음"""
+
+    def __init__(self, scale: float = 1.0, only: str | None = None):
+        self.scale = scale
+        self.only = only
+        self.results: list[BenchResult] = []
+
+    async def bench(
+        self,
+        name: str,
+        func: Callable[[int], Any],
+        iterations: int,
+        warmup: int = 20,
+    ) -> BenchResult | None:
+        """func(i)를 iterations번 호출해 지연 시간 측정 (코루틴이면 await)"""
+        if self.only and self.only not in name:
+            return None
+
+        iterations = max(1, int(iterations * self.scale))
+        for i in range(min(warmup, iterations)):
+            result = func(i)
+            if inspect.isawaitable(result):
+                await result
+
+        samples: list[float] = []
+        started = time.perf_counter()
+        for i in range(iterations):
+            t0 = time.perf_counter()
+            result = func(i)
+            if inspect.isawaitable(result):
+                await result
+            samples.append((time.perf_counter() - t0) * 1000)
+        total = time.perf_counter() - started
+
+        samples.sort()
+        result = BenchResult(
+            name=name,
+            iterations=iterations,
+            ops_per_sec=iterations / total if total else 0.0,
+            p50_ms=_percentile(samples, 0.50),
+            p99_ms=_percentile(samples, 0.99),
+            max_ms=samples[-1],
+        )
+        self.results.append(result)
+        print(
+            f"{name:<40}{result.ops_per_sec:>12.0f} ops/s"
+            f"{result.p50_ms:>10.3f}ms p50{result.p99_ms:>10.3f}ms p99"
+        )
+        return result
+
+
+def save_results(path: Path, results: list[BenchResult], meta: dict[str, Any]) -> None:
+    """결과를 JSON으로 저장"""
+    payload = {
+        "meta": {
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "platform": platform.platform(),
+            **meta,
+        },
+        "results": {result.name: asdict(result) for result in results},
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+
+
+def load_results(path: Path) -> dict[str, Any]:
+    """저장된 결과 JSON 로드"""
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def settings_mismatch(baseline: dict[str, Any], meta: dict[str, Any]) -> tuple[list[str], list[str]]:
+    """기준선과 실행 설정 차이 → (데이터 설정 차이, 실행 설정 차이)"""
+    base_meta = baseline.get("meta", {})
+
+    def diff(keys: tuple[str, ...]) -> list[str]:
+        defaults = {"scale": 1.0, "only": None}
+        return [
+            f"{key}: 기준 {base_meta.get(key, defaults.get(key))!r} / 현재 {meta.get(key)!r}"
+            for key in keys
+            if base_meta.get(key, defaults.get(key)) != meta.get(key)
+        ]
+
+    return diff(_DATA_SETTINGS), diff(_RUN_SETTINGS)
+
+
+def compare(
+    results: list[BenchResult],
+    baseline: dict[str, Any],
+    tolerance: float,
+    check_p99: bool = True,
+) -> list[str]:
+    """기준선 대비 회귀 목록 반환
+
+    p50이 기준선의 (1 + tolerance)배를 넘고 차이가 MIN_DELTA_MS 이상이거나,
+    p99가 (1 + 2 * tolerance)배를 넘고 차이가 P99_MIN_DELTA_MS 이상이면 회귀로
+    봅니다. 기준선에 없는 벤치마크는 비교하지 않습니다.
+    """
+    regressions = []
+    base_results = baseline.get("results", {})
+    for result in results:
+        base = base_results.get(result.name)
+        if not base:
+            continue
+        checks = [("p50", result.p50_ms, base["p50_ms"], 1 + tolerance, MIN_DELTA_MS)]
+        if check_p99:
+            checks.append(("p99", result.p99_ms, base["p99_ms"], 1 + 2 * tolerance, P99_MIN_DELTA_MS))
+        for label, current, previous, factor, min_delta in checks:
+            if current > previous * factor and current - previous >= min_delta:
+                regressions.append(
+                    f"{result.name}: {label} {current:.3f}ms (기준 {previous:.3f}ms, x{current / max(previous, 1e-9):.2f})"
+                )
+    return regressions
@@ -0,0 +1,97 @@
+"""벤치마크용 데이터베이스 시드"""
+from __future__ import annotations
+import random
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from utils.data_manager import DataManager
+
+__all__ = ["SNOWFLAKE_BASE", "SeedInfo", "seed_database"]
+
+# 실제 Discord ID와 비슷한 크기의 정수
+SNOWFLAKE_BASE = 10 ** 17
+
+_SYLLABLES = "가나다라마바사아자차카타파하김이박최정강조윤장임한오서신권황안송류홍"
+_REGIONS = ("서울", "부산", "대구", "인천", "광주", "대전", "울산", "경기", "강원", "제주")
+_GENDERS = ("남", "여", "기타", "비공개")
+_EMOJIS = ("✅", "🎮", "🎵", "📚", "🎨")
+
+
+@dataclass(slots=True)
+class SeedInfo:
+    """시드된 데이터 요약"""
+
+    profile_ids: list[int]
+    guild_ids: list[int]
+    channel_ids: dict[int, list[int]]  # guild_id -> 채널 목록
+    mappings: list[tuple[int, str, int]] = field(default_factory=list)  # (message_id, emoji, guild_id)
+    reaction_ids: list[str] = field(default_factory=list)
+    nicknames: list[str] = field(default_factory=list)
+
+
+def _nickname(rng: random.Random) -> str:
+    return "".join(rng.choice(_SYLLABLES) for _ in range(rng.randint(2, 6)))
+
+
+async def seed_database(
+    data_manager: DataManager,
+    profiles: int,
+    mappings: int,
+    guilds: int = 10,
+    seed: int = 42,
+) -> SeedInfo:
+    """프로필/관리자 정보와 반응 역할 매핑을 채움"""
+    rng = random.Random(seed)
+    now = datetime.now().isoformat()
+
+    profile_rows = []
+    nicknames = []
+    for i in range(profiles):
+        nickname = _nickname(rng)
+        nicknames.append(nickname)
+        profile_rows.append((
+            SNOWFLAKE_BASE + i, f"user{i}", nickname, str(rng.randint(1980, 2012)),
+            rng.choice(_GENDERS), rng.choice(_REGIONS), now, now,
+        ))
+
+    async with data_manager.pool.writer() as db:
+        await db.executemany("""
+            INSERT INTO user_profiles
+            (user_id, username, display_name, birth_year, gender, region, registered_at, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """, profile_rows)
+        await db.executemany("""
+            INSERT INTO admin_info (user_id, warning_count, admin_memo, updated_at)
+            VALUES (?, ?, '', ?)
+        """, [(row[0], rng.randint(0, 3), now) for row in profile_rows])
+
+    guild_ids = [SNOWFLAKE_BASE * 2 + g for g in range(guilds)]
+    channel_ids = {
+        guild_id: [SNOWFLAKE_BASE * 3 + g * 100 + c for c in range(5)]
+        for g, guild_id in enumerate(guild_ids)
+    }
+    info = SeedInfo(
+        profile_ids=[row[0] for row in profile_rows],
+        guild_ids=guild_ids,
+        channel_ids=channel_ids,
+        nicknames=nicknames,
+    )
+
+    # 메시지당 이모지 여러 개, 서버별로 한 번에 일괄 등록
+    per_guild = max(1, mappings // guilds)
+    message_id = SNOWFLAKE_BASE * 4
+    for g, guild_id in enumerate(guild_ids):
+        batch = []
+        for m in range(per_guild):
+            if m % len(_EMOJIS) == 0:
+                message_id += 1
+            emoji = _EMOJIS[m % len(_EMOJIS)]
+            channel_id = channel_ids[guild_id][(m // len(_EMOJIS)) % len(channel_ids[guild_id])]
+            batch.append((message_id, channel_id, emoji, SNOWFLAKE_BASE * 5 + g * 10 + m % 10))
+            info.mappings.append((message_id, emoji, guild_id))
+        info.reaction_ids.extend(await data_manager.add_reaction_roles(guild_id, batch))
+
+    for guild_id in guild_ids:
+        await data_manager.set_log_channel(guild_id, channel_ids[guild_id][0])
+
+    return info
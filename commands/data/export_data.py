@@ -0,0 +1,31 @@
+"""프로필 데이터 내보내기"""
+from __future__ import annotations
+import discord
+
+from utils.data_transfer import FORMATS, default_export_path
+from . import data_group
+
+
+@data_group.command(
+    name="내보내기",
+    description="프로필과 관리자 정보를 파일로 내보냅니다"
+)
+async def export_data(
+    ctx: discord.ApplicationContext,
+    형식: str = discord.Option(str, description="파일 형식", choices=list(FORMATS), default="jsonl")
+):
+    """프로필 데이터 내보내기"""
+    await ctx.defer(ephemeral=True)
+    
+    path = default_export_path(형식)
+    count = await ctx.bot.data_manager.export_profiles(path)
+    if count is None:
+        await ctx.followup.send("❌ 데이터를 내보내지 못했습니다.", ephemeral=True)
+        return
+    
+    message = f"✅ {count}개 프로필을 내보냈습니다. (`data/exports/{path.name}`)"
+    if path.stat().st_size > ctx.guild.filesize_limit:
+        await ctx.followup.send(f"{message}\n파일이 너무 커서 첨부하지 못했습니다.", ephemeral=True)
+        return
+    
+    await ctx.followup.send(message, file=discord.File(path), ephemeral=True)
@@ -0,0 +1,45 @@
+"""프로필 데이터 가져오기"""
+from __future__ import annotations
+from pathlib import Path
+import discord
+
+from utils.data_transfer import EXPORT_DIR, FORMATS
+from . import data_group
+
+
+@data_group.command(
+    name="가져오기",
+    description="내보낸 JSONL/CSV 파일에서 프로필과 관리자 정보를 가져옵니다"
+)
+async def import_data(
+    ctx: discord.ApplicationContext,
+    파일: discord.Attachment = discord.Option(discord.Attachment, description="가져올 파일 (.jsonl 또는 .csv)")
+):
+    """프로필 데이터 가져오기"""
+    suffix = Path(파일.filename).suffix.lstrip(".").lower()
+    if suffix not in FORMATS:
+        await ctx.respond("❌ .jsonl 또는 .csv 파일만 가져올 수 있습니다.", ephemeral=True)
+        return
+    
+    await ctx.defer(ephemeral=True)
+    
+    EXPORT_DIR.mkdir(parents=True, exist_ok=True)
+    path = EXPORT_DIR / f"import-{파일.id}.{suffix}"
+    try:
+        await 파일.save(path)
+        result = await ctx.bot.data_manager.import_profiles(path)
+    except discord.HTTPException as e:
+        await ctx.followup.send(f"❌ 파일을 내려받지 못했습니다: {e}", ephemeral=True)
+        return
+    finally:
+        path.unlink(missing_ok=True)
+    
+    if result is None:
+        await ctx.followup.send("❌ 데이터를 가져오지 못했습니다. 파일 형식을 확인해주세요.", ephemeral=True)
+        return
+    
+    imported, skipped = result
+    message = f"✅ {imported}개 프로필을 가져왔습니다."
+    if skipped:
+        message += f" (잘못된 행 {skipped}개 건너뜀)"
+    await ctx.followup.send(message, ephemeral=True)
@@ -1,11 +1,17 @@
 """서버 이벤트 로그"""
 from __future__ import annotations
 
+import asyncio
 import logging
+import tempfile
+from collections import Counter
 from discord.ext import commands
 import discord
 from datetime import datetime
-from utils.constants import COLORS
+from utils.constants import COLORS, JOIN_BURST_SUMMARY_INTERVAL
+from utils.join_burst import BurstSummary, JoinBurstDetector
+from utils.log_dispatcher import LogSlot
+from utils.message_store import StoredMessage
 from zoneinfo import ZoneInfo
 logger = logging.getLogger(__name__)
 KST = ZoneInfo("Asia/Seoul")
@@ -15,20 +21,50 @@ class EventLogger(commands.Cog):
         """초기화"""
         self.bot = bot
         self.data_manager = bot.data_manager
-    async def send_log(self, guild: discord.Guild, embed: discord.Embed) -> None:
-        """로그 채널에 embed 전송"""
+        self.join_bursts = JoinBurstDetector()
+        self._burst_tasks: dict[int, asyncio.Task] = {}
+    def cog_unload(self) -> None:
+        """집계 작업 정리"""
+        for task in self._burst_tasks.values():
+            task.cancel()
+    async def send_log(
+        self,
+        guild: discord.Guild,
+        embed: discord.Embed,
+        file: discord.File | None = None,
+        slot: LogSlot | None = None
+    ) -> None:
+        """로그 채널 전송 대기열에 embed 추가 (서버별로 묶어서 전송, slot이 있으면 그 자리에)"""
         try:
-            guild_id = str(guild.id)
-            log_channel_id = await self.data_manager.get_log_channel(guild_id)
+            if slot:
+                await self.bot.log_dispatcher.fill(slot, embed, file)
+                return
+            log_channel_id = await self.data_manager.get_log_channel(guild.id)
             if log_channel_id:
-                channel = guild.get_channel(int(log_channel_id))
-                if channel:
-                    await channel.send(embed=embed)
+                await self.bot.log_dispatcher.submit(guild.id, embed, file)
+                return
         except Exception as e:
             logger.error(f"로그 전송 실패: {e}")
+        if file:
+            file.close()
+    async def reserve_log(self, guild: discord.Guild) -> LogSlot | None:
+        """로그 순서를 먼저 잡아 둠 (로그 채널이 없으면 None, 다 쓰면 반드시 cancel)"""
+        try:
+            if await self.data_manager.get_log_channel(guild.id):
+                return self.bot.log_dispatcher.reserve(guild.id)
+        except Exception as e:
+            logger.error(f"로그 자리 확보 실패: {e}")
+        return None
     @commands.Cog.listener()
     async def on_member_join(self, member: discord.Member) -> None:
-        """유저 입장 로그"""
+        """유저 입장 로그 (입장 급증 시 요약으로 집계)"""
+        aggregated, started = self.join_bursts.record_join(
+            member.guild.id, member.id, str(member), member.created_at
+        )
+        if aggregated:
+            if started:
+                await self._start_burst(member.guild)
+            return
         embed = discord.Embed(
             title="유저 입장",
             description=f"{member.mention}님이 서버에 입장했습니다.",
@@ -41,7 +77,9 @@ class EventLogger(commands.Cog):
         await self.send_log(member.guild, embed)
     @commands.Cog.listener()
     async def on_member_remove(self, member: discord.Member) -> None:
-        """유저 퇴장 로그"""
+        """유저 퇴장 로그 (입장 급증 집계 중에는 요약에 포함)"""
+        if self.join_bursts.record_leave(member.guild.id, member.id, str(member)):
+            return
         embed = discord.Embed(
             title="유저 퇴장",
             description=f"{member.mention}님이 서버에서 퇴장했습니다.",
@@ -53,66 +91,236 @@ class EventLogger(commands.Cog):
             embed.add_field(name="서버 가입일", value=member.joined_at.astimezone(KST).strftime("%Y-%m-%d %H:%M"), inline=True)
         embed.set_thumbnail(url=member.display_avatar.url)
         await self.send_log(member.guild, embed)
+    async def _start_burst(self, guild: discord.Guild) -> None:
+        """집계 모드 시작 알림 후 주기 요약 작업 실행"""
+        detector = self.join_bursts
+        embed = discord.Embed(
+            title="🚨 입장 급증 감지",
+            description=(
+                f"{detector.window:.0f}초 동안 {detector.threshold}명 이상 입장했습니다.\n"
+                f"입장/퇴장 로그를 {JOIN_BURST_SUMMARY_INTERVAL:.0f}초마다 요약해서 보냅니다."
+            ),
+            color=COLORS["ERROR"],
+            timestamp=datetime.now(KST)
+        )
+        await self.send_log(guild, embed)
+        task = self._burst_tasks.get(guild.id)
+        if task is None or task.done():
+            self._burst_tasks[guild.id] = asyncio.create_task(self._burst_summary_loop(guild))
+    async def _burst_summary_loop(self, guild: discord.Guild) -> None:
+        """집계 모드 동안 주기적으로 요약 로그 전송"""
+        try:
+            while True:
+                await asyncio.sleep(JOIN_BURST_SUMMARY_INTERVAL)
+                summary = self.join_bursts.take_summary(guild.id)
+                if summary is None:
+                    return
+                if summary.joins or summary.leaves or summary.final:
+                    embed, file = _burst_summary_log(summary)
+                    await self.send_log(guild, embed, file)
+                if summary.final:
+                    return
+        except Exception as e:
+            logger.error(f"입장 급증 요약 실패: {guild.id} - {e}")
+        finally:
+            if self._burst_tasks.get(guild.id) is asyncio.current_task():
+                del self._burst_tasks[guild.id]
+    @commands.Cog.listener()
+    async def on_raw_audit_log_entry(self, payload: discord.RawAuditLogEntryEvent) -> None:
+        """메시지 삭제 감사 로그를 캐시에 기록 (일괄 삭제는 대상이 채널)"""
+        if not payload.user_id or not payload.target_id:
+            return
+        if payload.action_type == discord.AuditLogAction.message_bulk_delete:
+            # 일괄 삭제 이벤트 하나에 대응 (count는 지운 메시지 수)
+            self.bot.audit_log_cache.add(
+                payload.guild_id, payload.id, payload.target_id, payload.target_id, payload.user_id
+            )
+        elif payload.action_type == discord.AuditLogAction.message_delete and payload.extra:
+            self.bot.audit_log_cache.add(
+                payload.guild_id, payload.id, int(payload.extra["channel_id"]), payload.target_id,
+                payload.user_id, int(payload.extra.get("count", 1))
+            )
     @commands.Cog.listener()
-    async def on_message_delete(self, message: discord.Message) -> None:
-        """메시지 삭제 로그"""
+    async def on_message(self, message: discord.Message) -> None:
+        """삭제/수정 로그용으로 메시지 저장 (로그 채널이 설정된 서버만)"""
         if message.author.bot or not message.guild:
             return
-        deleter = None
+        if not await self.bot.data_manager.get_log_channel(message.guild.id):
+            self.bot.message_store.remove_guild(message.guild.id)
+            return
+        self.bot.message_store.add(message.guild.id, StoredMessage.from_message(message))
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild) -> None:
+        """나간 서버의 저장 메시지 정리"""
+        self.bot.message_store.remove_guild(guild.id)
+    async def _find_deleter(self, guild_id: int, channel_id: int, author_id: int) -> int | None:
+        """삭제자 ID (본인 삭제로 보이면 기다리지 않고 None)
+
+        본인이 지운 메시지는 감사 로그가 남지 않으므로, 이 채널/작성자에 대한 최근
+        감사 로그가 없으면 감사 로그 이벤트를 기다리지 않습니다.
+        """
+        cache = self.bot.audit_log_cache
+        if not cache.has_recent(guild_id, channel_id, author_id):
+            cache.skip(guild_id, channel_id, author_id)
+            return None
+        return await cache.wait_for(guild_id, channel_id, author_id)
+    @commands.Cog.listener()
+    async def on_raw_message_delete(self, payload: discord.RawMessageDeleteEvent) -> None:
+        """메시지 삭제 로그 (저장소 또는 py-cord 캐시에 남아 있는 메시지)"""
+        if not payload.guild_id:
+            return
+        record = self.bot.message_store.pop(payload.guild_id, payload.message_id)
+        if record is None and payload.cached_message and not payload.cached_message.author.bot:
+            record = StoredMessage.from_message(payload.cached_message)
+        guild = self.bot.get_guild(payload.guild_id)
+        if record is None or not guild:
+            return
+        # 삭제자를 기다리는 동안 뒤의 로그가 앞지르지 않도록 자리를 먼저 잡음
+        slot = await self.reserve_log(guild)
+        if slot is None:
+            return
         try:
-            async for entry in message.guild.audit_logs(limit=5, action=discord.AuditLogAction.message_delete):
-                if entry.target.id == message.author.id and (discord.utils.utcnow() - entry.created_at).total_seconds() < 3:
-                    deleter = entry.user
-                    break
-        except (discord.Forbidden, discord.HTTPException):
-            pass
-        if deleter and deleter.id != message.author.id:
+            deleter = None
+            deleter_id = await self._find_deleter(guild.id, record.channel_id, record.author_id)
+            if deleter_id:
+                deleter = guild.get_member(deleter_id) or self.bot.get_user(deleter_id)
+            author_mention = f"<@{record.author_id}>"
+            if deleter and deleter.id != record.author_id:
+                embed = discord.Embed(
+                    title="메시지 삭제 (관리자)",
+                    description=f"{author_mention}님의 메시지가 {deleter.mention}님에 의해 삭제되었습니다.",
+                    color=COLORS["ERROR"],
+                    timestamp=datetime.now(KST)
+                )
+                embed.add_field(name="작성자", value=f"{record.author_name} ({record.author_id})", inline=True)
+                embed.add_field(name="삭제자", value=f"{deleter} ({deleter.id})", inline=True)
+            else:
+                embed = discord.Embed(
+                    title="메시지 삭제",
+                    description=f"{author_mention}님의 메시지가 삭제되었습니다.",
+                    color=COLORS["WARNING"],
+                    timestamp=datetime.now(KST)
+                )
+                embed.add_field(name="작성자", value=f"{record.author_name} ({record.author_id})", inline=False)
+            embed.add_field(name="채널", value=f"<#{record.channel_id}>", inline=True)
+            content = record.content[:1000] if record.content else "_내용 없음_"
+            embed.add_field(name="삭제된 내용", value=content, inline=False)
+            if record.attachments:
+                attachments_info = "\n".join([f"[{filename}]({url})" for filename, url in record.attachments[:5]])
+                embed.add_field(name="첨부파일", value=attachments_info, inline=False)
+            embed.set_thumbnail(url=record.avatar_url)
+            await self.send_log(guild, embed, slot=slot)
+        finally:
+            await self.bot.log_dispatcher.cancel(slot)
+    @commands.Cog.listener()
+    async def on_raw_bulk_message_delete(self, payload: discord.RawBulkMessageDeleteEvent) -> None:
+        """메시지 일괄 삭제 로그 (요약 1개 + 삭제된 내용 파일)"""
+        guild = self.bot.get_guild(payload.guild_id) if payload.guild_id else None
+        if not guild:
+            return
+        cached = {message.id: message for message in payload.cached_messages if not message.author.bot}
+        records = []
+        for message_id in sorted(payload.message_ids):
+            record = self.bot.message_store.pop(guild.id, message_id)
+            if record is None and message_id in cached:
+                record = StoredMessage.from_message(cached[message_id])
+            if record:
+                records.append(record)
+        slot = await self.reserve_log(guild)
+        if slot is None:
+            return
+        try:
+            deleter = None
+            deleter_id = await self.bot.audit_log_cache.wait_for(guild.id, payload.channel_id, payload.channel_id)
+            if deleter_id:
+                deleter = guild.get_member(deleter_id) or self.bot.get_user(deleter_id)
             embed = discord.Embed(
-                title="메시지 삭제 (관리자)",
-                description=f"{message.author.mention}님의 메시지가 {deleter.mention}님에 의해 삭제되었습니다.",
+                title="메시지 일괄 삭제",
+                description=f"<#{payload.channel_id}>에서 메시지 {len(payload.message_ids)}개가 삭제되었습니다.",
                 color=COLORS["ERROR"],
                 timestamp=datetime.now(KST)
             )
-            embed.add_field(name="작성자", value=f"{message.author} ({message.author.id})", inline=True)
-            embed.add_field(name="삭제자", value=f"{deleter} ({deleter.id})", inline=True)
-        else:
-            embed = discord.Embed(
-                title="메시지 삭제",
-                description=f"{message.author.mention}님의 메시지가 삭제되었습니다.",
-                color=COLORS["WARNING"],
-                timestamp=datetime.now(KST)
-            )
-            embed.add_field(name="작성자", value=f"{message.author} ({message.author.id})", inline=False)
-        embed.add_field(name="채널", value=message.channel.mention, inline=True)
-        content = message.content[:1000] if message.content else "_내용 없음_"
-        embed.add_field(name="삭제된 내용", value=content, inline=False)
-        if message.attachments:
-            attachments_info = "\n".join([f"[{att.filename}]({att.url})" for att in message.attachments[:5]])
-            embed.add_field(name="첨부파일", value=attachments_info, inline=False)
-        embed.set_thumbnail(url=message.author.display_avatar.url)
-        await self.send_log(message.guild, embed)
+            if deleter:
+                embed.add_field(name="삭제자", value=f"{deleter} ({deleter.id})", inline=True)
+            embed.add_field(name="내용 확인", value=f"{len(records)}/{len(payload.message_ids)}개", inline=True)
+            authors = Counter((record.author_name, record.author_id) for record in records).most_common(5)
+            if authors:
+                embed.add_field(
+                    name="작성자",
+                    value="\n".join(f"{name} ({author_id}) - {count}개" for (name, author_id), count in authors),
+                    inline=False
+                )
+            file = _bulk_delete_file(payload.channel_id, records) if records else None
+            await self.send_log(guild, embed, file, slot=slot)
+        finally:
+            await self.bot.log_dispatcher.cancel(slot)
     @commands.Cog.listener()
-    async def on_message_edit(self, before: discord.Message, after: discord.Message) -> None:
-        """메시지 수정 로그"""
-        if before.author.bot or not before.guild:
+    async def on_raw_message_edit(self, payload: discord.RawMessageUpdateEvent) -> None:
+        """메시지 수정 로그 (저장소 또는 py-cord 캐시에 남아 있는 메시지)"""
+        # 링크 미리보기 등 내용 없는 수정 이벤트는 무시
+        if not payload.guild_id or "content" not in payload.data:
+            return
+        record = self.bot.message_store.get(payload.guild_id, payload.message_id)
+        if record is None and payload.cached_message and not payload.cached_message.author.bot:
+            record = StoredMessage.from_message(payload.cached_message)
+        guild = self.bot.get_guild(payload.guild_id)
+        if record is None or not guild:
             return
-        if before.content == after.content:
+        after = payload.new_message
+        if record.content == after.content:
             return
+        self.bot.message_store.update_content(guild.id, record.message_id, after.content)
         embed = discord.Embed(
             title="메시지 수정",
-            description=f"{before.author.mention}님이 메시지를 수정했습니다.",
+            description=f"<@{record.author_id}>님이 메시지를 수정했습니다.",
             color=COLORS["INFO"],
             timestamp=datetime.now(KST)
         )
-        embed.add_field(name="작성자", value=f"{before.author} ({before.author.id})", inline=False)
-        embed.add_field(name="채널", value=before.channel.mention, inline=True)
-        before_content = before.content[:1000] if before.content else "_내용 없음_"
+        embed.add_field(name="작성자", value=f"{record.author_name} ({record.author_id})", inline=False)
+        embed.add_field(name="채널", value=f"<#{record.channel_id}>", inline=True)
+        before_content = record.content[:1000] if record.content else "_내용 없음_"
         embed.add_field(name="수정 전", value=before_content, inline=False)
         after_content = after.content[:1000] if after.content else "_내용 없음_"
         embed.add_field(name="수정 후", value=after_content, inline=False)
-        embed.add_field(name="메시지 링크", value=f"[바로가기]({after.jump_url})", inline=False)
-        embed.set_thumbnail(url=before.author.display_avatar.url)
-        await self.send_log(before.guild, embed)
+        jump_url = f"https://discord.com/channels/{guild.id}/{record.channel_id}/{record.message_id}"
+        embed.add_field(name="메시지 링크", value=f"[바로가기]({jump_url})", inline=False)
+        embed.set_thumbnail(url=record.avatar_url)
+        await self.send_log(guild, embed)
+def _bulk_delete_file(channel_id: int, records: list[StoredMessage]) -> discord.File:
+    """삭제된 메시지를 임시 파일에 한 줄씩 기록해 첨부 파일로 변환"""
+    fp = tempfile.TemporaryFile()
+    for record in records:
+        sent_at = discord.utils.snowflake_time(record.message_id).astimezone(KST)
+        fp.write(f"[{sent_at:%Y-%m-%d %H:%M:%S}] {record.author_name} ({record.author_id}): {record.content}\n".encode())
+        for filename, url in record.attachments:
+            fp.write(f"    첨부: {filename} {url}\n".encode())
+    fp.seek(0)
+    return discord.File(fp, filename=f"deleted-{channel_id}-{datetime.now(KST):%Y%m%d-%H%M%S}.txt")
+def _burst_summary_log(summary: BurstSummary) -> tuple[discord.Embed, discord.File | None]:
+    """입장 급증 요약 embed와 ID 목록 파일"""
+    embed = discord.Embed(
+        title="입장 급증 종료" if summary.final else "입장 급증 요약",
+        description=f"{discord.utils.format_dt(summary.started_at, 'T')}부터 집계",
+        color=COLORS["SUCCESS"] if summary.final else COLORS["WARNING"],
+        timestamp=datetime.now(KST)
+    )
+    embed.add_field(name="입장", value=f"{len(summary.joins)}명", inline=True)
+    embed.add_field(name="퇴장", value=f"{len(summary.leaves)}명", inline=True)
+    if summary.joins:
+        histogram = summary.age_histogram()
+        peak = max(count for _, count in histogram) or 1
+        lines = [f"{label:<7}{count:>5}명 {'█' * round(count / peak * 10)}" for label, count in histogram]
+        embed.add_field(name="계정 나이", value="```\n" + "\n".join(lines) + "\n```", inline=False)
+    if not summary.joins and not summary.leaves:
+        return embed, None
+    fp = tempfile.TemporaryFile()
+    for user_id, name, created_at in summary.joins:
+        fp.write(f"입장\t{user_id}\t{name}\t{created_at.astimezone(KST):%Y-%m-%d %H:%M}\n".encode())
+    for user_id, name in summary.leaves:
+        fp.write(f"퇴장\t{user_id}\t{name}\n".encode())
+    fp.seek(0)
+    filename = f"joins-{summary.guild_id}-{datetime.now(KST):%Y%m%d-%H%M%S}.txt"
+    return embed, discord.File(fp, filename=filename)
 def setup(bot: discord.Bot):
     """명령어 로드"""
     bot.add_cog(EventLogger(bot))
@@ -21,10 +21,10 @@ class LogChannelCommand(commands.Cog):
         ctx: discord.ApplicationContext,
         채널: discord.TextChannel = Option(discord.TextChannel, description="로그를 보낼 채널", required=True)
     ):
-        guild_id = str(ctx.guild.id)
-        channel_id = str(채널.id)
-        success = await self.data_manager.set_log_channel(guild_id, channel_id)
+        success = await self.data_manager.set_log_channel(ctx.guild.id, 채널.id)
         if success:
+            # 이전 채널 문제로 재시도 대기 중인 로그를 새 채널로 바로 전송
+            self.bot.log_dispatcher.resume(ctx.guild.id)
             embed = discord.Embed(
                 title="로그 채널 설정 완료",
                 description=f"로그가 {채널.mention} 채널로 전송됩니다.",
@@ -22,12 +22,7 @@ class MemoCommand(commands.Cog):
         유저: discord.Member = Option(discord.Member, description="메모를 작성할 유저", required=True),
         메모: str = Option(str, description="작성할 메모 내용", required=True)
     ):
-        user_id = str(유저.id)
-        profile = await self.data_manager.get_profile(user_id)
-        if not profile:
-            await ctx.respond(f"{유저.mention}님은 등록된 프로필이 없습니다.", ephemeral=True)
-            return
-        success = await self.data_manager.set_admin_memo(user_id, 메모)
+        success = await self.data_manager.set_admin_memo(유저.id, 메모)
         if success:
             embed = discord.Embed(
                 title="메모 작성 완료",
@@ -39,7 +34,10 @@ class MemoCommand(commands.Cog):
             embed.set_footer(text=f"작성자: {ctx.author}")
             await ctx.respond(embed=embed, ephemeral=True)
         else:
-            await ctx.respond("메모 작성 중 오류가 발생했습니다.", ephemeral=True)
+            await ctx.respond(
+                f"{유저.mention}님의 메모를 작성하지 못했습니다. 등록된 프로필이 있는지 확인해주세요.",
+                ephemeral=True
+            )
 def setup(bot: discord.Bot):
     """명령어 로드"""
     bot.add_cog(MemoCommand(bot))
@@ -5,19 +5,37 @@ from discord import Option
 from discord.ext import commands
 import discord
 from datetime import datetime
-from utils.constants import COLORS, GENDER_ROLES, AGE_ROLES, get_age_category
+from utils.constants import COLORS, PROFILE_SEARCH_LIMIT
+from utils.role_service import sync_profile_roles
 from zoneinfo import ZoneInfo
 KST = ZoneInfo("Asia/Seoul")
 
 
+async def nickname_autocomplete(ctx: discord.AutocompleteContext) -> list[discord.OptionChoice]:
+    """닉네임 자동완성 (선택 값은 user_id)"""
+    data_manager = ctx.bot.data_manager
+    query = (ctx.value or "").strip()
+    if query:
+        results = await data_manager.search_profiles(query, nickname_only=True)
+    else:
+        results = await data_manager.get_profiles_page(PROFILE_SEARCH_LIMIT)
+    return [
+        discord.OptionChoice(name=result['display_name'][:100], value=str(result['user_id']))
+        for result in results
+    ]
+
+
 class ProfileListView(discord.ui.View):
-    """프로필 목록 페이지네이션 View"""
+    """프로필 목록 페이지네이션 View (현재 페이지만 조회)"""
     
-    def __init__(self, create_embed, total_pages: int):
+    def __init__(self, data_manager, total_count: int, items_per_page: int = 10):
         super().__init__(timeout=180)
-        self.create_embed = create_embed
-        self.total_pages = total_pages
+        self.data_manager = data_manager
+        self.total_count = total_count
+        self.items_per_page = items_per_page
+        self.total_pages = (total_count - 1) // items_per_page + 1
         self.current_page = 0
+        self.page_profiles: list[dict] = []
         self.update_buttons()
     
     def update_buttons(self):
@@ -27,29 +45,72 @@ class ProfileListView(discord.ui.View):
         self.next_button.disabled = self.current_page >= self.total_pages - 1
         self.last_button.disabled = self.current_page >= self.total_pages - 1
     
+    def page_key(self, index: int) -> tuple[str, int] | None:
+        """현재 페이지 행의 키셋 키"""
+        if not self.page_profiles:
+            return None
+        profile = self.page_profiles[index]
+        return profile['display_name'], profile['user_id']
+    
+    async def load_page(
+        self, page: int, key: tuple[str, int] | None = None, backward: bool = False
+    ) -> discord.Embed:
+        """페이지 조회 후 embed 생성"""
+        if page == self.total_pages - 1 and key is None:
+            # 마지막 페이지는 끝에서부터 남은 개수만큼 조회
+            limit = self.total_count - page * self.items_per_page
+        else:
+            limit = self.items_per_page
+        self.page_profiles = await self.data_manager.get_profiles_page(limit, key, backward)
+        self.current_page = page
+        self.update_buttons()
+        return self.create_embed()
+    
+    def create_embed(self) -> discord.Embed:
+        """현재 페이지 embed 생성"""
+        start_idx = self.current_page * self.items_per_page
+        embed = discord.Embed(
+            title="등록된 프로필 목록",
+            color=COLORS["INFO"],
+            timestamp=datetime.now(KST)
+        )
+        
+        profile_list = []
+        for i, profile in enumerate(self.page_profiles, start=start_idx + 1):
+            user_mention = f"<@{profile['user_id']}>"
+            display_name = profile['display_name']
+            profile_list.append(f"{i}. **{display_name}** - {user_mention}")
+        
+        embed.add_field(
+            name="유저 목록",
+            value="\n".join(profile_list) or "_없음_",
+            inline=False
+        )
+        
+        if self.total_pages > 1:
+            embed.set_footer(text=f"페이지 {self.current_page + 1}/{self.total_pages}")
+        
+        return embed
+    
     @discord.ui.button(label="<<", style=discord.ButtonStyle.primary)
     async def first_button(self, button: discord.ui.Button, interaction: discord.Interaction):
-        self.current_page = 0
-        self.update_buttons()
-        await interaction.response.edit_message(embed=self.create_embed(self.current_page), view=self)
+        embed = await self.load_page(0)
+        await interaction.response.edit_message(embed=embed, view=self)
     
     @discord.ui.button(label="<", style=discord.ButtonStyle.primary)
     async def prev_button(self, button: discord.ui.Button, interaction: discord.Interaction):
-        self.current_page -= 1
-        self.update_buttons()
-        await interaction.response.edit_message(embed=self.create_embed(self.current_page), view=self)
+        embed = await self.load_page(self.current_page - 1, self.page_key(0), backward=True)
+        await interaction.response.edit_message(embed=embed, view=self)
     
     @discord.ui.button(label=">", style=discord.ButtonStyle.primary)
     async def next_button(self, button: discord.ui.Button, interaction: discord.Interaction):
-        self.current_page += 1
-        self.update_buttons()
-        await interaction.response.edit_message(embed=self.create_embed(self.current_page), view=self)
+        embed = await self.load_page(self.current_page + 1, self.page_key(-1))
+        await interaction.response.edit_message(embed=embed, view=self)
     
     @discord.ui.button(label=">>", style=discord.ButtonStyle.primary)
     async def last_button(self, button: discord.ui.Button, interaction: discord.Interaction):
-        self.current_page = self.total_pages - 1
-        self.update_buttons()
-        await interaction.response.edit_message(embed=self.create_embed(self.current_page), view=self)
+        embed = await self.load_page(self.total_pages - 1, backward=True)
+        await interaction.response.edit_message(embed=embed, view=self)
 
 
 class ProfileCommands(commands.Cog):
@@ -72,9 +133,9 @@ class ProfileCommands(commands.Cog):
         if target_user.id != ctx.author.id and not ctx.author.guild_permissions.administrator:
             await ctx.respond("다른 유저의 프로필을 수정하려면 관리자 권한이 필요합니다.", ephemeral=True)
             return
-        user_id = str(target_user.id)
+        user_id = target_user.id
         username = str(target_user)
-        success = await self.data_manager.register_profile(
+        profile = await self.data_manager.register_profile(
             user_id=user_id,
             username=username,
             display_name=닉네임,
@@ -82,7 +143,7 @@ class ProfileCommands(commands.Cog):
             gender=성별,
             region=지역
         )
-        if success:
+        if profile:
             is_self = target_user.id == ctx.author.id
             title = "프로필 등록 완료" if is_self else f"{target_user.display_name}님의 프로필 등록 완료"
             embed = discord.Embed(
@@ -104,24 +165,10 @@ class ProfileCommands(commands.Cog):
                 member = guild.get_member(target_user.id)
                 
                 if member:
-                    roles_added = []
-                    
-                    # 성별에 따른 역할 지급
-                    if 성별 in GENDER_ROLES:
-                        gender_role_id = GENDER_ROLES[성별]
-                        gender_role = guild.get_role(gender_role_id)
-                        if gender_role and gender_role not in member.roles:
-                            await member.add_roles(gender_role)
-                            roles_added.append(gender_role.name)
-                    
-                    # 나이에 따른 역할 지급
-                    age_category = get_age_category(출생년도)
-                    age_role_id = AGE_ROLES.get(age_category)
-                    if age_role_id:
-                        age_role = guild.get_role(age_role_id)
-                        if age_role and age_role not in member.roles:
-                            await member.add_roles(age_role)
-                            roles_added.append(age_role.name)
+                    diff = await sync_profile_roles(
+                        self.bot, member, 성별, 출생년도, reason="프로필 등록"
+                    )
+                    roles_added = [role.name for role in diff.added]
                     
                     if roles_added:
                         embed.add_field(
@@ -141,78 +188,84 @@ class ProfileCommands(commands.Cog):
     @discord.slash_command(name="프로필목록", description="등록된 모든 유저의 프로필 목록을 조회합니다")
     async def list_profiles(self, ctx: discord.ApplicationContext) -> None:
         await ctx.defer()
-        profiles = await self.data_manager.get_all_profiles()
-        if not profiles:
+        total_count = await self.data_manager.count_profiles()
+        if not total_count:
             await ctx.respond("등록된 프로필이 없습니다.", ephemeral=True)
             return
-        items_per_page = 10
-        total_pages = (len(profiles) - 1) // items_per_page + 1
-        
-        def create_embed(page: int) -> discord.Embed:
-            start_idx = page * items_per_page
-            end_idx = min(start_idx + items_per_page, len(profiles))
-            page_profiles = profiles[start_idx:end_idx]
-            
-            embed = discord.Embed(
-                title="등록된 프로필 목록",
-                color=COLORS["INFO"],
-                timestamp=datetime.now(KST)
-            )
-            
-            profile_list = []
-            for i, profile in enumerate(page_profiles, start=start_idx + 1):
-                user_mention = f"<@{profile['user_id']}>"
-                display_name = profile['display_name']
-                profile_list.append(f"{i}. **{display_name}** - {user_mention}")
-            
-            embed.add_field(
-                name="유저 목록",
-                value="\n".join(profile_list),
-                inline=False
-            )
-            
-            if total_pages > 1:
-                embed.set_footer(text=f"페이지 {page + 1}/{total_pages}")
-            
-            return embed
+        view = ProfileListView(self.data_manager, total_count)
+        embed = await view.load_page(0)
         
-        if total_pages == 1:
-            await ctx.respond(embed=create_embed(0))
+        if view.total_pages == 1:
+            await ctx.respond(embed=embed)
         else:
-            view = ProfileListView(create_embed, total_pages)
-            await ctx.respond(embed=create_embed(0), view=view)
+            await ctx.respond(embed=embed, view=view)
+    @discord.slash_command(name="프로필검색", description="닉네임, 유저명, 지역으로 프로필을 검색합니다")
+    async def search_profiles(
+        self,
+        ctx: discord.ApplicationContext,
+        검색어: str = Option(str, description="검색어 (3글자 미만은 닉네임 앞부분으로 검색)", required=True)
+    ):
+        results = await self.data_manager.search_profiles(검색어)
+        if not results:
+            await ctx.respond(f"'{검색어}'에 해당하는 프로필이 없습니다.", ephemeral=True)
+            return
+        lines = [
+            f"{i}. **{result['display_name']}** - <@{result['user_id']}>"
+            + (f" ({result['region']})" if result['region'] else "")
+            for i, result in enumerate(results, start=1)
+        ]
+        embed = discord.Embed(
+            title=f"'{검색어}' 검색 결과",
+            description="\n".join(lines),
+            color=COLORS["INFO"],
+            timestamp=datetime.now(KST)
+        )
+        embed.set_footer(text=f"최대 {PROFILE_SEARCH_LIMIT}개까지 표시됩니다")
+        await ctx.respond(embed=embed)
+    async def _resolve_nickname(self, value: str) -> int | None:
+        """자동완성 값(user_id) 또는 입력한 닉네임을 user_id로 변환"""
+        if value.isdigit() and await self.data_manager.get_profile(int(value)):
+            return int(value)
+        results = await self.data_manager.search_profiles(value, limit=1, nickname_only=True)
+        return results[0]['user_id'] if results else None
     @discord.slash_command(name="정보", description="유저의 프로필 정보를 조회합니다")
     async def get_info(
         self,
         ctx: discord.ApplicationContext,
-        유저: discord.Member = Option(discord.Member, description="정보를 조회할 유저", required=False, default=None)
+        유저: discord.Member = Option(discord.Member, description="정보를 조회할 유저", required=False, default=None),
+        닉네임: str = Option(str, description="닉네임으로 찾기", required=False, default=None, autocomplete=nickname_autocomplete)
     ):
         target_user = 유저 if 유저 else ctx.author
-        user_id = str(target_user.id)
+        user_id = target_user.id
+        if 닉네임 and not 유저:
+            user_id = await self._resolve_nickname(닉네임)
+            if user_id is None:
+                await ctx.respond(f"'{닉네임}'에 해당하는 프로필이 없습니다.", ephemeral=True)
+                return
+            target_user = self.bot.get_user(user_id)
         profile = await self.data_manager.get_profile(user_id)
         if not profile:
-            await ctx.respond(f"{target_user.mention}님의 등록된 프로필이 없습니다.", ephemeral=True)
+            await ctx.respond(f"<@{user_id}>님의 등록된 프로필이 없습니다.", ephemeral=True)
             return
         embed = discord.Embed(
-            title=f"{profile['display_name']}님의 프로필",
+            title=f"{profile.display_name}님의 프로필",
             color=COLORS["INFO"],
             timestamp=datetime.now(KST)
         )
-        embed.set_thumbnail(url=target_user.display_avatar.url)
+        if target_user:
+            embed.set_thumbnail(url=target_user.display_avatar.url)
         embed.add_field(name="디스코드", value=f"<@{user_id}>", inline=False)
-        embed.add_field(name="닉네임", value=profile['display_name'], inline=True)
-        embed.add_field(name="출생년도", value=profile['birth_year'], inline=True)
-        embed.add_field(name="성별", value=profile['gender'], inline=True)
-        embed.add_field(name="지역", value=profile['region'], inline=True)
-        if ctx.author.guild_permissions.administrator:
-            admin_info = await self.data_manager.get_admin_info(user_id)
-            if admin_info:
-                embed.add_field(name="\u200b", value="**━━━ 관리자 전용 정보 ━━━**", inline=False)
-                embed.add_field(name="경고 횟수", value=f"{admin_info['warning_count']}회", inline=True)
-                memo = admin_info['admin_memo'] if admin_info['admin_memo'] else "없음"
-                embed.add_field(name="관리자 메모", value=memo, inline=False)
-        if profile.get('registered_at'):
-            registered_time = profile['registered_at'].split('T')[0]
+        embed.add_field(name="닉네임", value=profile.display_name, inline=True)
+        embed.add_field(name="출생년도", value=profile.birth_year, inline=True)
+        embed.add_field(name="성별", value=profile.gender, inline=True)
+        embed.add_field(name="지역", value=profile.region, inline=True)
+        if ctx.author.guild_permissions.administrator and profile.has_admin_info:
+            embed.add_field(name="\u200b", value="**━━━ 관리자 전용 정보 ━━━**", inline=False)
+            embed.add_field(name="경고 횟수", value=f"{profile.warning_count}회", inline=True)
+            memo = profile.admin_memo if profile.admin_memo else "없음"
+            embed.add_field(name="관리자 메모", value=memo, inline=False)
+        if profile.registered_at:
+            registered_time = profile.registered_at.split('T')[0]
             embed.set_footer(text=f"등록일: {registered_time}")
         await ctx.respond(embed=embed)
 def setup(bot: discord.Bot):
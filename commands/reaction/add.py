@@ -39,12 +39,20 @@ async def add_reaction(
         return
     
     reaction_id = await ctx.bot.data_manager.add_reaction_role(
+        ctx.guild.id,
         msg_id,
         ctx.channel.id,
         reaction,
         role.id
     )
     
+    if not reaction_id:
+        await ctx.respond(
+            "❌ 반응 역할 설정을 저장하지 못했습니다.",
+            ephemeral=True
+        )
+        return
+    
     embed = discord.Embed(
         title="✅ 반응 역할 설정 완료",
         description=(
@@ -12,7 +12,7 @@ from . import reaction_group
 )
 async def list_reactions(ctx: discord.ApplicationContext):
     """모든 반응설정 목록 조회"""
-    all_reactions = await ctx.bot.data_manager.get_all_reaction_roles()
+    all_reactions = await ctx.bot.data_manager.get_all_reaction_roles(ctx.guild.id)
     
     if not all_reactions:
         await ctx.respond("❌ 등록된 반응 역할 설정이 없습니다.", ephemeral=True)
@@ -0,0 +1,56 @@
+"""데이터베이스 백업 상태"""
+from __future__ import annotations
+import discord
+
+from utils.constants import COLORS
+from . import status_group
+
+
+def _format_size(size: int) -> str:
+    """바이트 크기를 읽기 쉬운 문자열로 변환"""
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.0f}{unit}" if unit == "B" else f"{size:.1f}{unit}"
+        size /= 1024
+    return f"{size:.1f}GB"
+
+
+@status_group.command(
+    name="백업",
+    description="데이터베이스 백업 상태를 확인합니다"
+)
+async def backup_status(
+    ctx: discord.ApplicationContext,
+    지금실행: bool = discord.Option(bool, description="지금 바로 백업합니다", default=False)
+):
+    """백업 상태 조회"""
+    backups = ctx.bot.data_manager.backups
+    
+    if 지금실행:
+        await ctx.defer(ephemeral=True)
+        if not await backups.backup_now():
+            await ctx.followup.send(f"❌ 백업에 실패했습니다: {backups.last_error}", ephemeral=True)
+            return
+    
+    embed = discord.Embed(title="💾 데이터베이스 백업", color=COLORS["INFO"])
+    
+    last = backups.last_backup
+    if last:
+        embed.add_field(name="마지막 백업", value=discord.utils.format_dt(last.created_at, "R"), inline=True)
+        embed.add_field(name="소요 시간", value=f"{last.duration:.2f}초", inline=True)
+        embed.add_field(name="크기", value=_format_size(last.size), inline=True)
+        embed.add_field(name="파일", value=f"`{last.path.name}`", inline=False)
+        embed.add_field(name="SHA-256", value=f"`{last.sha256[:16]}…`", inline=False)
+    else:
+        embed.description = "이번 실행에서 완료된 백업이 없습니다."
+    
+    if backups.next_run:
+        embed.add_field(name="다음 백업", value=discord.utils.format_dt(backups.next_run, "R"), inline=True)
+    embed.add_field(name="보관 중", value=f"{len(backups.list_backups())}/{backups.retention}개", inline=True)
+    if backups.running:
+        embed.add_field(name="진행 중", value="백업이 진행 중입니다", inline=True)
+    if backups.last_error:
+        embed.color = COLORS["WARNING"]
+        embed.add_field(name="마지막 오류", value=backups.last_error[:1024], inline=False)
+    
+    await ctx.respond(embed=embed, ephemeral=True)
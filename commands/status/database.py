@@ -0,0 +1,82 @@
+"""데이터베이스 쿼리 통계"""
+from __future__ import annotations
+import discord
+
+from utils.constants import COLORS
+from utils.metrics import format_ms
+from . import status_group
+
+
+@status_group.command(
+    name="db",
+    description="데이터베이스 메서드별 지연 시간과 느린 쿼리를 확인합니다"
+)
+async def database_status(
+    ctx: discord.ApplicationContext,
+    초기화: bool = discord.Option(bool, description="조회 후 통계를 초기화합니다", default=False)
+):
+    """DB 통계 조회"""
+    data_manager = ctx.bot.data_manager
+    metrics = data_manager.metrics
+    rows = metrics.summary()
+    
+    embed = discord.Embed(
+        title="🗄️ 데이터베이스 통계",
+        description=f"{discord.utils.format_dt(metrics.started_at, 'R')}부터 집계",
+        color=COLORS["INFO"]
+    )
+    
+    if rows:
+        lines = [f"{'메서드':<24}{'호출':>7}{'오류':>5}{'p50':>9}{'p99':>9}"]
+        for row in rows[:15]:
+            lines.append(
+                f"{row['name'][:23]:<24}{row['calls']:>7}{row['errors']:>5}"
+                f"{format_ms(row['p50']):>9}{format_ms(row['p99']):>9}"
+            )
+        embed.add_field(name="메서드별 지연 시간", value="```\n" + "\n".join(lines) + "\n```", inline=False)
+        if any(row['errors'] for row in rows):
+            embed.color = COLORS["WARNING"]
+    
+    statements = metrics.statements
+    embed.add_field(
+        name="SQL 문",
+        value=(
+            f"{statements.count}회 · p50 {format_ms(statements.percentile(0.5))}"
+            f" · p99 {format_ms(statements.percentile(0.99))} · 최대 {format_ms(statements.max)}"
+        ),
+        inline=False
+    )
+    
+    slow_lines = [
+        f"`{format_ms(entry.elapsed_ms)}` {discord.utils.format_dt(entry.at, 'R')} `{entry.sql[:120]}`"
+        for entry in list(metrics.recent_slow)[-3:]
+    ]
+    embed.add_field(
+        name=f"느린 쿼리 ({metrics.slow_threshold_ms:.0f}ms 이상): {metrics.slow_count}건",
+        value="\n".join(slow_lines)[:1024] or "없음",
+        inline=False
+    )
+    
+    cache = data_manager.profile_cache.stats()
+    embed.add_field(
+        name="프로필 캐시",
+        value=(
+            f"{cache['size']}/{cache['maxsize']} · 적중률 {cache['hit_rate']:.0%}\n"
+            f"적중 {cache['hits']} · 미스 {cache['misses']} · 축출 {cache['evictions']}"
+        ),
+        inline=True
+    )
+    
+    queue = data_manager.write_queue
+    if queue:
+        embed.add_field(
+            name="쓰기 큐",
+            value=f"대기 {queue.pending} · 배치 {queue.batches} · 쓰기 {queue.writes}",
+            inline=True
+        )
+    
+    if 초기화:
+        metrics.reset()
+        embed.set_footer(text="통계를 초기화했습니다")
+    
+    await ctx.respond(embed=embed, ephemeral=True)
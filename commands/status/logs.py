@@ -0,0 +1,76 @@
+"""로그 전송 대기열 상태"""
+from __future__ import annotations
+import discord
+
+from utils.constants import COLORS
+from . import status_group
+
+
+@status_group.command(
+    name="로그",
+    description="로그 채널 전송 대기열 상태를 확인합니다"
+)
+async def log_status(ctx: discord.ApplicationContext):
+    """로그 대기열/전송 통계 조회"""
+    dispatcher = ctx.bot.log_dispatcher
+    guild_stats = dispatcher.stats(ctx.guild.id)
+    total = dispatcher.stats()
+
+    embed = discord.Embed(title="📨 로그 전송", color=COLORS["INFO"])
+    for title, stats in (("이 서버", guild_stats), (f"전체 ({total['guilds']}개 서버)", total)):
+        average = stats["sent_embeds"] / stats["sent_messages"] if stats["sent_messages"] else 0
+        embed.add_field(
+            name=title,
+            value=(
+                f"대기 중: {stats['queued']}개 · 삭제자 확인 중: {stats['reserved']}개\n"
+                f"전송: {stats['sent_embeds']}개 / 메시지 {stats['sent_messages']}개 (평균 {average:.1f}개)\n"
+                f"버림: {stats['dropped']}개 · 실패: {stats['failed']}개 · 재시도: {stats['retries']}회"
+            ),
+            inline=False
+        )
+    if guild_stats["retry_in"] is not None:
+        embed.add_field(
+            name="⚠️ 전송 재시도 대기",
+            value=f"{guild_stats['retry_in']:.0f}초 후 재시도 · 원인: {guild_stats['last_error']}"[:1024],
+            inline=False
+        )
+    embed.add_field(
+        name="로그 스풀",
+        value=f"{total['spool_bytes'] / 1024 / 1024:.1f}MB · 용량 초과로 삭제 {dispatcher.spool.evicted}개",
+        inline=False
+    )
+    audit = ctx.bot.audit_log_cache.stats()
+    embed.add_field(
+        name="삭제자 확인 (감사 로그 캐시)",
+        value=(
+            f"항목: {audit['entries']}개 · 대기 중: {audit['pending']}개\n"
+            f"캐시 적중: {audit['hits']} · 이벤트 대기 후 확인: {audit['waited']} · 없음: {audit['misses']}"
+        ),
+        inline=False
+    )
+    event_logger = ctx.bot.get_cog("EventLogger")
+    if event_logger:
+        bursts = event_logger.join_bursts
+        embed.add_field(
+            name="입장 급증 집계",
+            value=(
+                f"{'🚨 집계 중' if bursts.is_active(ctx.guild.id) else '평상시'} · "
+                f"기준 {bursts.window:.0f}초 {bursts.threshold}명 · 감지 {bursts.bursts}회 (전체 서버)"
+            ),
+            inline=False
+        )
+    store = ctx.bot.message_store.stats(ctx.guild.id)
+    embed.add_field(
+        name="메시지 저장소 (이 서버)",
+        value=(
+            f"메시지: {store['messages']}개 · 메모리: {store['bytes'] / 1024 / 1024:.1f}/"
+            f"{store['budget'] / 1024 / 1024:.0f}MB (전체 {store['total_bytes'] / 1024 / 1024:.1f}/"
+            f"{store['total_budget'] / 1024 / 1024:.0f}MB)\n"
+            f"제거: {store['evictions']}개 (시간당 {store['evictions_per_hour']:.0f}개)"
+        ),
+        inline=False
+    )
+    if guild_stats["dropped"] or guild_stats["failed"] or guild_stats["retry_in"] is not None:
+        embed.color = COLORS["WARNING"]
+
+    await ctx.respond(embed=embed, ephemeral=True)
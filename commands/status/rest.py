@@ -0,0 +1,58 @@
+"""REST 요청 스케줄러 상태"""
+from __future__ import annotations
+import discord
+
+from utils.constants import COLORS
+from utils.metrics import format_ms
+from utils.rest_scheduler import Priority
+from . import status_group
+
+
+@status_group.command(
+    name="rest",
+    description="Discord API 요청 대기 시간을 우선순위/버킷별로 확인합니다"
+)
+async def rest_status(
+    ctx: discord.ApplicationContext,
+    초기화: bool = discord.Option(bool, description="조회 후 통계를 초기화합니다", default=False)
+):
+    """REST 스케줄러 통계 조회"""
+    scheduler = ctx.bot.rest_scheduler
+
+    embed = discord.Embed(
+        title="📡 REST 요청",
+        description=(
+            f"{discord.utils.format_dt(scheduler.started_at, 'R')}부터 집계\n"
+            f"실행 중 {scheduler.active}/{scheduler.max_concurrency} · "
+            f"대기 중 {scheduler.waiting()} (백그라운드 상한 {scheduler.background_limit}, 버킷당 {scheduler.bucket_limit}, 유지보수 {scheduler.maintenance_limit})"
+        ),
+        color=COLORS["INFO"]
+    )
+
+    names = {Priority.INTERACTIVE: "사용자 응답", Priority.BACKGROUND: "백그라운드", Priority.MAINTENANCE: "유지보수"}
+    for priority, stats in scheduler.priorities.items():
+        embed.add_field(
+            name=names[priority],
+            value=(
+                f"{stats.call.count}회 · 오류 {stats.errors} · 대기 {scheduler.waiting(priority)}\n"
+                f"대기 p50 {format_ms(stats.wait.percentile(0.5))} · p99 {format_ms(stats.wait.percentile(0.99))}\n"
+                f"요청 p99 {format_ms(stats.call.percentile(0.99))}"
+            ),
+            inline=True
+        )
+
+    rows = scheduler.summary()
+    if rows:
+        lines = [f"{'버킷':<24}{'호출':>6}{'대기p50':>9}{'대기p99':>9}{'요청p99':>9}"]
+        for row in rows[:10]:
+            lines.append(
+                f"{row['bucket'][:23]:<24}{row['calls']:>6}{format_ms(row['wait_p50']):>9}"
+                f"{format_ms(row['wait_p99']):>9}{format_ms(row['call_p99']):>9}"
+            )
+        embed.add_field(name="버킷별 (대기 p99 순)", value="```\n" + "\n".join(lines) + "\n```", inline=False)
+
+    if 초기화:
+        scheduler.reset()
+        embed.set_footer(text="통계를 초기화했습니다")
+
+    await ctx.respond(embed=embed, ephemeral=True)
@@ -0,0 +1,64 @@
+"""역할 인증 처리 상태"""
+from __future__ import annotations
+import discord
+
+from utils.constants import COLORS
+from . import status_group
+
+
+@status_group.command(
+    name="인증",
+    description="역할 반응 인증 처리 상태를 확인합니다"
+)
+async def verification_status(ctx: discord.ApplicationContext):
+    """반응 이벤트 병합/억제 통계 조회"""
+    debouncer = ctx.bot.reaction_debouncer
+    counters = debouncer.counters
+
+    embed = discord.Embed(
+        title="🔐 역할 인증",
+        description=(
+            f"같은 유저/메시지의 반응은 {debouncer.window:.1f}초 동안 모아서 처리하고, "
+            f"안내 DM은 {debouncer.cooldown:.0f}초에 한 번만 보냅니다."
+        ),
+        color=COLORS["INFO"]
+    )
+    embed.add_field(
+        name="반응 이벤트",
+        value=(
+            f"받음 {counters['received']} · 처리 대기 {debouncer.pending}\n"
+            f"안내 전송 {counters['added']} · 역할 회수 {counters['removed']} · 오류 {counters['errors']}"
+        ),
+        inline=False
+    )
+    suppressed = counters["coalesced"] + counters["cancelled"] + counters["suppressed"]
+    embed.add_field(
+        name=f"생략된 처리: {suppressed}",
+        value=(
+            f"병합 {counters['coalesced']} · 추가/제거 상쇄 {counters['cancelled']} · "
+            f"쿨다운 {counters['suppressed']}"
+        ),
+        inline=False
+    )
+
+    reconciler = ctx.bot.reaction_reconciler
+    counters = reconciler.counters
+    if reconciler.started_at is None:
+        state = "대기 중" if reconciler.running else "실행 안 함"
+    elif reconciler.finished_at is None:
+        state = f"진행 중 ({counters['scanned']}/{counters['reactions']}) · {discord.utils.format_dt(reconciler.started_at, 'R')} 시작"
+    else:
+        state = f"{discord.utils.format_dt(reconciler.finished_at, 'R')} 완료"
+    stale = f"반응 없이 역할만 보유 {counters['stale']}"
+    stale += f" · 회수 {counters['revoked']}" if reconciler.revoke else " (회수 안 함)"
+    value = (
+        f"{state}\n"
+        f"반응한 유저 {counters['reactors']} · 지급 {counters['granted']} · 미인증 {counters['unverified']}\n"
+        f"{stale}\n"
+        f"건너뛴 반응 {counters['skipped']} · 오류 {counters['errors']}"
+    )
+    if reconciler.last_error:
+        value += f"\n마지막 오류: `{reconciler.last_error[:200]}`"
+    embed.add_field(name="시작 시 반응 동기화", value=value, inline=False)
+
+    await ctx.respond(embed=embed, ephemeral=True)
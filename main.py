@@ -1,14 +1,22 @@
 """Stack Bot - 사용자 프로필 및 서버 관리 봇"""
 from __future__ import annotations
 import asyncio
+import functools
 import os
 
 import discord
 from dotenv import load_dotenv
 
 from utils.extension_loader import ExtensionLoader
+from utils.audit_log_cache import AuditLogCache
 from utils.data_manager import DataManager
-from utils.constants import DEFAULT_ACTIVITY_NAME, COLORS, GENDER_ROLES, AGE_ROLES, get_age_category
+from utils.log_dispatcher import LogDispatcher
+from utils.message_store import MessageStore
+from utils.reaction_debouncer import ReactionDebouncer
+from utils.reaction_reconciler import ReactionReconciler
+from utils.rest_scheduler import Priority, RestScheduler
+from utils.role_service import sync_profile_roles
+from utils.constants import DEFAULT_ACTIVITY_NAME, COLORS
 from utils.graceful_shutdown import setup_graceful_shutdown, register_shutdown_callback
 from utils.logging_config import configure_logging
 
@@ -19,22 +27,37 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+VERIFY_CUSTOM_ID_PREFIX = "stack:verify:"
+
+
+def parse_verify_custom_id(custom_id: str | None) -> tuple[int, int] | None:
+    """인증 버튼 custom_id → (서버 ID, 역할 ID)"""
+    if not custom_id or not custom_id.startswith(VERIFY_CUSTOM_ID_PREFIX):
+        return None
+    try:
+        guild_id, role_id = custom_id[len(VERIFY_CUSTOM_ID_PREFIX):].split(":")
+        return int(guild_id), int(role_id)
+    except ValueError:
+        return None
+
+
 class AuthenticationView(discord.ui.View):
-    """인증 버튼 View"""
+    """인증 버튼 View
 
-    def __init__(self, bot: discord.Bot, guild_id: int, role_id: int) -> None:
-        super().__init__(timeout=300)
-        self.bot = bot
-        self.guild_id = guild_id
-        self.role_id = role_id
+    서버/역할 ID는 버튼 custom_id에 담고 View는 보관하지 않습니다(store=False).
+    클릭은 StackBot.on_interaction이 custom_id로 처리하므로 재시작이나 시간이
+    지나도 버튼이 동작하고, 보낸 안내 수만큼 메모리가 늘지 않습니다.
+    """
 
-    @discord.ui.button(label="프로필 입력", style=discord.ButtonStyle.primary)
-    async def authenticate(
-        self, button: discord.ui.Button, interaction: discord.Interaction
-    ) -> None:
-        """프로필 입력 모달 표시"""
-        modal = AuthenticationModal(self.bot, self.guild_id, self.role_id)
-        await interaction.response.send_modal(modal)
+    def __init__(self, guild_id: int, role_id: int) -> None:
+        super().__init__(timeout=None, store=False)
+        self.add_item(
+            discord.ui.Button(
+                label="프로필 입력",
+                style=discord.ButtonStyle.primary,
+                custom_id=f"{VERIFY_CUSTOM_ID_PREFIX}{guild_id}:{role_id}"
+            )
+        )
 
 
 class AuthenticationModal(discord.ui.Modal):
@@ -86,18 +109,18 @@ class AuthenticationModal(discord.ui.Modal):
         """모달 제출 시 역할 지급"""
         await interaction.response.defer(ephemeral=True)
 
-        user_id = str(interaction.user.id)
+        user_id = interaction.user.id
         username = self.children[0].value.strip()
         birth_year = self.children[1].value.strip()
         gender = self.children[2].value.strip()
         region = self.children[3].value.strip()
 
         try:
-            success = await self.bot.data_manager.register_profile(
+            profile = await self.bot.data_manager.register_profile(
                 user_id, username, username, birth_year, gender, region
             )
 
-            if not success:
+            if not profile:
                 await interaction.followup.send(
                     embed=discord.Embed(
                         description="프로필 등록에 실패했습니다.",
@@ -140,23 +163,11 @@ class AuthenticationModal(discord.ui.Modal):
                 )
                 return
 
-            if role not in member.roles:
-                await member.add_roles(role)
-
-            # 성별에 따른 역할 지급
-            gender_role_id = GENDER_ROLES.get(gender)
-            if gender_role_id:
-                gender_role = guild.get_role(gender_role_id)
-                if gender_role and gender_role not in member.roles:
-                    await member.add_roles(gender_role)
-
-            # 나이에 따른 역할 지급
-            age_category = get_age_category(birth_year)
-            age_role_id = AGE_ROLES.get(age_category)
-            if age_role_id:
-                age_role = guild.get_role(age_role_id)
-                if age_role and age_role not in member.roles:
-                    await member.add_roles(age_role)
+            # 인증 역할 + 성별/나이 역할 중 없는 것만 지급
+            await sync_profile_roles(
+                self.bot, member, gender, birth_year,
+                extra_role_ids=(role.id,), reason="역할 인증"
+            )
 
             await interaction.followup.send(
                 embed=discord.Embed(
@@ -194,10 +205,17 @@ class StackBot(discord.Bot):
         intents.members = True
         intents.guilds = True
         intents.reactions = True
+        intents.moderation = True  # 감사 로그 이벤트 (메시지 삭제자 확인)
 
         super().__init__(intents=intents)
 
         self.data_manager = DataManager(self)
+        self.log_dispatcher = LogDispatcher(self)
+        self.audit_log_cache = AuditLogCache()
+        self.message_store = MessageStore()
+        self.rest_scheduler = RestScheduler()
+        self.reaction_debouncer = ReactionDebouncer()
+        self.reaction_reconciler = ReactionReconciler(self)
         self.extension_loader = ExtensionLoader(self)
         self._initialized = False
 
@@ -209,6 +227,9 @@ class StackBot(discord.Bot):
         try:
             # 데이터베이스 초기화
             await self.data_manager.init_db()
+
+            # 로그 스풀 열기 (이전 실행에서 못 보낸 로그 재전송)
+            await self.log_dispatcher.start()
             
             # 명령어 로드
             self.extension_loader.load_all_extensions("commands")
@@ -223,6 +244,9 @@ class StackBot(discord.Bot):
             
             self._initialized = True
             print(f"[{self.user.name}] 준비 완료")
+
+            # 오프라인 동안 놓친 반응을 역할에 반영
+            self.reaction_reconciler.start()
             
         except Exception as e:
             logger.error(f"봇 초기화 실패: {e}", exc_info=e)
@@ -254,22 +278,60 @@ class StackBot(discord.Bot):
 
     async def close(self) -> None:
         """봇 종료 처리"""
+        # 남은 로그는 연결이 살아 있을 때 전송
+        await self.reaction_reconciler.close()
+        await self.reaction_debouncer.close()
+        await self.log_dispatcher.close()
         await super().close()
+        await self.data_manager.close()
+
+    async def on_interaction(self, interaction: discord.Interaction) -> None:
+        """인증 버튼은 custom_id로 바로 처리, 나머지는 명령어 처리"""
+        if interaction.type is discord.InteractionType.component:
+            route = parse_verify_custom_id(interaction.custom_id)
+            if route:
+                await self._open_verification_modal(interaction, *route)
+                return
+        await super().on_interaction(interaction)
+
+    async def _open_verification_modal(self, interaction: discord.Interaction, guild_id: int, role_id: int) -> None:
+        """인증 프로필 입력 모달 표시 (버튼의 서버/역할이 현재 반응 역할 설정과 다르면 안내)
+
+        custom_id는 누구나 만들 수 있으므로, 그 서버의 반응 역할 설정에 있고
+        서버에 실제로 있는 역할일 때만 모달을 엽니다.
+        """
+        guild = self.get_guild(guild_id)
+        if (
+            guild is None
+            or guild.get_role(role_id) is None
+            or not await self.data_manager.is_reaction_role(guild_id, role_id)
+        ):
+            await interaction.response.send_message(
+                embed=discord.Embed(
+                    description="더 이상 유효하지 않은 인증 요청입니다. 역할 메시지에 다시 반응해주세요.",
+                    color=COLORS["ERROR"]
+                ),
+                ephemeral=True
+            )
+            return
+        await interaction.response.send_modal(AuthenticationModal(self, guild_id, role_id))
 
     async def on_raw_reaction_add(self, payload: discord.RawReactionActionEvent) -> None:
-        """이모지 추가 시 프로필 입력 모달 표시"""
+        """이모지 추가 시 인증 안내 DM 예약 (연속 반응은 한 번으로 병합)"""
         if payload.user_id == self.user.id:
             return
 
-        if not await self.data_manager.is_reaction_message(payload.message_id):
-            return
-
-        emoji = str(payload.emoji)
-        role_id = await self.data_manager.get_role_for_reaction(payload.message_id, emoji)
-
+        role_id = self.data_manager.get_role_for_reaction(payload.message_id, str(payload.emoji))
         if not role_id:
             return
 
+        self.reaction_debouncer.submit(
+            (payload.user_id, payload.message_id, role_id), True,
+            functools.partial(self._send_verification_prompt, payload, role_id)
+        )
+
+    async def _send_verification_prompt(self, payload: discord.RawReactionActionEvent, role_id: int) -> None:
+        """인증 안내 DM 전송"""
         try:
             # 캐시에서 먼저 찾기, 없으면 API에서 조회
             user = self.get_user(payload.user_id)
@@ -284,8 +346,8 @@ class StackBot(discord.Bot):
                 description="인증을 진행하려면 아래 버튼을 클릭하여 프로필 정보를 입력해주세요.",
                 color=COLORS["INFO"]
             )
-            view = AuthenticationView(self, payload.guild_id, role_id)
-            await user.send(embed=embed, view=view)
+            view = AuthenticationView(payload.guild_id, role_id)
+            await self.rest_scheduler.submit(Priority.INTERACTIVE, "dm", user.send, embed=embed, view=view)
         except discord.Forbidden:
             logger.warning(f"DM 전송 실패 (권한 부족): {payload.user_id} - 사용자가 DM을 차단했을 수 있습니다.")
         except discord.HTTPException as e:
@@ -294,19 +356,21 @@ class StackBot(discord.Bot):
             logger.error(f"DM 전송 실패: {payload.user_id} - {type(e).__name__}: {e}")
 
     async def on_raw_reaction_remove(self, payload: discord.RawReactionActionEvent) -> None:
-        """이모지 제거 시 역할 회수"""
+        """이모지 제거 시 역할 회수 예약 (직전 추가와 짝이면 상쇄)"""
         if payload.user_id == self.user.id:
             return
 
-        if not await self.data_manager.is_reaction_message(payload.message_id):
-            return
-
-        emoji = str(payload.emoji)
-        role_id = await self.data_manager.get_role_for_reaction(payload.message_id, emoji)
-
+        role_id = self.data_manager.get_role_for_reaction(payload.message_id, str(payload.emoji))
         if not role_id:
             return
 
+        self.reaction_debouncer.submit(
+            (payload.user_id, payload.message_id, role_id), False,
+            functools.partial(self._revoke_reaction_role, payload, role_id)
+        )
+
+    async def _revoke_reaction_role(self, payload: discord.RawReactionActionEvent, role_id: int) -> None:
+        """반응 역할 회수"""
         try:
             guild = self.get_guild(payload.guild_id)
             if not guild:
@@ -322,7 +386,9 @@ class StackBot(discord.Bot):
                 return
 
             if role in member.roles:
-                await member.remove_roles(role)
+                await self.rest_scheduler.submit(
+                    Priority.INTERACTIVE, f"member:{guild.id}", member.remove_roles, role
+                )
         except discord.Forbidden:
             logger.error(f"역할 회수 권한 없음: {role_id}")
         except Exception as e:
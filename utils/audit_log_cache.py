@@ -0,0 +1,168 @@
+"""최근 메시지 삭제 감사 로그 캐시 (게이트웨이 이벤트 기반)"""
+from __future__ import annotations
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any
+
+from .constants import AUDIT_LOG_CACHE_SIZE, AUDIT_LOG_CACHE_TTL, AUDIT_LOG_WAIT
+
+__all__ = ["AuditLogCache"]
+
+# (guild_id, channel_id, target_id)
+_WaitKey = tuple[int, int, int]
+
+
+class _Entry:
+    __slots__ = ("channel_id", "target_id", "user_id", "count", "remaining", "seen_at")
+
+    def __init__(self, channel_id: int, target_id: int, user_id: int, count: int):
+        self.channel_id = channel_id
+        self.target_id = target_id
+        self.user_id = user_id
+        self.count = count  # 감사 로그 항목의 삭제 수 (extra.count)
+        self.remaining = count  # 아직 삭제 이벤트와 짝지어지지 않은 수
+        self.seen_at = time.monotonic()
+
+
+class AuditLogCache:
+    """서버별 최근 message_delete 감사 로그 (항목 ID → 채널, 작성자, 삭제자, 남은 수)
+
+    on_raw_audit_log_entry로 채워지므로 삭제자 확인에 REST 호출이 필요 없습니다.
+    항목 하나는 extra.count만큼의 삭제 이벤트와만 짝지어지고(삭제 하나에 1씩
+    소비), 같은 항목 ID가 더 큰 count로 다시 오면 늘어난 만큼만 더합니다.
+    count를 다 쓴 항목은 삭제자로 쓰지 않으므로, 관리자가 지운 뒤 작성자가 직접
+    지운 메시지를 관리자 삭제로 기록하지 않습니다. 항목은 Discord가 연속 삭제를
+    한 항목으로 묶는 시간(TTL) 동안 남겨 둡니다. 삭제 이벤트가 감사 로그
+    이벤트보다 먼저 도착할 수 있어 wait_for는 잠시 기다립니다. 최근 항목이 없어
+    기다리지 않은 삭제(skip)는 뒤늦게 온 항목이 대신 소비합니다. 일괄 삭제는
+    대상을 채널로 기록합니다.
+    """
+
+    def __init__(self, ttl: float = AUDIT_LOG_CACHE_TTL, maxsize: int = AUDIT_LOG_CACHE_SIZE):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._guilds: dict[int, OrderedDict[int, _Entry]] = {}
+        self._waiters: dict[_WaitKey, list[asyncio.Future]] = {}
+        self._unmatched: dict[_WaitKey, list[float]] = {}  # 기다리지 않고 본인 삭제로 처리한 시각
+        self.hits = 0
+        self.misses = 0
+        self.waited = 0
+
+    def add(
+        self, guild_id: int, entry_id: int, channel_id: int, target_id: int, user_id: int, count: int = 1
+    ) -> None:
+        """감사 로그 항목 기록 (같은 항목 ID는 늘어난 count만큼 추가)"""
+        entries = self._guilds.setdefault(guild_id, OrderedDict())
+        entry = entries.get(entry_id)
+        if entry is None:
+            entry = entries[entry_id] = _Entry(channel_id, target_id, user_id, max(1, count))
+        else:
+            if count > entry.count:
+                entry.remaining += count - entry.count
+                entry.count = count
+            entry.seen_at = time.monotonic()
+            entries.move_to_end(entry_id)
+
+        # 먼저 도착해 기다리던 삭제 이벤트에 남은 수만큼 배정
+        key = (guild_id, channel_id, target_id)
+        waiters = self._waiters.get(key)
+        while waiters and entry.remaining:
+            future = waiters.pop(0)
+            if not future.done():
+                future.set_result(user_id)
+                entry.remaining -= 1
+        if waiters == []:
+            del self._waiters[key]
+        # 기다리지 않고 넘긴 삭제 뒤에 늦게 온 항목은 그 삭제 몫을 소비 (뒤의 본인 삭제에 쓰지 않음)
+        unmatched = self._unmatched.pop(key, None)
+        if unmatched:
+            deadline = time.monotonic() - AUDIT_LOG_WAIT
+            late = sum(1 for at in unmatched if at >= deadline)
+            entry.remaining = max(0, entry.remaining - late)
+        self._prune(entries)
+
+    def take(self, guild_id: int, channel_id: int, target_id: int) -> int | None:
+        """캐시에서 삭제자 ID를 꺼냄 (항목의 남은 수를 하나 소비)"""
+        entries = self._guilds.get(guild_id)
+        if not entries:
+            return None
+        self._prune(entries)
+        # 다 소비한 항목도 TTL 동안 남겨 두어, 같은 항목 ID가 다시 오면 늘어난 수만 더함
+        for entry in entries.values():
+            if entry.remaining and entry.channel_id == channel_id and entry.target_id == target_id:
+                entry.remaining -= 1
+                return entry.user_id
+        return None
+
+    def has_recent(self, guild_id: int, channel_id: int, target_id: int) -> bool:
+        """해당 채널/대상의 감사 로그 항목이 TTL 안에 있었는지 (다 쓴 항목 포함)"""
+        entries = self._guilds.get(guild_id)
+        if not entries:
+            return False
+        self._prune(entries)
+        return any(
+            entry.channel_id == channel_id and entry.target_id == target_id
+            for entry in entries.values()
+        )
+
+    def skip(self, guild_id: int, channel_id: int, target_id: int) -> None:
+        """감사 로그를 기다리지 않고 본인 삭제로 처리했음을 기록"""
+        self.misses += 1
+        now = time.monotonic()
+        key = (guild_id, channel_id, target_id)
+        recent = [at for at in self._unmatched.get(key, ()) if at >= now - AUDIT_LOG_WAIT]
+        recent.append(now)
+        self._unmatched[key] = recent
+        if len(self._unmatched) > self.maxsize:
+            self._unmatched = {
+                k: times for k, times in self._unmatched.items() if times[-1] >= now - AUDIT_LOG_WAIT
+            }
+
+    async def wait_for(
+        self, guild_id: int, channel_id: int, target_id: int, timeout: float = AUDIT_LOG_WAIT
+    ) -> int | None:
+        """삭제자 ID 조회 (없으면 감사 로그 이벤트를 timeout초 동안 기다림)
+
+        본인이 지운 메시지는 감사 로그가 남지 않으므로 None을 반환합니다.
+        """
+        user_id = self.take(guild_id, channel_id, target_id)
+        if user_id is not None:
+            self.hits += 1
+            return user_id
+
+        key = (guild_id, channel_id, target_id)
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(key, []).append(future)
+        try:
+            user_id = await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            self.misses += 1
+            return None
+        finally:
+            waiters = self._waiters.get(key)
+            if waiters and future in waiters:
+                waiters.remove(future)
+                if not waiters:
+                    del self._waiters[key]
+        self.waited += 1
+        return user_id
+
+    def _prune(self, entries: OrderedDict[int, _Entry]) -> None:
+        """만료/초과 항목 제거 (오래된 순으로 정렬되어 있음)"""
+        deadline = time.monotonic() - self.ttl
+        while entries:
+            entry = next(iter(entries.values()))
+            if entry.seen_at >= deadline and len(entries) <= self.maxsize:
+                break
+            entries.popitem(last=False)
+
+    def stats(self) -> dict[str, Any]:
+        """캐시 항목 수와 조회 결과"""
+        return {
+            "entries": sum(len(entries) for entries in self._guilds.values()),
+            "hits": self.hits,
+            "waited": self.waited,
+            "misses": self.misses,
+            "pending": sum(len(waiters) for waiters in self._waiters.values()),
+        }
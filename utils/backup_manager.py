@@ -0,0 +1,197 @@
+"""SQLite 온라인 백업"""
+from __future__ import annotations
+import asyncio
+import hashlib
+import logging
+import sqlite3
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+import aiosqlite
+
+from .constants import (
+    AUTO_SAVE_INTERVAL,
+    BACKUP_PAGES_PER_STEP,
+    BACKUP_RETENTION,
+    DATA_DIR,
+)
+
+__all__ = ["BACKUP_DIR", "BackupInfo", "BackupManager"]
+
+logger = logging.getLogger(__name__)
+
+BACKUP_DIR = DATA_DIR / "backups"
+
+
+@dataclass(frozen=True, slots=True)
+class BackupInfo:
+    """완료된 백업 정보"""
+
+    path: Path
+    created_at: datetime
+    duration: float  # 초
+    size: int  # 바이트
+    sha256: str
+
+
+def _sha256(path: Path) -> str:
+    """파일 SHA-256 계산"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(1024 * 1024):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _finalize(part_path: Path, path: Path) -> tuple[int, str]:
+    """스냅샷 검사 후 제자리로 옮기고 체크섬 파일 작성"""
+    conn = sqlite3.connect(part_path)
+    try:
+        # 원본의 WAL 설정이 복사되므로 -wal 파일 없이 단독으로 쓸 수 있게 되돌림
+        conn.execute("PRAGMA journal_mode = DELETE").fetchone()
+        result = conn.execute("PRAGMA quick_check").fetchone()[0]
+    finally:
+        conn.close()
+    if result != "ok":
+        raise sqlite3.DatabaseError(f"백업 무결성 검사 실패: {result}")
+
+    checksum = _sha256(part_path)
+    part_path.replace(path)
+    path.with_name(path.name + ".sha256").write_text(f"{checksum}  {path.name}\n", encoding="utf-8")
+    return path.stat().st_size, checksum
+
+
+class BackupManager:
+    """주기적으로 SQLite 백업 API로 스냅샷을 만들고 보관 개수를 유지
+
+    백업은 전용 연결에서 읽기 트랜잭션 하나로 진행하므로 WAL 모드의 다른
+    읽기/쓰기 연결을 막지 않고, 도중에 쓰기가 있어도 처음부터 다시 시작하지
+    않습니다. 페이지는 나눠서 복사하고, 검사와 체크섬 계산은 스레드에서
+    실행해 이벤트 루프를 막지 않습니다.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        backup_dir: Path = BACKUP_DIR,
+        interval: float = AUTO_SAVE_INTERVAL,
+        retention: int = BACKUP_RETENTION,
+        pages: int = BACKUP_PAGES_PER_STEP,
+    ):
+        self.db_path = db_path
+        self.backup_dir = backup_dir
+        self.interval = interval
+        self.retention = max(1, retention)
+        self.pages = max(1, pages)
+        self.last_backup: BackupInfo | None = None
+        self.last_error: str | None = None
+        self.next_run: datetime | None = None
+        self._lock = asyncio.Lock()
+        self._task: asyncio.Task | None = None
+
+    @property
+    def running(self) -> bool:
+        """백업이 진행 중인지 여부"""
+        return self._lock.locked()
+
+    def start(self) -> None:
+        """주기 백업 시작"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="db-backup")
+
+    async def stop(self) -> None:
+        """주기 백업 중지 (진행 중인 백업은 끝까지 기다림)"""
+        if self._task is None:
+            return
+
+        task, self._task = self._task, None
+        async with self._lock:
+            task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        self.next_run = None
+
+    async def _run(self) -> None:
+        """백업 루프"""
+        while True:
+            self.next_run = datetime.fromtimestamp(time.time() + self.interval)
+            await asyncio.sleep(self.interval)
+            await self.backup_now()
+
+    def list_backups(self) -> list[Path]:
+        """보관 중인 백업 파일 (오래된 순)"""
+        if not self.backup_dir.exists():
+            return []
+        return sorted(self.backup_dir.glob(f"{self.db_path.stem}-*.db"))
+
+    async def backup_now(self) -> BackupInfo | None:
+        """즉시 백업 (실패 시 None)"""
+        async with self._lock:
+            try:
+                info = await self._backup()
+            except Exception as e:
+                self.last_error = str(e)
+                logger.error(f"데이터베이스 백업 실패: {e}")
+                return None
+
+            self.last_backup = info
+            self.last_error = None
+            logger.info(f"데이터베이스 백업 완료: {info.path.name} ({info.duration:.2f}초)")
+            await asyncio.to_thread(self._apply_retention)
+            return info
+
+    async def _backup(self) -> BackupInfo:
+        """스냅샷 생성"""
+        self.backup_dir.mkdir(parents=True, exist_ok=True)
+        created_at = datetime.now()
+        path = self.backup_dir / f"{self.db_path.stem}-{created_at.strftime('%Y%m%d-%H%M%S')}.db"
+        part_path = path.with_name(path.name + ".part")
+        part_path.unlink(missing_ok=True)
+
+        started = time.perf_counter()
+        source = await aiosqlite.connect(self.db_path)
+        try:
+            # 타깃 연결은 aiosqlite 작업 스레드에서 사용됨
+            target = await asyncio.to_thread(sqlite3.connect, part_path, check_same_thread=False)
+            try:
+                # 읽기 트랜잭션을 열어 둔 스냅샷 기준으로 복사
+                await source.execute("BEGIN")
+                async with source.execute("SELECT COUNT(*) FROM sqlite_master"):
+                    pass
+                await source.backup(target, pages=self.pages)
+                await source.rollback()
+            finally:
+                await asyncio.to_thread(target.close)
+        except BaseException:
+            part_path.unlink(missing_ok=True)
+            raise
+        finally:
+            await source.close()
+
+        try:
+            size, checksum = await asyncio.to_thread(_finalize, part_path, path)
+        except BaseException:
+            part_path.unlink(missing_ok=True)
+            raise
+
+        return BackupInfo(
+            path=path,
+            created_at=created_at,
+            duration=time.perf_counter() - started,
+            size=size,
+            sha256=checksum,
+        )
+
+    def _apply_retention(self) -> None:
+        """보관 개수를 넘는 오래된 백업 삭제"""
+        backups = self.list_backups()
+        for path in backups[:-self.retention]:
+            try:
+                path.unlink(missing_ok=True)
+                path.with_name(path.name + ".sha256").unlink(missing_ok=True)
+            except OSError as e:
+                logger.warning(f"오래된 백업 삭제 실패: {path.name} - {e}")
@@ -8,6 +8,49 @@ __all__ = [
     "COLORS",
     "DEFAULT_ACTIVITY_NAME",
     "AUTO_SAVE_INTERVAL",
+    "DB_READER_POOL_SIZE",
+    "DB_CACHE_SIZE_KB",
+    "DB_MMAP_SIZE",
+    "DB_BUSY_TIMEOUT_MS",
+    "WRITE_QUEUE_ENABLED",
+    "WRITE_QUEUE_INTERVAL",
+    "WRITE_QUEUE_MAX_BATCH",
+    "REACTION_ID_MAX_ATTEMPTS",
+    "PROFILE_CACHE_SIZE",
+    "PROFILE_CACHE_TTL",
+    "TRANSFER_BATCH_SIZE",
+    "PROFILE_SEARCH_LIMIT",
+    "PROFILE_SEARCH_MIN_MATCH",
+    "BACKUP_RETENTION",
+    "BACKUP_PAGES_PER_STEP",
+    "SLOW_QUERY_THRESHOLD_MS",
+    "SLOW_QUERY_HISTORY",
+    "LOG_BATCH_SIZE",
+    "LOG_EMBED_CHAR_LIMIT",
+    "LOG_FLUSH_INTERVAL",
+    "LOG_SPOOL_MAX_BYTES",
+    "LOG_SPOOL_COMPACT_PAGES",
+    "LOG_RETRY_BASE",
+    "LOG_RETRY_MAX",
+    "LOG_CLOSE_TIMEOUT",
+    "AUDIT_LOG_CACHE_TTL",
+    "AUDIT_LOG_CACHE_SIZE",
+    "AUDIT_LOG_WAIT",
+    "MESSAGE_STORE_GUILD_BUDGET",
+    "MESSAGE_STORE_TOTAL_BUDGET",
+    "JOIN_BURST_THRESHOLD",
+    "JOIN_BURST_WINDOW",
+    "JOIN_BURST_SUMMARY_INTERVAL",
+    "REACTION_COALESCE_WINDOW",
+    "REACTION_PROMPT_COOLDOWN",
+    "REACTION_RECONCILE_CONCURRENCY",
+    "REACTION_RECONCILE_DELAY",
+    "REACTION_RECONCILE_APPLY_INTERVAL",
+    "REACTION_RECONCILE_REVOKE",
+    "REST_MAX_CONCURRENCY",
+    "REST_BACKGROUND_CONCURRENCY",
+    "REST_BUCKET_BACKGROUND_CONCURRENCY",
+    "REST_MAINTENANCE_CONCURRENCY",
     "DEFAULT_SETTINGS",
     "GENDER_ROLES",
     "AGE_ROLES",
@@ -29,7 +72,82 @@ COLORS = {
 
 # 봇 설정
 DEFAULT_ACTIVITY_NAME = "기록 남기는 중..."
-AUTO_SAVE_INTERVAL: int = 300  # 5분
+AUTO_SAVE_INTERVAL: int = 300  # 5분 (데이터베이스 백업 주기)
+
+# 데이터베이스 연결 풀
+DB_READER_POOL_SIZE: int = 4
+DB_CACHE_SIZE_KB: int = 16 * 1024  # 연결당 페이지 캐시 (16MB)
+DB_MMAP_SIZE: int = 128 * 1024 * 1024  # 128MB
+DB_BUSY_TIMEOUT_MS: int = 5000
+
+# 그룹 커밋 쓰기 큐 (True일 때 여러 쓰기를 하나의 트랜잭션으로 묶음)
+WRITE_QUEUE_ENABLED: bool = False
+WRITE_QUEUE_INTERVAL: float = 0.005  # 배치 수집 간격 (초)
+WRITE_QUEUE_MAX_BATCH: int = 256
+
+# 반응설정 ID (6자리 16진수) 충돌 시 재시도 횟수
+REACTION_ID_MAX_ATTEMPTS: int = 32
+
+# 프로필 캐시
+PROFILE_CACHE_SIZE: int = 10000
+PROFILE_CACHE_TTL: float = 300.0  # 초
+
+# 내보내기/가져오기 배치 크기 (행)
+TRANSFER_BATCH_SIZE: int = 500
+
+# 프로필 검색 (자동완성 선택지는 최대 25개)
+PROFILE_SEARCH_LIMIT: int = 25
+PROFILE_SEARCH_MIN_MATCH: int = 3  # trigram 인덱스를 쓸 수 있는 최소 글자 수
+
+# 데이터베이스 백업
+BACKUP_RETENTION: int = 24  # 보관할 스냅샷 개수
+BACKUP_PAGES_PER_STEP: int = 256  # 백업 단계당 복사할 페이지 수
+
+# 느린 쿼리 로그 (data/logs/slow_query.log)
+SLOW_QUERY_THRESHOLD_MS: float = 100.0
+SLOW_QUERY_HISTORY: int = 10  # /상태 DB에 표시할 최근 느린 쿼리 수
+
+# 로그 채널 묶음 전송 (Discord 제한: 메시지당 embed 10개, 전체 6000자)
+LOG_BATCH_SIZE: int = 10
+LOG_EMBED_CHAR_LIMIT: int = 6000
+LOG_FLUSH_INTERVAL: float = 1.0  # 첫 로그 이후 더 모으는 시간 (초)
+LOG_SPOOL_MAX_BYTES: int = 64 * 1024 * 1024  # 전송 대기 로그 스풀 최대 크기 (data/log_spool.db)
+LOG_SPOOL_COMPACT_PAGES: int = 1024  # 빈 페이지가 이만큼 쌓이면 파일 정리
+LOG_RETRY_BASE: float = 5.0  # 전송 실패 후 첫 재시도 대기 (초, 실패할 때마다 2배)
+LOG_RETRY_MAX: float = 300.0
+LOG_CLOSE_TIMEOUT: float = 5.0
+
+# 메시지 삭제 감사 로그 캐시
+AUDIT_LOG_CACHE_TTL: float = 300.0  # Discord가 같은 관리자/작성자/채널의 연속 삭제를 한 항목으로 묶는 시간 (초)
+AUDIT_LOG_CACHE_SIZE: int = 500  # 서버별 최대 항목 수
+AUDIT_LOG_WAIT: float = 1.5  # 삭제 이벤트가 먼저 왔을 때 감사 로그를 기다리는 시간 (초)
+
+# 삭제/수정 로그용 메시지 저장소
+MESSAGE_STORE_GUILD_BUDGET: int = 4 * 1024 * 1024  # 서버별 메모리 예산 (바이트)
+MESSAGE_STORE_TOTAL_BUDGET: int = 64 * 1024 * 1024  # 전체 서버 합계 메모리 예산 (바이트)
+
+# 입장 급증(레이드) 집계: WINDOW초 안에 THRESHOLD명 이상 입장하면 요약 로그로 전환
+JOIN_BURST_THRESHOLD: int = 10
+JOIN_BURST_WINDOW: float = 10.0
+JOIN_BURST_SUMMARY_INTERVAL: float = 30.0  # 집계 중 요약 로그 주기 (초)
+
+# 역할 반응 중복 제거
+REACTION_COALESCE_WINDOW: float = 1.5  # 같은 유저/메시지의 반응을 모으는 시간 (초)
+REACTION_PROMPT_COOLDOWN: float = 60.0  # 인증 안내 DM 재전송 제한 (초)
+
+# 시작 시 반응 역할 동기화 (오프라인 동안 놓친 반응 반영)
+REACTION_RECONCILE_CONCURRENCY: int = 1  # 동시에 훑는 반응 수 (REST 유지보수 상한을 넘으면 대기만 늘어남)
+REACTION_RECONCILE_DELAY: float = 30.0  # 준비 완료 후 시작까지 대기 (초)
+REACTION_RECONCILE_APPLY_INTERVAL: float = 0.5  # 역할 수정 요청 간격 (초)
+# 반응 없이 역할만 가진 멤버의 역할 회수 여부 (기본은 집계만)
+# 켜면 관리자가 직접 준 역할이나 반응이 지워진 메시지의 역할도 회수됩니다
+REACTION_RECONCILE_REVOKE: bool = False
+
+# REST 요청 스케줄러 (동시 요청 수)
+REST_MAX_CONCURRENCY: int = 8
+REST_BACKGROUND_CONCURRENCY: int = 4  # 로그 전송 등 백그라운드 요청 상한
+REST_BUCKET_BACKGROUND_CONCURRENCY: int = 1  # 버킷(채널 등)별 백그라운드 요청 상한 (rate limit 대기 포함)
+REST_MAINTENANCE_CONCURRENCY: int = 1  # 반응 역할 동기화 등 유지보수 요청 상한 (백그라운드 상한보다 작게)
 
 # 기본 설정
 DEFAULT_SETTINGS = {
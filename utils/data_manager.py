@@ -1,363 +1,553 @@
 """SQLite 데이터베이스 기반 데이터 관리"""
 from __future__ import annotations
+import json
 import logging
-import aiosqlite
+import secrets
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Awaitable, Callable, Iterable, TypeVar
+import aiosqlite
 import discord
 
-from .constants import DATA_DIR, DEFAULT_SETTINGS
+from .constants import (
+    DATA_DIR,
+    DEFAULT_SETTINGS,
+    PROFILE_SEARCH_LIMIT,
+    PROFILE_SEARCH_MIN_MATCH,
+    REACTION_ID_MAX_ATTEMPTS,
+    WRITE_QUEUE_ENABLED,
+)
+from .backup_manager import BackupManager
+from .data_transfer import export_profiles, import_profiles
+from .db_pool import ConnectionPool
+from .metrics import QueryMetrics, instrumented
+from .migrations import migrate
+from .profile_cache import ProfileCache, ProfileRecord
+from .write_queue import WriteQueue
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 class DataManager:
     """SQLite 기반 데이터 관리"""
     
-    def __init__(self, bot: discord.Bot):
+    def __init__(self, bot: discord.Bot | None, db_path: Path | None = None):
         self.bot = bot
-        self.db_path = DATA_DIR / "stack_bot.db"
-        DATA_DIR.mkdir(parents=True, exist_ok=True)
+        self.db_path = db_path or DATA_DIR / "stack_bot.db"
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # 메서드별 지연 시간/오류 및 느린 쿼리 통계 (/상태 DB)
+        self.metrics = QueryMetrics()
+        self.pool = ConnectionPool(self.db_path, metrics=self.metrics)
+        self.backups = BackupManager(self.db_path, backup_dir=self.db_path.parent / "backups")
+        self.write_queue: WriteQueue | None = None
+        self.profile_cache = ProfileCache()
+        # message_id -> {emoji: role_id}, 반응 이벤트 처리 시 DB 조회 없이 사용
+        self._reaction_index: dict[int, dict[str, int]] = {}
+        # guild_id -> 서버 설정, 설정이 없는 서버는 DEFAULT_SETTINGS로 캐시
+        self._guild_settings: dict[int, dict[str, Any]] = {}
     
+    @instrumented("데이터베이스 초기화")
     async def init_db(self) -> None:
         """데이터베이스 초기화"""
+        await self.pool.open()
+        await migrate(self.pool)
+        await self._backfill_reaction_guilds()
+        await self._load_reaction_index()
+        await self._load_guild_settings()
+        
+        if WRITE_QUEUE_ENABLED:
+            self.write_queue = WriteQueue(self.pool)
+            self.write_queue.start()
+        
+        self.backups.start()
+    
+    async def _backfill_reaction_guilds(self) -> None:
+        """guild_id가 비어 있는 기존 반응 역할 행을 채널 정보로 채움"""
+        async with self.pool.reader() as db:
+            cursor = await db.execute(
+                "SELECT DISTINCT channel_id FROM reaction_roles WHERE guild_id IS NULL"
+            )
+            channel_ids = [row['channel_id'] for row in await cursor.fetchall()]
+        
+        updates = []
+        for channel_id in channel_ids:
+            channel = self.bot.get_channel(channel_id) if self.bot else None
+            guild = getattr(channel, "guild", None)
+            if guild:
+                updates.append((guild.id, channel_id))
+        
+        if updates:
+            async with self.pool.writer() as db:
+                await db.executemany(
+                    "UPDATE reaction_roles SET guild_id = ? WHERE channel_id = ? AND guild_id IS NULL",
+                    updates
+                )
+    
+    async def _load_reaction_index(self) -> None:
+        """반응 역할 인덱스 로드"""
+        index: dict[int, dict[str, int]] = {}
+        async with self.pool.reader() as db:
+            cursor = await db.execute("SELECT message_id, emoji, role_id FROM reaction_roles")
+            for row in await cursor.fetchall():
+                index.setdefault(row['message_id'], {})[row['emoji']] = row['role_id']
+        self._reaction_index = index
+    
+    async def _load_guild_settings(self) -> None:
+        """서버 설정 캐시 로드"""
+        async with self.pool.reader() as db:
+            cursor = await db.execute("SELECT guild_id, log_channel_id FROM server_settings")
+            rows = await cursor.fetchall()
+        self._guild_settings = {
+            row['guild_id']: {**DEFAULT_SETTINGS, 'log_channel_id': row['log_channel_id']}
+            for row in rows
+        }
+    
+    @instrumented("데이터베이스 종료")
+    async def close(self) -> None:
+        """데이터베이스 연결 종료"""
+        await self.backups.stop()
+        if self.write_queue:
+            queue, self.write_queue = self.write_queue, None
+            await queue.close()
+        await self.pool.close()
+    
+    @instrumented("프로필 내보내기")
+    async def export_profiles(self, path: Path) -> int | None:
+        """프로필/관리자 정보를 JSONL 또는 CSV로 내보내기 (실패 시 None)"""
+        return await export_profiles(self.pool, path)
+    
+    @instrumented("프로필 가져오기")
+    async def import_profiles(self, path: Path) -> tuple[int, int] | None:
+        """JSONL 또는 CSV에서 프로필 가져오기 (반영/건너뛴 행 수, 실패 시 None)"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                await db.execute("""
-                    CREATE TABLE IF NOT EXISTS user_profiles (
-                        user_id TEXT PRIMARY KEY,
-                        username TEXT NOT NULL,
-                        display_name TEXT,
-                        birth_year TEXT,
-                        gender TEXT,
-                        region TEXT,
-                        registered_at TEXT,
-                        updated_at TEXT
-                    )
-                """)
-                
-                await db.execute("""
-                    CREATE TABLE IF NOT EXISTS admin_info (
-                        user_id TEXT PRIMARY KEY,
-                        warning_count INTEGER DEFAULT 0,
-                        admin_memo TEXT,
-                        updated_at TEXT,
-                        FOREIGN KEY (user_id) REFERENCES user_profiles (user_id)
-                    )
-                """)
-                
-                await db.execute("""
-                    CREATE TABLE IF NOT EXISTS server_settings (
-                        guild_id TEXT PRIMARY KEY,
-                        log_channel_id TEXT,
-                        updated_at TEXT
-                    )
-                """)
-                
-                await db.execute("""
-                    CREATE TABLE IF NOT EXISTS reaction_roles (
-                        reaction_id TEXT PRIMARY KEY,
-                        message_id TEXT NOT NULL,
-                        channel_id TEXT NOT NULL,
-                        emoji TEXT NOT NULL,
-                        role_id TEXT NOT NULL,
-                        created_at TEXT
-                    )
-                """)
-                
-                await db.execute("""
-                    CREATE INDEX IF NOT EXISTS idx_reaction_message 
-                    ON reaction_roles(message_id)
-                """)
-                
-                await db.commit()
-        except Exception as e:
-            logger.error(f"데이터베이스 초기화 실패: {e}")
+            return await import_profiles(self.pool, path)
+        finally:
+            # 일부 배치만 반영된 경우에도 캐시가 오래된 값을 돌려주지 않도록 함
+            self.profile_cache.clear()
     
+    async def _write(self, op: Callable[[aiosqlite.Connection], Awaitable[T]]) -> T:
+        """쓰기 작업 실행 (쓰기 큐가 켜져 있으면 그룹 커밋)"""
+        if self.write_queue:
+            return await self.write_queue.submit(op)
+        async with self.pool.writer() as db:
+            return await op(db)
+    
+    @instrumented("프로필 등록")
     async def register_profile(
-        self, user_id: str, username: str, display_name: str, 
+        self, user_id: int, username: str, display_name: str, 
         birth_year: str, gender: str, region: str
-    ) -> bool:
-        """프로필 등록"""
+    ) -> dict[str, Any] | None:
+        """프로필 등록 (등록/수정된 프로필 행 반환)"""
+        now = datetime.now().isoformat()
+        
+        async def op(db: aiosqlite.Connection) -> dict[str, Any]:
+            cursor = await db.execute("""
+                INSERT INTO user_profiles 
+                (user_id, username, display_name, birth_year, gender, region, registered_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(user_id) DO UPDATE SET
+                    username = excluded.username, display_name = excluded.display_name,
+                    birth_year = excluded.birth_year, gender = excluded.gender,
+                    region = excluded.region, updated_at = excluded.updated_at
+                RETURNING *
+            """, (user_id, username, display_name, birth_year, gender, region, now, now))
+            profile = dict(await cursor.fetchone())
+            
+            await db.execute("""
+                INSERT INTO admin_info (user_id, warning_count, admin_memo, updated_at)
+                VALUES (?, 0, '', ?)
+                ON CONFLICT(user_id) DO NOTHING
+            """, (user_id, now))
+            return profile
+        
         try:
-            now = datetime.now().isoformat()
-            async with aiosqlite.connect(self.db_path) as db:
-                cursor = await db.execute(
-                    "SELECT user_id FROM user_profiles WHERE user_id = ?", (user_id,)
-                )
-                existing = await cursor.fetchone()
-                
-                if existing:
-                    await db.execute("""
-                        UPDATE user_profiles 
-                        SET username = ?, display_name = ?, birth_year = ?, 
-                            gender = ?, region = ?, updated_at = ?
-                        WHERE user_id = ?
-                    """, (username, display_name, birth_year, gender, region, now, user_id))
-                else:
-                    await db.execute("""
-                        INSERT INTO user_profiles 
-                        (user_id, username, display_name, birth_year, gender, region, registered_at, updated_at)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                    """, (user_id, username, display_name, birth_year, gender, region, now, now))
-                    
-                    await db.execute("""
-                        INSERT INTO admin_info (user_id, warning_count, admin_memo, updated_at)
-                        VALUES (?, 0, '', ?)
-                    """, (user_id, now))
-                
-                await db.commit()
-                return True
-        except Exception as e:
-            logger.error(f"프로필 등록 실패: {e}")
-            return False
+            return await self._write(op)
+        finally:
+            self.profile_cache.invalidate(user_id)
     
-    async def get_profile(self, user_id: str) -> dict[str, Any] | None:
-        """프로필 조회"""
-        try:
-            async with aiosqlite.connect(self.db_path) as db:
-                db.row_factory = aiosqlite.Row
-                cursor = await db.execute(
-                    "SELECT * FROM user_profiles WHERE user_id = ?", (user_id,)
-                )
-                row = await cursor.fetchone()
-                return dict(row) if row else None
-        except Exception as e:
-            logger.error(f"프로필 조회 실패: {e}")
+    @instrumented("프로필 조회")
+    async def get_profile(self, user_id: int) -> ProfileRecord | None:
+        """프로필 및 관리자 정보 조회 (캐시 우선)"""
+        record = self.profile_cache.get(user_id)
+        if record:
+            return record
+        
+        generation = self.profile_cache.generation
+        async with self.pool.reader() as db:
+            cursor = await db.execute("""
+                SELECT p.user_id, p.username, p.display_name, p.birth_year, p.gender,
+                       p.region, p.registered_at, a.warning_count, a.admin_memo
+                FROM user_profiles p
+                LEFT JOIN admin_info a ON a.user_id = p.user_id
+                WHERE p.user_id = ?
+            """, (user_id,))
+            row = await cursor.fetchone()
+        if not row:
             return None
+        
+        record = ProfileRecord(**dict(row))
+        self.profile_cache.put(record, generation)
+        return record
     
-    async def get_all_profiles(self) -> list[dict[str, Any]]:
-        """전체 프로필 조회"""
-        try:
-            async with aiosqlite.connect(self.db_path) as db:
-                db.row_factory = aiosqlite.Row
-                cursor = await db.execute(
-                    "SELECT * FROM user_profiles ORDER BY display_name ASC"
-                )
-                rows = await cursor.fetchall()
-                return [dict(row) for row in rows]
-        except Exception as e:
-            logger.error(f"전체 프로필 조회 실패: {e}")
-            return []
+    @instrumented("프로필 일괄 조회", default=dict)
+    async def get_profiles_many(self, user_ids: Iterable[int]) -> dict[int, ProfileRecord]:
+        """여러 유저의 프로필 조회 (등록된 유저만 포함, 캐시는 갱신하지 않음)"""
+        user_ids = list(user_ids)
+        if not user_ids:
+            return {}
+        async with self.pool.reader() as db:
+            cursor = await db.execute("""
+                SELECT p.user_id, p.username, p.display_name, p.birth_year, p.gender,
+                       p.region, p.registered_at, a.warning_count, a.admin_memo
+                FROM user_profiles p
+                LEFT JOIN admin_info a ON a.user_id = p.user_id
+                WHERE p.user_id IN (SELECT value FROM json_each(?))
+            """, (json.dumps(user_ids),))
+            rows = await cursor.fetchall()
+        return {row['user_id']: ProfileRecord(**dict(row)) for row in rows}
     
-    async def get_admin_info(self, user_id: str) -> dict[str, Any] | None:
-        """관리자 정보 조회"""
-        try:
-            async with aiosqlite.connect(self.db_path) as db:
-                db.row_factory = aiosqlite.Row
-                cursor = await db.execute(
-                    "SELECT * FROM admin_info WHERE user_id = ?", (user_id,)
-                )
-                row = await cursor.fetchone()
-                return dict(row) if row else None
-        except Exception as e:
-            logger.error(f"관리자 정보 조회 실패: {e}")
-            return None
+    @instrumented("프로필 수 조회", default=0)
+    async def count_profiles(self) -> int:
+        """등록된 프로필 수"""
+        async with self.pool.reader() as db:
+            cursor = await db.execute("SELECT COUNT(*) FROM user_profiles")
+            row = await cursor.fetchone()
+            return row[0] if row else 0
     
-    async def add_warning(self, user_id: str, count: int = 1) -> bool:
-        """경고 추가"""
+    @instrumented("프로필 페이지 조회", default=list)
+    async def get_profiles_page(
+        self,
+        limit: int,
+        key: tuple[str, int] | None = None,
+        backward: bool = False
+    ) -> list[dict[str, Any]]:
+        """(display_name, user_id) 키셋 기준 프로필 페이지 조회
+        
+        backward가 False면 key 다음 행부터(없으면 처음부터), True면 key 직전 행까지
+        (없으면 마지막 행까지) limit개를 display_name 순으로 반환합니다.
+        """
+        op, order = ("<", "DESC") if backward else (">", "ASC")
+        where = f"WHERE (display_name, user_id) {op} (?, ?)" if key else ""
+        async with self.pool.reader() as db:
+            cursor = await db.execute(f"""
+                SELECT user_id, display_name FROM user_profiles {where}
+                ORDER BY display_name {order}, user_id {order} LIMIT ?
+            """, (*(key or ()), limit))
+            rows = [dict(row) for row in await cursor.fetchall()]
+        
+        if backward:
+            rows.reverse()
+        return rows
+    
+    @instrumented("프로필 검색", default=list)
+    async def search_profiles(
+        self,
+        query: str,
+        limit: int = PROFILE_SEARCH_LIMIT,
+        nickname_only: bool = False
+    ) -> list[dict[str, Any]]:
+        """닉네임/유저명/지역 검색 (user_id, display_name, region)
+        
+        3글자 이상은 FTS5 trigram 인덱스로 부분 일치를, 그보다 짧으면
+        닉네임 접두어 일치와 (nickname_only가 아니면) 지역 일치를 찾습니다.
+        """
+        query = query.strip()
+        if not query:
+            return []
+        
+        async with self.pool.reader() as db:
+            if len(query) >= PROFILE_SEARCH_MIN_MATCH:
+                phrase = '"' + query.replace('"', '""') + '"'
+                match = f"display_name : {phrase}" if nickname_only else phrase
+                cursor = await db.execute("""
+                    SELECT p.user_id, p.display_name, p.region
+                    FROM (
+                        SELECT rowid, rank FROM profile_search
+                        WHERE profile_search MATCH ? ORDER BY rank LIMIT ?
+                    ) s
+                    JOIN user_profiles p ON p.user_id = s.rowid
+                    ORDER BY s.rank
+                """, (match, limit))
+                return [dict(row) for row in await cursor.fetchall()]
+            
+            upper = query[:-1] + chr(ord(query[-1]) + 1)
+            cursor = await db.execute("""
+                SELECT user_id, display_name, region FROM user_profiles
+                WHERE display_name >= ? AND display_name < ?
+                ORDER BY display_name, user_id LIMIT ?
+            """, (query, upper, limit))
+            results = [dict(row) for row in await cursor.fetchall()]
+            
+            if not nickname_only and len(results) < limit:
+                cursor = await db.execute("""
+                    SELECT user_id, display_name, region FROM user_profiles
+                    WHERE region = ? ORDER BY user_id LIMIT ?
+                """, (query, limit))
+                seen = {result['user_id'] for result in results}
+                for row in await cursor.fetchall():
+                    if len(results) >= limit:
+                        break
+                    if row['user_id'] not in seen:
+                        results.append(dict(row))
+            return results
+    
+    @instrumented("경고 추가")
+    async def add_warning(self, user_id: int, count: int = 1) -> int | None:
+        """경고 추가 (변경된 경고 횟수 반환, 프로필이 없거나 실패 시 None)"""
+        now = datetime.now().isoformat()
+        
+        async def op(db: aiosqlite.Connection) -> int | None:
+            cursor = await db.execute("""
+                UPDATE admin_info 
+                SET warning_count = warning_count + ?, updated_at = ?
+                WHERE user_id = ?
+                RETURNING warning_count
+            """, (count, now, user_id))
+            row = await cursor.fetchone()
+            return row['warning_count'] if row else None
+        
         try:
-            now = datetime.now().isoformat()
-            async with aiosqlite.connect(self.db_path) as db:
-                await db.execute("""
-                    UPDATE admin_info 
-                    SET warning_count = warning_count + ?, updated_at = ?
-                    WHERE user_id = ?
-                """, (count, now, user_id))
-                await db.commit()
-                return True
-        except Exception as e:
-            logger.error(f"경고 추가 실패: {e}")
-            return False
+            return await self._write(op)
+        finally:
+            self.profile_cache.invalidate(user_id)
     
-    async def remove_warning(self, user_id: str, count: int = 1) -> bool:
-        """경고 제거"""
+    @instrumented("경고 제거")
+    async def remove_warning(self, user_id: int, count: int = 1) -> int | None:
+        """경고 제거 (남은 경고 횟수 반환, 프로필이 없거나 실패 시 None)"""
+        now = datetime.now().isoformat()
+        
+        async def op(db: aiosqlite.Connection) -> int | None:
+            cursor = await db.execute("""
+                UPDATE admin_info 
+                SET warning_count = MAX(0, warning_count - ?), updated_at = ?
+                WHERE user_id = ?
+                RETURNING warning_count
+            """, (count, now, user_id))
+            row = await cursor.fetchone()
+            return row['warning_count'] if row else None
+        
         try:
-            now = datetime.now().isoformat()
-            async with aiosqlite.connect(self.db_path) as db:
-                await db.execute("""
-                    UPDATE admin_info 
-                    SET warning_count = MAX(0, warning_count - ?), updated_at = ?
-                    WHERE user_id = ?
-                """, (count, now, user_id))
-                await db.commit()
-                return True
-        except Exception as e:
-            logger.error(f"경고 제거 실패: {e}")
-            return False
+            return await self._write(op)
+        finally:
+            self.profile_cache.invalidate(user_id)
     
-    async def set_admin_memo(self, user_id: str, memo: str) -> bool:
-        """관리자 메모 작성"""
+    @instrumented("메모 작성", default=False)
+    async def set_admin_memo(self, user_id: int, memo: str) -> bool:
+        """관리자 메모 작성 (프로필이 없거나 실패 시 False)"""
+        now = datetime.now().isoformat()
+        
+        async def op(db: aiosqlite.Connection) -> bool:
+            cursor = await db.execute("""
+                UPDATE admin_info 
+                SET admin_memo = ?, updated_at = ?
+                WHERE user_id = ?
+            """, (memo, now, user_id))
+            return cursor.rowcount > 0
+        
         try:
-            now = datetime.now().isoformat()
-            async with aiosqlite.connect(self.db_path) as db:
-                await db.execute("""
-                    UPDATE admin_info 
-                    SET admin_memo = ?, updated_at = ?
-                    WHERE user_id = ?
-                """, (memo, now, user_id))
-                await db.commit()
-                return True
-        except Exception as e:
-            logger.error(f"메모 작성 실패: {e}")
-            return False
+            return await self._write(op)
+        finally:
+            self.profile_cache.invalidate(user_id)
     
-    async def set_log_channel(self, guild_id: str, channel_id: str) -> bool:
+    @instrumented("로그 채널 설정", default=False)
+    async def set_log_channel(self, guild_id: int, channel_id: int) -> bool:
         """로그 채널 설정"""
+        now = datetime.now().isoformat()
+        
+        async def op(db: aiosqlite.Connection) -> None:
+            await db.execute("""
+                INSERT INTO server_settings (guild_id, log_channel_id, updated_at)
+                VALUES (?, ?, ?)
+                ON CONFLICT(guild_id) DO UPDATE SET
+                    log_channel_id = excluded.log_channel_id, updated_at = excluded.updated_at
+            """, (guild_id, channel_id, now))
+        
         try:
-            now = datetime.now().isoformat()
-            async with aiosqlite.connect(self.db_path) as db:
-                cursor = await db.execute(
-                    "SELECT guild_id FROM server_settings WHERE guild_id = ?", (guild_id,)
-                )
-                existing = await cursor.fetchone()
-                
-                if existing:
-                    await db.execute("""
-                        UPDATE server_settings 
-                        SET log_channel_id = ?, updated_at = ?
-                        WHERE guild_id = ?
-                    """, (channel_id, now, guild_id))
-                else:
-                    await db.execute("""
-                        INSERT INTO server_settings (guild_id, log_channel_id, updated_at)
-                        VALUES (?, ?, ?)
-                    """, (guild_id, channel_id, now))
-                
-                await db.commit()
-                return True
-        except Exception as e:
-            logger.error(f"로그 채널 설정 실패: {e}")
-            return False
+            await self._write(op)
+        except Exception:
+            # 캐시를 비워 다음 조회 때 DB 값을 다시 읽도록 함
+            self._guild_settings.pop(guild_id, None)
+            raise
+        settings = self._guild_settings.get(guild_id, DEFAULT_SETTINGS)
+        self._guild_settings[guild_id] = {**settings, 'log_channel_id': channel_id}
+        return True
     
-    async def get_log_channel(self, guild_id: str) -> str | None:
-        """로그 채널 조회"""
-        try:
-            async with aiosqlite.connect(self.db_path) as db:
+    @instrumented("서버 설정 조회", default=lambda: {**DEFAULT_SETTINGS})
+    async def get_guild_settings(self, guild_id: int) -> dict[str, Any]:
+        """서버 설정 조회 (캐시 미스 시에만 DB 조회)"""
+        settings = self._guild_settings.get(guild_id)
+        if settings is None:
+            async with self.pool.reader() as db:
                 cursor = await db.execute(
                     "SELECT log_channel_id FROM server_settings WHERE guild_id = ?", (guild_id,)
                 )
                 row = await cursor.fetchone()
-                return row[0] if row else None
-        except Exception as e:
-            logger.error(f"로그 채널 조회 실패: {e}")
-            return None
+            settings = {**DEFAULT_SETTINGS}
+            if row:
+                settings['log_channel_id'] = row['log_channel_id']
+            self._guild_settings[guild_id] = settings
+        return settings.copy()
+    
+    @instrumented("로그 채널 조회")
+    async def get_log_channel(self, guild_id: int) -> int | None:
+        """로그 채널 조회"""
+        settings = await self.get_guild_settings(guild_id)
+        return settings['log_channel_id']
     
+    async def _insert_reaction_role(
+        self,
+        db: aiosqlite.Connection,
+        guild_id: int,
+        message_id: int,
+        channel_id: int,
+        emoji: str,
+        role_id: int,
+        now: str
+    ) -> str:
+        """현재 트랜잭션 안에서 반응설정 ID를 할당하여 매핑 저장
+        
+        같은 메시지/이모지가 이미 있으면 역할만 갱신하고 기존 ID를 반환하며,
+        무작위 ID가 충돌하면 PRIMARY KEY 제약에 걸려 아무 행도 반환되지 않으므로
+        새 ID로 다시 시도합니다.
+        """
+        for _ in range(REACTION_ID_MAX_ATTEMPTS):
+            cursor = await db.execute("""
+                INSERT INTO reaction_roles 
+                (reaction_id, guild_id, message_id, channel_id, emoji, role_id, created_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(message_id, emoji) DO UPDATE SET
+                    guild_id = excluded.guild_id, channel_id = excluded.channel_id,
+                    role_id = excluded.role_id
+                ON CONFLICT(reaction_id) DO NOTHING
+                RETURNING reaction_id
+            """, (secrets.token_hex(3).upper(), guild_id, message_id, channel_id, emoji, role_id, now))
+            row = await cursor.fetchone()
+            if row:
+                return row['reaction_id']
+        raise RuntimeError("사용 가능한 반응설정 ID를 찾지 못했습니다")
+    
+    @instrumented("반응 역할 추가", default="")
     async def add_reaction_role(
         self,
+        guild_id: int,
         message_id: int,
         channel_id: int,
         emoji: str,
         role_id: int
     ) -> str:
-        """이모지-역할 매핑 추가"""
-        try:
-            import random
-            while True:
-                reaction_id = ''.join(random.choices('0123456789ABCDEF', k=6))
-                async with aiosqlite.connect(self.db_path) as db:
-                    cursor = await db.execute(
-                        "SELECT reaction_id FROM reaction_roles WHERE reaction_id = ?",
-                        (reaction_id,)
-                    )
-                    if not await cursor.fetchone():
-                        break
-            
-            now = datetime.now().isoformat()
-            async with aiosqlite.connect(self.db_path) as db:
-                await db.execute("""
-                    INSERT INTO reaction_roles 
-                    (reaction_id, message_id, channel_id, emoji, role_id, created_at)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                """, (reaction_id, str(message_id), str(channel_id), emoji, str(role_id), now))
-                await db.commit()
-                return reaction_id
-        except Exception as e:
-            logger.error(f"반응 역할 추가 실패: {e}")
-            return ""
+        """이모지-역할 매핑 추가 (이미 있는 메시지/이모지는 역할 갱신)"""
+        now = datetime.now().isoformat()
+        
+        async def op(db: aiosqlite.Connection) -> str:
+            return await self._insert_reaction_role(
+                db, guild_id, message_id, channel_id, emoji, role_id, now
+            )
+        
+        reaction_id = await self._write(op)
+        self._reaction_index.setdefault(message_id, {})[emoji] = role_id
+        return reaction_id
     
+    @instrumented("반응 역할 일괄 추가", default=list)
+    async def add_reaction_roles(
+        self, guild_id: int, mappings: list[tuple[int, int, str, int]]
+    ) -> list[str]:
+        """여러 이모지-역할 매핑을 한 트랜잭션으로 추가
+        
+        mappings는 (message_id, channel_id, emoji, role_id) 목록이며,
+        같은 순서로 할당된 반응설정 ID 목록을 반환합니다.
+        """
+        now = datetime.now().isoformat()
+        
+        async def op(db: aiosqlite.Connection) -> list[str]:
+            return [
+                await self._insert_reaction_role(
+                    db, guild_id, message_id, channel_id, emoji, role_id, now
+                )
+                for message_id, channel_id, emoji, role_id in mappings
+            ]
+        
+        reaction_ids = await self._write(op)
+        for message_id, _, emoji, role_id in mappings:
+            self._reaction_index.setdefault(message_id, {})[emoji] = role_id
+        return reaction_ids
+    
+    @instrumented("반응 역할 제거", default=False)
     async def remove_reaction_by_id(self, reaction_id: str) -> bool:
         """반응설정 ID로 매핑 제거"""
-        try:
-            async with aiosqlite.connect(self.db_path) as db:
-                await db.execute(
-                    "DELETE FROM reaction_roles WHERE reaction_id = ?",
-                    (reaction_id,)
-                )
-                await db.commit()
-                return True
-        except Exception as e:
-            logger.error(f"반응 역할 제거 실패: {e}")
-            return False
+        async def op(db: aiosqlite.Connection) -> aiosqlite.Row | None:
+            cursor = await db.execute(
+                "DELETE FROM reaction_roles WHERE reaction_id = ? RETURNING message_id, emoji",
+                (reaction_id,)
+            )
+            return await cursor.fetchone()
+        
+        row = await self._write(op)
+        if row:
+            mapping = self._reaction_index.get(row['message_id'], {})
+            mapping.pop(row['emoji'], None)
+            if not mapping:
+                self._reaction_index.pop(row['message_id'], None)
+        return True
     
-    async def get_all_reaction_roles(self) -> dict[str, dict]:
-        """모든 반응설정 조회"""
-        try:
-            async with aiosqlite.connect(self.db_path) as db:
-                db.row_factory = aiosqlite.Row
+    @instrumented("반응 역할 목록 조회", default=dict)
+    async def get_all_reaction_roles(self, guild_id: int | None = None) -> dict[str, dict]:
+        """모든 반응설정 조회 (guild_id가 주어지면 해당 서버만)"""
+        async with self.pool.reader() as db:
+            if guild_id is None:
                 cursor = await db.execute("SELECT * FROM reaction_roles")
-                rows = await cursor.fetchall()
-                
-                result = {}
-                for row in rows:
-                    result[row['reaction_id']] = {
-                        'message_id': int(row['message_id']),
-                        'channel_id': int(row['channel_id']),
-                        'emoji': row['emoji'],
-                        'role_id': int(row['role_id'])
-                    }
-                return result
-        except Exception as e:
-            logger.error(f"반응 역할 목록 조회 실패: {e}")
-            return {}
+            else:
+                cursor = await db.execute(
+                    "SELECT * FROM reaction_roles WHERE guild_id = ? ORDER BY channel_id",
+                    (guild_id,)
+                )
+            rows = await cursor.fetchall()
+            
+            result = {}
+            for row in rows:
+                result[row['reaction_id']] = {
+                    'message_id': row['message_id'],
+                    'channel_id': row['channel_id'],
+                    'emoji': row['emoji'],
+                    'role_id': row['role_id']
+                }
+            return result
     
+    @instrumented("반응 역할 조회")
     async def get_reaction_role_by_id(self, reaction_id: str) -> dict | None:
         """반응설정 ID로 조회"""
-        try:
-            async with aiosqlite.connect(self.db_path) as db:
-                db.row_factory = aiosqlite.Row
-                cursor = await db.execute(
-                    "SELECT * FROM reaction_roles WHERE reaction_id = ?",
-                    (reaction_id,)
-                )
-                row = await cursor.fetchone()
-                if row:
-                    return {
-                        'message_id': int(row['message_id']),
-                        'channel_id': int(row['channel_id']),
-                        'emoji': row['emoji'],
-                        'role_id': int(row['role_id'])
-                    }
-                return None
-        except Exception as e:
-            logger.error(f"반응 역할 조회 실패: {e}")
+        async with self.pool.reader() as db:
+            cursor = await db.execute(
+                "SELECT * FROM reaction_roles WHERE reaction_id = ?",
+                (reaction_id,)
+            )
+            row = await cursor.fetchone()
+            if row:
+                return {
+                    'guild_id': row['guild_id'],
+                    'message_id': row['message_id'],
+                    'channel_id': row['channel_id'],
+                    'emoji': row['emoji'],
+                    'role_id': row['role_id']
+                }
             return None
     
-    async def get_role_for_reaction(self, message_id: int, emoji: str) -> int | None:
-        """이모지에 해당하는 역할 ID 조회"""
-        try:
-            async with aiosqlite.connect(self.db_path) as db:
-                cursor = await db.execute(
-                    "SELECT role_id FROM reaction_roles WHERE message_id = ? AND emoji = ?",
-                    (str(message_id), emoji)
-                )
-                row = await cursor.fetchone()
-                return int(row[0]) if row else None
-        except Exception as e:
-            logger.error(f"역할 조회 실패: {e}")
-            return None
+    def get_role_for_reaction(self, message_id: int, emoji: str) -> int | None:
+        """이모지에 해당하는 역할 ID 조회 (메모리 인덱스)"""
+        mapping = self._reaction_index.get(message_id)
+        return mapping.get(emoji) if mapping else None
     
-    async def is_reaction_message(self, message_id: int) -> bool:
-        """역할 인증 메시지인지 확인"""
-        try:
-            async with aiosqlite.connect(self.db_path) as db:
-                cursor = await db.execute(
-                    "SELECT COUNT(*) FROM reaction_roles WHERE message_id = ?",
-                    (str(message_id),)
-                )
-                row = await cursor.fetchone()
-                return row[0] > 0 if row else False
-        except Exception as e:
-            logger.error(f"메시지 확인 실패: {e}")
-            return False
+    def is_reaction_message(self, message_id: int) -> bool:
+        """역할 인증 메시지인지 확인 (메모리 인덱스)"""
+        return message_id in self._reaction_index
+    
+    @instrumented("반응 역할 확인", default=False)
+    async def is_reaction_role(self, guild_id: int, role_id: int) -> bool:
+        """해당 서버의 반응 역할로 설정된 역할인지 확인"""
+        async with self.pool.reader() as db:
+            cursor = await db.execute(
+                "SELECT 1 FROM reaction_roles WHERE guild_id = ? AND role_id = ? LIMIT 1",
+                (guild_id, role_id)
+            )
+            return await cursor.fetchone() is not None
@@ -0,0 +1,229 @@
+"""프로필/관리자 정보 내보내기·가져오기 (JSONL, CSV)
+
+오프라인 실행:
+    python -m utils.data_transfer export data/exports/profiles.jsonl
+    python -m utils.data_transfer import data/exports/profiles.csv
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import csv
+import json
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterator
+
+from .constants import DATA_DIR, TRANSFER_BATCH_SIZE
+from .db_pool import ConnectionPool
+from .migrations import migrate
+
+__all__ = ["EXPORT_DIR", "FIELDS", "FORMATS", "export_profiles", "import_profiles", "default_export_path"]
+
+logger = logging.getLogger(__name__)
+
+EXPORT_DIR = DATA_DIR / "exports"
+FORMATS = ("jsonl", "csv")
+
+# 내보내기 파일의 열 순서 (user_profiles + admin_info)
+FIELDS = (
+    "user_id", "username", "display_name", "birth_year", "gender", "region",
+    "registered_at", "updated_at", "warning_count", "admin_memo", "admin_updated_at",
+)
+
+_EXPORT_QUERY = """
+    SELECT p.user_id, p.username, p.display_name, p.birth_year, p.gender, p.region,
+           p.registered_at, p.updated_at, a.warning_count, a.admin_memo,
+           a.updated_at AS admin_updated_at
+    FROM user_profiles p
+    LEFT JOIN admin_info a ON a.user_id = p.user_id
+    ORDER BY p.user_id
+"""
+
+_UPSERT_PROFILE = """
+    INSERT INTO user_profiles
+        (user_id, username, display_name, birth_year, gender, region, registered_at, updated_at)
+    VALUES (:user_id, :username, :display_name, :birth_year, :gender, :region, :registered_at, :updated_at)
+    ON CONFLICT(user_id) DO UPDATE SET
+        username = excluded.username,
+        display_name = excluded.display_name,
+        birth_year = excluded.birth_year,
+        gender = excluded.gender,
+        region = excluded.region,
+        registered_at = COALESCE(excluded.registered_at, registered_at),
+        updated_at = excluded.updated_at
+"""
+
+_UPSERT_ADMIN = """
+    INSERT INTO admin_info (user_id, warning_count, admin_memo, updated_at)
+    VALUES (:user_id, :warning_count, :admin_memo, :admin_updated_at)
+    ON CONFLICT(user_id) DO UPDATE SET
+        warning_count = excluded.warning_count,
+        admin_memo = excluded.admin_memo,
+        updated_at = excluded.updated_at
+"""
+
+
+def default_export_path(fmt: str) -> Path:
+    """기본 내보내기 경로 (data/exports/profiles-YYYYmmdd-HHMMSS.<fmt>)"""
+    return EXPORT_DIR / f"profiles-{datetime.now().strftime('%Y%m%d-%H%M%S')}.{fmt}"
+
+
+def _detect_format(path: Path) -> str:
+    """확장자로 형식 판별"""
+    fmt = path.suffix.lstrip(".").lower()
+    if fmt not in FORMATS:
+        raise ValueError(f"지원하지 않는 형식입니다: {path.name} (jsonl, csv만 가능)")
+    return fmt
+
+
+async def export_profiles(
+    pool: ConnectionPool,
+    path: Path,
+    batch_size: int = TRANSFER_BATCH_SIZE,
+) -> int:
+    """프로필을 파일로 내보내고 행 수 반환 (fetchmany로 나눠 읽음)"""
+    fmt = _detect_format(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+
+    count = 0
+    try:
+        with open(tmp_path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=FIELDS) if fmt == "csv" else None
+            if writer:
+                writer.writeheader()
+
+            # 하나의 읽기 연결에서 실행되므로 WAL 스냅샷 기준으로 일관된 결과
+            async with pool.reader() as db:
+                async with db.execute(_EXPORT_QUERY) as cursor:
+                    while rows := await cursor.fetchmany(batch_size):
+                        for row in rows:
+                            if writer:
+                                writer.writerow(dict(row))
+                            else:
+                                f.write(json.dumps(dict(row), ensure_ascii=False) + "\n")
+                        count += len(rows)
+        tmp_path.replace(path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+    return count
+
+
+def _read_records(path: Path, fmt: str) -> Iterator[Any]:
+    """파일에서 레코드를 한 줄씩 읽음 (해석할 수 없는 줄은 None)"""
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        if fmt == "csv":
+            yield from csv.DictReader(f)
+            return
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                yield None
+
+
+def _normalize(record: dict[str, Any]) -> dict[str, Any] | None:
+    """레코드 검증 및 정규화 (잘못된 행은 None)"""
+    def text(key: str) -> str | None:
+        value = record.get(key)
+        if value is None or value == "":
+            return None
+        return str(value)
+
+    try:
+        user_id = int(record["user_id"])
+        warning_count = int(record.get("warning_count") or 0)
+    except (KeyError, TypeError, ValueError):
+        return None
+
+    username = text("username")
+    if not username:
+        return None
+
+    now = datetime.now().isoformat()
+    return {
+        "user_id": user_id,
+        "username": username,
+        "display_name": text("display_name") or username,
+        "birth_year": text("birth_year"),
+        "gender": text("gender"),
+        "region": text("region"),
+        "registered_at": text("registered_at"),
+        "updated_at": text("updated_at") or now,
+        "warning_count": max(0, warning_count),
+        "admin_memo": text("admin_memo") or "",
+        "admin_updated_at": text("admin_updated_at") or now,
+    }
+
+
+async def _apply_batch(pool: ConnectionPool, batch: list[dict[str, Any]]) -> None:
+    """배치를 하나의 트랜잭션으로 반영"""
+    async with pool.writer() as db:
+        await db.executemany(_UPSERT_PROFILE, batch)
+        await db.executemany(_UPSERT_ADMIN, batch)
+
+
+async def import_profiles(
+    pool: ConnectionPool,
+    path: Path,
+    batch_size: int = TRANSFER_BATCH_SIZE,
+) -> tuple[int, int]:
+    """파일에서 프로필을 가져오고 (반영 행 수, 건너뛴 행 수) 반환"""
+    fmt = _detect_format(path)
+    imported = skipped = 0
+    batch: list[dict[str, Any]] = []
+
+    for record in _read_records(path, fmt):
+        row = _normalize(record) if isinstance(record, dict) else None
+        if row is None:
+            skipped += 1
+            continue
+
+        batch.append(row)
+        if len(batch) >= batch_size:
+            await _apply_batch(pool, batch)
+            imported += len(batch)
+            batch = []
+
+    if batch:
+        await _apply_batch(pool, batch)
+        imported += len(batch)
+
+    return imported, skipped
+
+
+async def _main(argv: list[str] | None = None) -> None:
+    """오프라인 실행 진입점"""
+    parser = argparse.ArgumentParser(prog="python -m utils.data_transfer", description="프로필 데이터 내보내기/가져오기")
+    parser.add_argument("action", choices=("export", "import"))
+    parser.add_argument("path", type=Path, nargs="?", help="대상 파일 (.jsonl 또는 .csv)")
+    parser.add_argument("--db", type=Path, default=DATA_DIR / "stack_bot.db", help="데이터베이스 경로")
+    parser.add_argument("--batch-size", type=int, default=TRANSFER_BATCH_SIZE)
+    args = parser.parse_args(argv)
+
+    if args.action == "import" and args.path is None:
+        parser.error("가져올 파일 경로가 필요합니다")
+
+    pool = ConnectionPool(args.db, readers=1)
+    await pool.open()
+    try:
+        await migrate(pool)
+        if args.action == "export":
+            path = args.path or default_export_path("jsonl")
+            count = await export_profiles(pool, path, args.batch_size)
+            print(f"{count}개 프로필을 {path}에 내보냈습니다.")
+        else:
+            imported, skipped = await import_profiles(pool, args.path, args.batch_size)
+            print(f"{imported}개 프로필을 가져왔습니다. (건너뜀: {skipped}개)")
+    finally:
+        await pool.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
@@ -0,0 +1,200 @@
+"""SQLite 연결 풀"""
+from __future__ import annotations
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, AsyncIterator
+
+import aiosqlite
+
+from .constants import DB_BUSY_TIMEOUT_MS, DB_CACHE_SIZE_KB, DB_MMAP_SIZE, DB_READER_POOL_SIZE
+from .metrics import QueryMetrics
+
+__all__ = ["ConnectionPool"]
+
+logger = logging.getLogger(__name__)
+
+
+async def _pragma(conn: aiosqlite.Connection, statement: str) -> None:
+    """PRAGMA 실행 (결과 행이 남아 잠금을 잡지 않도록 커서를 바로 닫음)"""
+    async with conn.execute(f"PRAGMA {statement}"):
+        pass
+
+
+class _TimedStatement:
+    """실행 시간을 기록하는 execute 결과 (await와 async with 모두 지원)"""
+
+    __slots__ = ("_result", "_sql", "_parameters", "_many", "_metrics", "_cursor")
+
+    def __init__(self, result: Any, sql: str, parameters: Any, many: bool, metrics: QueryMetrics):
+        self._result = result
+        self._sql = sql
+        self._parameters = parameters
+        self._many = many
+        self._metrics = metrics
+        self._cursor: aiosqlite.Cursor | None = None
+
+    async def _run(self) -> aiosqlite.Cursor:
+        started = time.perf_counter()
+        try:
+            return await self._result
+        finally:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            self._metrics.record_statement(self._sql, self._parameters, elapsed_ms, self._many)
+
+    def __await__(self):
+        return self._run().__await__()
+
+    async def __aenter__(self) -> aiosqlite.Cursor:
+        self._cursor = await self._run()
+        return self._cursor
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        if self._cursor is not None:
+            await self._cursor.close()
+
+
+class _TimedConnection:
+    """execute/executemany 실행 시간을 기록하는 연결 래퍼 (나머지는 그대로 위임)"""
+
+    __slots__ = ("_conn", "_metrics")
+
+    def __init__(self, conn: aiosqlite.Connection, metrics: QueryMetrics):
+        self._conn = conn
+        self._metrics = metrics
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._conn, name)
+
+    def execute(self, sql: str, parameters: Any = None) -> _TimedStatement:
+        return _TimedStatement(self._conn.execute(sql, parameters), sql, parameters, False, self._metrics)
+
+    def executemany(self, sql: str, parameters: Any) -> _TimedStatement:
+        return _TimedStatement(self._conn.executemany(sql, parameters), sql, parameters, True, self._metrics)
+
+
+class ConnectionPool:
+    """쓰기 연결 1개와 읽기 연결 N개를 유지하는 aiosqlite 연결 풀
+
+    WAL 모드에서는 읽기와 쓰기가 서로를 막지 않으므로, 쓰기는 하나의 연결로
+    직렬화하고 읽기는 여러 연결에 분산합니다.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        readers: int = DB_READER_POOL_SIZE,
+        metrics: QueryMetrics | None = None,
+    ):
+        self.db_path = db_path
+        self.reader_count = max(1, readers)
+        self.metrics = metrics
+        self._writer: aiosqlite.Connection | None = None
+        self._readers: list[aiosqlite.Connection] = []
+        self._idle: asyncio.Queue[aiosqlite.Connection] | None = None
+        self._write_lock = asyncio.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        """연결 풀이 열려 있는지 여부"""
+        return self._writer is not None
+
+    async def _connect(self) -> aiosqlite.Connection:
+        """연결 생성 및 PRAGMA 튜닝"""
+        conn = await aiosqlite.connect(self.db_path)
+        conn.row_factory = aiosqlite.Row
+        await _pragma(conn, f"busy_timeout = {DB_BUSY_TIMEOUT_MS}")
+        await _pragma(conn, "synchronous = NORMAL")
+        await _pragma(conn, f"cache_size = -{DB_CACHE_SIZE_KB}")
+        await _pragma(conn, f"mmap_size = {DB_MMAP_SIZE}")
+        await _pragma(conn, "temp_store = MEMORY")
+        return conn
+
+    async def open(self) -> None:
+        """쓰기/읽기 연결 열기"""
+        if self.is_open:
+            return
+
+        opened: list[aiosqlite.Connection] = []
+        try:
+            writer = await self._connect()
+            opened.append(writer)
+            # journal_mode는 파일에 저장되므로 쓰기 연결에서 한 번만 설정
+            await _pragma(writer, "journal_mode = WAL")
+
+            readers = []
+            for _ in range(self.reader_count):
+                readers.append(await self._connect())
+                opened.append(readers[-1])
+        except BaseException:
+            # 일부만 열린 연결의 워커 스레드가 남지 않도록 정리
+            for conn in opened:
+                await conn.close()
+            raise
+
+        idle: asyncio.Queue[aiosqlite.Connection] = asyncio.Queue()
+        for conn in readers:
+            idle.put_nowait(conn)
+
+        self._writer = writer
+        self._readers = readers
+        self._idle = idle
+
+    async def close(self) -> None:
+        """모든 연결 닫기"""
+        if not self.is_open:
+            return
+
+        async with self._write_lock:
+            writer = self._writer
+            self._writer = None
+            try:
+                await _pragma(writer, "optimize")
+            except Exception as e:
+                logger.warning(f"PRAGMA optimize 실패: {e}")
+            await writer.close()
+
+        for conn in self._readers:
+            await conn.close()
+        self._readers = []
+        self._idle = None
+
+    def _wrap(self, conn: aiosqlite.Connection) -> aiosqlite.Connection:
+        """metrics가 있으면 SQL 실행 시간을 기록하는 래퍼로 감쌈"""
+        if self.metrics is None:
+            return conn
+        return _TimedConnection(conn, self.metrics)  # type: ignore[return-value]
+    
+    @asynccontextmanager
+    async def reader(self) -> AsyncIterator[aiosqlite.Connection]:
+        """읽기 연결 대여"""
+        if self._idle is None:
+            raise RuntimeError("연결 풀이 열려 있지 않습니다")
+
+        idle = self._idle
+        conn = await idle.get()
+        try:
+            yield self._wrap(conn)
+        finally:
+            idle.put_nowait(conn)
+
+    @asynccontextmanager
+    async def writer(self) -> AsyncIterator[aiosqlite.Connection]:
+        """쓰기 연결 대여 (정상 종료 시 커밋, 예외 시 롤백)"""
+        if self._writer is None:
+            raise RuntimeError("연결 풀이 열려 있지 않습니다")
+
+        async with self._write_lock:
+            # 락을 기다리는 동안 close()가 실행됐을 수 있음
+            conn = self._writer
+            if conn is None:
+                raise RuntimeError("연결 풀이 열려 있지 않습니다")
+            try:
+                yield self._wrap(conn)
+            except BaseException:
+                await conn.rollback()
+                raise
+            else:
+                await conn.commit()
@@ -0,0 +1,116 @@
+"""입장 급증(레이드) 감지 및 집계"""
+from __future__ import annotations
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+
+from .constants import JOIN_BURST_THRESHOLD, JOIN_BURST_WINDOW
+
+__all__ = ["ACCOUNT_AGE_BUCKETS", "BurstSummary", "JoinBurstDetector"]
+
+# (표시 이름, 상한) - 마지막 버킷은 상한 없음
+ACCOUNT_AGE_BUCKETS: tuple[tuple[str, timedelta | None], ...] = (
+    ("1시간 미만", timedelta(hours=1)),
+    ("1일 미만", timedelta(days=1)),
+    ("7일 미만", timedelta(days=7)),
+    ("30일 미만", timedelta(days=30)),
+    ("1년 미만", timedelta(days=365)),
+    ("1년 이상", None),
+)
+
+
+@dataclass(slots=True)
+class BurstSummary:
+    """집계 기간 동안의 입장/퇴장"""
+
+    guild_id: int
+    started_at: datetime
+    joins: list[tuple[int, str, datetime]] = field(default_factory=list)  # (ID, 이름, 계정 생성일)
+    leaves: list[tuple[int, str]] = field(default_factory=list)
+    final: bool = False  # 이 요약으로 집계 모드 종료
+
+    def age_histogram(self, now: datetime | None = None) -> list[tuple[str, int]]:
+        """계정 나이 분포"""
+        now = now or datetime.now(timezone.utc)
+        counts = [0] * len(ACCOUNT_AGE_BUCKETS)
+        for _, _, created_at in self.joins:
+            age = now - created_at
+            for index, (_, limit) in enumerate(ACCOUNT_AGE_BUCKETS):
+                if limit is None or age < limit:
+                    counts[index] += 1
+                    break
+        return [(label, count) for (label, _), count in zip(ACCOUNT_AGE_BUCKETS, counts)]
+
+
+class _GuildBurst:
+    __slots__ = ("recent", "summary")
+
+    def __init__(self):
+        self.recent: deque[float] = deque()  # 최근 window초 안의 입장 시각
+        self.summary: BurstSummary | None = None  # 집계 모드일 때만 존재
+
+
+class JoinBurstDetector:
+    """서버별 슬라이딩 윈도우 입장 속도 감지
+
+    window초 안의 입장이 threshold명 이상이면 집계 모드로 전환하고, 그동안의
+    입장/퇴장은 개별 로그 대신 요약에 모읍니다. take_summary 시점에 입장 속도가
+    threshold 아래로 떨어졌으면 마지막 요약(final)과 함께 집계 모드를 끝냅니다.
+    """
+
+    def __init__(self, threshold: int = JOIN_BURST_THRESHOLD, window: float = JOIN_BURST_WINDOW):
+        self.threshold = max(2, threshold)
+        self.window = window
+        self._guilds: dict[int, _GuildBurst] = {}
+        self.bursts = 0
+
+    def _recent_count(self, state: _GuildBurst, now: float) -> int:
+        while state.recent and state.recent[0] <= now - self.window:
+            state.recent.popleft()
+        return len(state.recent)
+
+    def record_join(self, guild_id: int, user_id: int, name: str, created_at: datetime) -> tuple[bool, bool]:
+        """입장 기록 → (집계됨 여부, 이번 입장으로 집계 모드가 시작됐는지)"""
+        state = self._guilds.get(guild_id)
+        if state is None:
+            state = self._guilds[guild_id] = _GuildBurst()
+        now = time.monotonic()
+        state.recent.append(now)
+        started = False
+        if state.summary is None and self._recent_count(state, now) >= self.threshold:
+            state.summary = BurstSummary(guild_id, datetime.now(timezone.utc))
+            self.bursts += 1
+            started = True
+        if state.summary is None:
+            return False, False
+        state.summary.joins.append((user_id, name, created_at))
+        return True, started
+
+    def record_leave(self, guild_id: int, user_id: int, name: str) -> bool:
+        """퇴장 기록 (집계 모드일 때만 True)"""
+        state = self._guilds.get(guild_id)
+        if state is None or state.summary is None:
+            return False
+        state.summary.leaves.append((user_id, name))
+        return True
+
+    def is_active(self, guild_id: int) -> bool:
+        state = self._guilds.get(guild_id)
+        return bool(state and state.summary)
+
+    def take_summary(self, guild_id: int) -> BurstSummary | None:
+        """지금까지 모은 요약을 꺼내고 다음 기간을 시작 (입장이 잦아들었으면 종료)"""
+        state = self._guilds.get(guild_id)
+        if state is None or state.summary is None:
+            return None
+        summary = state.summary
+        if self._recent_count(state, time.monotonic()) < self.threshold:
+            summary.final = True
+            state.summary = None
+        else:
+            state.summary = BurstSummary(guild_id, datetime.now(timezone.utc))
+        return summary
+
+    def active_guilds(self) -> list[int]:
+        return [guild_id for guild_id, state in self._guilds.items() if state.summary]
@@ -0,0 +1,364 @@
+"""서버별 로그 묶음 전송"""
+from __future__ import annotations
+import asyncio
+import io
+import json
+import logging
+import time
+from collections import deque
+from typing import Any
+
+import aiohttp
+import discord
+
+from .constants import (
+    LOG_BATCH_SIZE,
+    LOG_CLOSE_TIMEOUT,
+    LOG_EMBED_CHAR_LIMIT,
+    LOG_FLUSH_INTERVAL,
+    LOG_RETRY_BASE,
+    LOG_RETRY_MAX,
+)
+from .log_spool import LogSpool, SpoolEntry
+from .rest_scheduler import Priority
+
+__all__ = ["LogDispatcher", "LogSlot"]
+
+logger = logging.getLogger(__name__)
+
+
+class LogSlot:
+    """reserve()로 순서를 먼저 잡아 둔 로그 자리 (fill 또는 cancel로 한 번만 채움)"""
+
+    __slots__ = ("guild_id", "payload", "done")
+
+    def __init__(self, guild_id: int):
+        self.guild_id = guild_id
+        self.payload: tuple[str, str | None, bytes | None] | None = None
+        self.done = False
+
+
+class _GuildQueue:
+    """서버 하나의 전송 상태와 통계 (로그 자체는 스풀에 있음)"""
+
+    __slots__ = (
+        "pending", "slots", "draining", "ready", "full", "wake", "task", "failures", "retry_at",
+        "last_error", "sent_messages", "sent_embeds", "dropped", "failed", "retries",
+    )
+
+    def __init__(self):
+        self.pending = 0
+        self.slots: deque[LogSlot] = deque()  # 스풀에 기록되기 전의 로그 (들어온 순서)
+        self.draining = False
+        self.ready = asyncio.Event()
+        self.full = asyncio.Event()
+        self.wake = asyncio.Event()
+        self.task: asyncio.Task | None = None
+        self.failures = 0  # 연속 실패 횟수 (백오프 계산)
+        self.retry_at: float | None = None
+        self.last_error: str | None = None
+        self.sent_messages = 0
+        self.sent_embeds = 0
+        self.dropped = 0
+        self.failed = 0
+        self.retries = 0
+
+
+class LogDispatcher:
+    """로그 embed를 서버별로 모아 메시지당 최대 10개씩 전송
+
+    로그는 먼저 LogSpool(디스크)에 기록되고, 서버마다 작업자 하나가 스풀을
+    오래된 순으로 읽어 보내므로 같은 서버 안에서는 순서가 유지됩니다. 내용을
+    만들기 전에 기다릴 일이 있는 로그(삭제자 확인 등)는 reserve로 자리를 먼저
+    잡아 두면, 뒤에 들어온 로그가 그 자리를 앞지르지 않습니다. 첫 로그
+    이후 flush 간격 동안 더 모으고, 10개가 차면 바로 보냅니다. 첨부 파일이
+    있는 로그는 파일 하나당 메시지 하나로 끊어서 보냅니다.
+
+    전송에 성공한 항목만 스풀에서 삭제(ack)합니다. 채널이 없거나 권한이 없거나
+    Discord가 5xx/429를 돌려주면 지수 백오프로 재시도하고, 복구되면 밀린
+    로그를 묶음 단위로 다시 보냅니다. 재시작 후에도 남은 로그를 이어서 보냅니다.
+    """
+
+    def __init__(
+        self,
+        bot: discord.Bot,
+        spool: LogSpool | None = None,
+        interval: float = LOG_FLUSH_INTERVAL,
+        batch_size: int = LOG_BATCH_SIZE,
+    ):
+        self.bot = bot
+        self.spool = spool or LogSpool()
+        self.interval = interval
+        self.batch_size = max(1, min(batch_size, 10))
+        self._queues: dict[int, _GuildQueue] = {}
+        self._closing = False
+
+    def _state(self, guild_id: int) -> _GuildQueue:
+        state = self._queues.get(guild_id)
+        if state is None:
+            state = self._queues[guild_id] = _GuildQueue()
+        return state
+
+    def _ensure_worker(self, guild_id: int, state: _GuildQueue) -> None:
+        state.ready.set()
+        if state.pending >= self.batch_size:
+            state.full.set()
+        if state.task is None or state.task.done():
+            state.task = asyncio.create_task(self._run(guild_id, state), name=f"log-dispatch-{guild_id}")
+
+    async def start(self) -> None:
+        """스풀을 열고 이전 실행에서 남은 로그 재전송 시작"""
+        await self.spool.open()
+        backlog = await self.spool.pending_counts()
+        for guild_id, count in backlog.items():
+            state = self._state(guild_id)
+            state.pending = count
+            self._ensure_worker(guild_id, state)
+        if backlog:
+            logger.info(f"로그 스풀에 남은 로그 {sum(backlog.values())}개 재전송 시작")
+
+    def reserve(self, guild_id: int) -> LogSlot:
+        """로그 순서를 먼저 잡아 둠 (내용은 fill로 채우고, 보내지 않으면 cancel)
+
+        앞의 자리가 채워지거나 취소될 때까지 뒤의 로그는 스풀에 기록하지 않습니다.
+        """
+        slot = LogSlot(guild_id)
+        self._state(guild_id).slots.append(slot)
+        return slot
+
+    async def submit(self, guild_id: int, embed: discord.Embed, file: discord.File | None = None) -> bool:
+        """로그를 순서대로 스풀에 기록하고 전송 예약 (종료 중이면 False)"""
+        return await self.fill(self.reserve(guild_id), embed, file)
+
+    async def fill(self, slot: LogSlot, embed: discord.Embed, file: discord.File | None = None) -> bool:
+        """잡아 둔 자리에 로그를 채움 (종료 중이거나 이미 채운/취소된 자리면 False)"""
+        state = self._state(slot.guild_id)
+        filename = attachment = None
+        if file:
+            filename = file.filename
+            attachment = file.fp.read()
+            file.close()
+        if slot.done:  # 종료 시 취소된 자리 (이미 버림으로 집계)
+            return False
+        if self._closing:
+            state.dropped += 1
+            await self.cancel(slot)
+            return False
+
+        slot.payload = (json.dumps(embed.to_dict(), ensure_ascii=False), filename, attachment)
+        slot.done = True
+        await self._drain(slot.guild_id, state)
+        return True
+
+    async def cancel(self, slot: LogSlot) -> None:
+        """채우지 않은 자리 반납 (이미 채웠거나 취소했으면 무시)"""
+        if slot.done:
+            return
+        slot.done = True
+        await self._drain(slot.guild_id, self._state(slot.guild_id))
+
+    async def _drain(self, guild_id: int, state: _GuildQueue) -> None:
+        """앞에서부터 채워진 자리를 순서대로 스풀에 기록 (서버당 하나만 실행)"""
+        if state.draining:
+            return
+        state.draining = True
+        try:
+            while state.slots and state.slots[0].done:
+                slot = state.slots.popleft()
+                if slot.payload is not None:
+                    await self._append(guild_id, state, *slot.payload)
+        finally:
+            state.draining = False
+
+    async def _append(
+        self, guild_id: int, state: _GuildQueue, payload: str, filename: str | None, attachment: bytes | None
+    ) -> None:
+        if not self.spool.is_open:
+            state.dropped += 1
+            return
+
+        try:
+            evicted = await self.spool.append(guild_id, payload, filename, attachment)
+        except Exception as e:
+            state.dropped += 1
+            logger.error(f"로그 스풀 기록 실패: {guild_id} - {e}")
+            return
+
+        # 스풀 용량 초과로 다른 서버의 오래된 로그가 삭제됐을 수 있음
+        for evicted_guild, count in evicted.items():
+            evicted_state = self._state(evicted_guild)
+            evicted_state.pending = max(0, evicted_state.pending - count)
+            evicted_state.dropped += count
+
+        state.pending += 1
+        self._ensure_worker(guild_id, state)
+
+    def resume(self, guild_id: int) -> None:
+        """재시도 대기 중인 서버의 로그를 바로 다시 전송 (로그 채널 변경 시)"""
+        state = self._queues.get(guild_id)
+        if state and state.pending and not self._closing:
+            state.failures = 0
+            state.wake.set()
+            self._ensure_worker(guild_id, state)
+
+    async def close(self, timeout: float = LOG_CLOSE_TIMEOUT) -> None:
+        """남은 로그 전송을 시도하고 종료 (못 보낸 로그는 스풀에 남음)"""
+        self._closing = True
+        # 삭제자 확인 등으로 아직 채워지지 않은 자리는 버리고, 그 뒤에 밀린 로그를 기록
+        for guild_id, state in list(self._queues.items()):
+            for slot in state.slots:
+                if not slot.done:
+                    slot.done = True
+                    state.dropped += 1
+            await self._drain(guild_id, state)
+
+        tasks = []
+        for state in self._queues.values():
+            state.full.set()
+            state.ready.set()
+            state.wake.set()
+            if state.task and not state.task.done():
+                tasks.append(state.task)
+
+        if tasks:
+            done, pending = await asyncio.wait(tasks, timeout=timeout)
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+                logger.warning(f"로그 전송 종료 시간 초과: {len(pending)}개 서버의 로그는 다음 실행 때 전송합니다")
+        await self.spool.close()
+
+    def _take_batch(self, entries: list[SpoolEntry]) -> list[tuple[SpoolEntry, discord.Embed]]:
+        """메시지 하나에 담을 로그 (embed 개수/전체 글자 수 제한, 첨부 파일은 1개)"""
+        batch: list[tuple[SpoolEntry, discord.Embed]] = []
+        total = 0
+        for entry in entries[:self.batch_size]:
+            embed = discord.Embed.from_dict(json.loads(entry.payload))
+            size = len(embed)
+            if batch and total + size > LOG_EMBED_CHAR_LIMIT:
+                break
+            batch.append((entry, embed))
+            total += size
+            if entry.attachment is not None:
+                break
+        return batch
+
+    async def _run(self, guild_id: int, state: _GuildQueue) -> None:
+        """서버 대기열 작업자"""
+        while True:
+            await state.ready.wait()
+            if state.pending < self.batch_size and not self._closing:
+                state.full.clear()
+                try:
+                    await asyncio.wait_for(state.full.wait(), self.interval)
+                except asyncio.TimeoutError:
+                    pass
+
+            while state.pending > 0:
+                try:
+                    entries = await self.spool.peek(guild_id, self.batch_size)
+                    if not entries:
+                        state.pending = 0
+                        break
+                    if await self._deliver(guild_id, state, self._take_batch(entries)):
+                        state.failures = 0
+                        continue
+                except Exception as e:
+                    # 스풀 조회/확인 실패, 임베드 복원 실패 등으로 작업자가 멈추지 않게 함
+                    state.retries += 1
+                    state.last_error = f"{type(e).__name__}: {e}"
+                    logger.error(f"로그 전송 작업자 오류: {guild_id} - {state.last_error}", exc_info=e)
+
+                # 실패한 로그는 스풀에 남겨 두고 백오프 후 재시도
+                if self._closing:
+                    return
+                state.failures += 1
+                delay = min(LOG_RETRY_BASE * 2 ** (state.failures - 1), LOG_RETRY_MAX)
+                state.retry_at = time.monotonic() + delay
+                state.wake.clear()
+                try:
+                    await asyncio.wait_for(state.wake.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+                state.retry_at = None
+            state.ready.clear()
+            if self._closing:
+                return
+
+    async def _ack(self, state: _GuildQueue, entries: list[SpoolEntry]) -> None:
+        state.pending = max(0, state.pending - await self.spool.ack([entry.id for entry in entries]))
+
+    async def _deliver(
+        self, guild_id: int, state: _GuildQueue, batch: list[tuple[SpoolEntry, discord.Embed]]
+    ) -> bool:
+        """로그 채널로 전송 (처리가 끝났으면 True, 재시도가 필요하면 False)"""
+        entries = [entry for entry, _ in batch]
+        guild = self.bot.get_guild(guild_id)
+        log_channel_id = await self.bot.data_manager.get_log_channel(guild_id) if guild else None
+        if not log_channel_id:
+            # 서버를 나갔거나 로그 채널 설정이 해제됨: 보낼 곳이 없으므로 폐기
+            await self._ack(state, entries)
+            state.dropped += len(entries)
+            return True
+
+        channel = guild.get_channel(log_channel_id)
+        if channel is None:
+            return await self._retry_later(state, entries, "로그 채널을 찾을 수 없음")
+
+        kwargs: dict[str, Any] = {"embeds": [embed for _, embed in batch]}
+        files = [
+            discord.File(io.BytesIO(entry.attachment), filename=entry.filename or "log.txt")
+            for entry in entries if entry.attachment is not None
+        ]
+        if files:
+            kwargs["files"] = files
+        try:
+            await self.bot.rest_scheduler.submit(Priority.BACKGROUND, f"channel:{channel.id}", channel.send, **kwargs)
+        except discord.HTTPException as e:
+            if isinstance(e, discord.Forbidden) or e.status == 429 or e.status >= 500:
+                return await self._retry_later(state, entries, f"{e.status} {e.text}")
+            # 잘못된 요청은 다시 보내도 실패하므로 폐기
+            await self._ack(state, entries)
+            state.failed += len(entries)
+            logger.error(f"로그 전송 실패: {guild_id} - {e}")
+            return True
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            return await self._retry_later(state, entries, f"{type(e).__name__}: {e}")
+
+        await self._ack(state, entries)
+        state.sent_messages += 1
+        state.sent_embeds += len(entries)
+        state.last_error = None
+        return True
+
+    async def _retry_later(self, state: _GuildQueue, entries: list[SpoolEntry], reason: str) -> bool:
+        """실패 기록 (항목은 스풀에 남김)"""
+        state.retries += 1
+        state.last_error = reason
+        await self.spool.mark_attempt([entry.id for entry in entries])
+        if state.failures == 0:
+            logger.warning(f"로그 전송 실패, 재시도 예정: {reason}")
+        return False
+
+    def stats(self, guild_id: int | None = None) -> dict[str, Any]:
+        """대기 로그 수와 전송/버림/재시도 통계 (guild_id가 없으면 전체 합계)"""
+        states = [self._queues[guild_id]] if guild_id in self._queues else []
+        if guild_id is None:
+            states = list(self._queues.values())
+        now = time.monotonic()
+        retry_in = [state.retry_at - now for state in states if state.retry_at]
+        return {
+            "queued": sum(state.pending for state in states),
+            "reserved": sum(len(state.slots) for state in states),
+            "sent_messages": sum(state.sent_messages for state in states),
+            "sent_embeds": sum(state.sent_embeds for state in states),
+            "dropped": sum(state.dropped for state in states),
+            "failed": sum(state.failed for state in states),
+            "retries": sum(state.retries for state in states),
+            "retrying": len(retry_in),
+            "retry_in": max(0.0, min(retry_in)) if retry_in else None,
+            "last_error": next((state.last_error for state in states if state.last_error), None),
+            "guilds": len(states),
+            "spool_bytes": self.spool.size_bytes,
+        }
@@ -0,0 +1,174 @@
+"""로그 전송 전 디스크에 보관하는 스풀 (SQLite)"""
+from __future__ import annotations
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+import aiosqlite
+
+from .constants import DATA_DIR, DB_BUSY_TIMEOUT_MS, LOG_SPOOL_COMPACT_PAGES, LOG_SPOOL_MAX_BYTES
+
+__all__ = ["LOG_SPOOL_PATH", "LogSpool", "SpoolEntry"]
+
+logger = logging.getLogger(__name__)
+
+LOG_SPOOL_PATH = DATA_DIR / "log_spool.db"
+
+
+@dataclass(frozen=True, slots=True)
+class SpoolEntry:
+    """전송 대기 중인 로그 하나"""
+
+    id: int
+    guild_id: int
+    payload: str  # Embed.to_dict() JSON
+    filename: str | None
+    attachment: bytes | None
+    attempts: int
+
+
+class LogSpool:
+    """서버별 로그 대기열을 SQLite 테이블 하나에 보관
+
+    로그는 전송 전에 기록되고 전송에 성공한 항목만 삭제(ack)되므로, 로그
+    채널이 없어졌거나 Discord 오류가 나도 봇을 재시작해도 남아 있습니다.
+    전체 크기가 max_bytes를 넘으면 가장 오래된 항목부터 버리고, 전송/버림으로
+    생긴 빈 페이지가 쌓이면 incremental_vacuum으로 파일에서 반환합니다.
+    """
+
+    def __init__(self, path: Path = LOG_SPOOL_PATH, max_bytes: int = LOG_SPOOL_MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.size_bytes = 0
+        self.evicted = 0
+        self._conn: aiosqlite.Connection | None = None
+
+    @property
+    def is_open(self) -> bool:
+        return self._conn is not None
+
+    async def open(self) -> None:
+        """스풀 열기 (auto_vacuum은 테이블 생성 전에 설정해야 적용됨)"""
+        if self._conn:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = await aiosqlite.connect(self.path, isolation_level=None)
+        try:
+            for pragma in (
+                f"busy_timeout = {DB_BUSY_TIMEOUT_MS}",
+                "auto_vacuum = INCREMENTAL",
+                "journal_mode = WAL",
+                "synchronous = NORMAL",
+            ):
+                async with conn.execute(f"PRAGMA {pragma}"):
+                    pass
+            await conn.execute("""
+                CREATE TABLE IF NOT EXISTS log_spool (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    guild_id INTEGER NOT NULL,
+                    created_at TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    filename TEXT,
+                    attachment BLOB,
+                    size INTEGER NOT NULL,
+                    attempts INTEGER NOT NULL DEFAULT 0
+                )
+            """)
+            await conn.execute("CREATE INDEX IF NOT EXISTS idx_log_spool_guild ON log_spool(guild_id, id)")
+            async with conn.execute("SELECT COALESCE(SUM(size), 0) FROM log_spool") as cursor:
+                self.size_bytes = (await cursor.fetchone())[0]
+        except BaseException:
+            await conn.close()
+            raise
+        self._conn = conn
+
+    async def close(self) -> None:
+        if self._conn:
+            await self._conn.close()
+            self._conn = None
+
+    async def pending_counts(self) -> dict[int, int]:
+        """서버별 남은 로그 수 (재시작 후 재전송용)"""
+        async with self._conn.execute(
+            "SELECT guild_id, COUNT(*) FROM log_spool GROUP BY guild_id"
+        ) as cursor:
+            return {guild_id: count for guild_id, count in await cursor.fetchall()}
+
+    async def append(
+        self, guild_id: int, payload: str, filename: str | None = None, attachment: bytes | None = None
+    ) -> dict[int, int]:
+        """로그 기록 후 용량 초과로 버린 항목 수를 서버별로 반환"""
+        size = len(payload.encode()) + (len(attachment) if attachment else 0)
+        await self._conn.execute(
+            """
+            INSERT INTO log_spool (guild_id, created_at, payload, filename, attachment, size)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            (guild_id, datetime.now().isoformat(), payload, filename, attachment, size),
+        )
+        self.size_bytes += size
+        if self.size_bytes <= self.max_bytes:
+            return {}
+        return await self._evict()
+
+    async def _evict(self) -> dict[int, int]:
+        """용량 상한의 90%까지 오래된 항목 삭제"""
+        target = int(self.max_bytes * 0.9)
+        evicted: dict[int, int] = {}
+        while self.size_bytes > target:
+            async with self._conn.execute(
+                "DELETE FROM log_spool WHERE id IN (SELECT id FROM log_spool ORDER BY id LIMIT 100) "
+                "RETURNING guild_id, size"
+            ) as cursor:
+                rows = await cursor.fetchall()
+            if not rows:
+                break
+            for guild_id, size in rows:
+                evicted[guild_id] = evicted.get(guild_id, 0) + 1
+                self.size_bytes -= size
+        self.evicted += sum(evicted.values())
+        logger.warning(f"로그 스풀 용량 초과: 오래된 로그 {sum(evicted.values())}개 삭제")
+        await self.compact()
+        return evicted
+
+    async def peek(self, guild_id: int, limit: int) -> list[SpoolEntry]:
+        """서버의 가장 오래된 로그부터 limit개"""
+        async with self._conn.execute(
+            """
+            SELECT id, guild_id, payload, filename, attachment, attempts
+            FROM log_spool WHERE guild_id = ? ORDER BY id LIMIT ?
+            """,
+            (guild_id, limit),
+        ) as cursor:
+            return [SpoolEntry(*row) for row in await cursor.fetchall()]
+
+    async def ack(self, ids: list[int]) -> int:
+        """전송(또는 폐기)된 항목 삭제, 실제로 삭제된 수 반환 (빈 페이지가 쌓였으면 정리)"""
+        if not ids:
+            return 0
+        placeholders = ",".join("?" * len(ids))
+        async with self._conn.execute(
+            f"DELETE FROM log_spool WHERE id IN ({placeholders}) RETURNING size", ids
+        ) as cursor:
+            rows = await cursor.fetchall()
+        self.size_bytes -= sum(size for size, in rows)
+        await self.compact()
+        return len(rows)
+
+    async def mark_attempt(self, ids: list[int]) -> None:
+        """전송 실패 횟수 증가"""
+        if not ids:
+            return
+        placeholders = ",".join("?" * len(ids))
+        await self._conn.execute(
+            f"UPDATE log_spool SET attempts = attempts + 1 WHERE id IN ({placeholders})", ids
+        )
+
+    async def compact(self) -> None:
+        """빈 페이지가 많으면 파일 크기 줄이기"""
+        async with self._conn.execute("PRAGMA freelist_count") as cursor:
+            free_pages = (await cursor.fetchone())[0]
+        if free_pages >= LOG_SPOOL_COMPACT_PAGES:
+            # 한 단계에 한 페이지씩 반환되며 결과 행이 없어 execute로는 한 단계만 실행됨
+            await self._conn.executescript("PRAGMA incremental_vacuum;")
@@ -2,6 +2,9 @@
 from __future__ import annotations
 import logging
 import sys
+from logging.handlers import RotatingFileHandler
+
+from .constants import DATA_DIR
 
 
 def configure_logging(level: int = logging.INFO) -> None:
@@ -17,3 +20,14 @@ def configure_logging(level: int = logging.INFO) -> None:
     logging.getLogger("discord.http").setLevel(logging.WARNING)
     logging.getLogger("discord.gateway").setLevel(logging.WARNING)
     logging.getLogger("discord.client").setLevel(logging.WARNING)
+    
+    # 느린 쿼리는 별도 파일에만 기록 (SQL 리터럴과 파라미터 값은 가려진 상태)
+    log_dir = DATA_DIR / "logs"
+    log_dir.mkdir(parents=True, exist_ok=True)
+    slow_handler = RotatingFileHandler(
+        log_dir / "slow_query.log", maxBytes=5 * 1024 * 1024, backupCount=3, encoding="utf-8"
+    )
+    slow_handler.setFormatter(logging.Formatter("%(asctime)s %(message)s", datefmt="%Y-%m-%d %H:%M:%S"))
+    slow_logger = logging.getLogger("slow_query")
+    slow_logger.addHandler(slow_handler)
+    slow_logger.propagate = False
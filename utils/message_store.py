@@ -0,0 +1,182 @@
+"""최근 메시지 내용 저장소 (raw 삭제/수정 로그용)"""
+from __future__ import annotations
+import sys
+import time
+from collections import OrderedDict
+from typing import Any
+
+import discord
+
+from .constants import MESSAGE_STORE_GUILD_BUDGET, MESSAGE_STORE_TOTAL_BUDGET
+
+__all__ = ["MessageStore", "StoredMessage"]
+
+
+class StoredMessage:
+    """로그에 필요한 메시지 정보만 담은 레코드"""
+
+    __slots__ = (
+        "message_id", "channel_id", "author_id", "author_name", "avatar_url",
+        "content", "attachments", "size",
+    )
+
+    def __init__(
+        self,
+        message_id: int,
+        channel_id: int,
+        author_id: int,
+        author_name: str,
+        avatar_url: str,
+        content: str,
+        attachments: tuple[tuple[str, str], ...] = (),
+    ):
+        self.message_id = message_id
+        self.channel_id = channel_id
+        self.author_id = author_id
+        self.author_name = author_name
+        self.avatar_url = avatar_url
+        self.content = content
+        self.attachments = attachments  # (파일명, URL)
+        self.size = self._estimate_size()
+
+    @classmethod
+    def from_message(cls, message: discord.Message) -> "StoredMessage":
+        return cls(
+            message.id,
+            message.channel.id,
+            message.author.id,
+            str(message.author),
+            message.author.display_avatar.url,
+            message.content,
+            tuple((att.filename, att.url) for att in message.attachments),
+        )
+
+    def _estimate_size(self) -> int:
+        """레코드가 차지하는 대략적인 메모리 (바이트)"""
+        size = sys.getsizeof(self) + sys.getsizeof(self.content)
+        size += sys.getsizeof(self.author_name) + sys.getsizeof(self.avatar_url)
+        for filename, url in self.attachments:
+            size += sys.getsizeof(filename) + sys.getsizeof(url)
+        return size
+
+
+class _GuildMessages:
+    __slots__ = ("messages", "bytes", "evictions")
+
+    def __init__(self):
+        self.messages: OrderedDict[int, StoredMessage] = OrderedDict()
+        self.bytes = 0
+        self.evictions = 0
+
+
+class MessageStore:
+    """서버별/전체 메모리 예산 안에서 최근 메시지를 보관하는 LRU
+
+    py-cord 메시지 캐시는 전체 1000개로 제한되어 오래된 메시지의 삭제/수정은
+    on_message_delete/on_message_edit가 호출되지 않습니다. raw 이벤트와 이
+    저장소를 함께 사용하면 예산 안의 메시지는 모두 내용과 함께 기록됩니다.
+    저장/조회한 메시지가 가장 최근으로 옮겨지며, 전체 예산을 넘으면 가장 많이
+    쓰는 서버의 오래된 메시지부터 제거합니다.
+    """
+
+    def __init__(
+        self,
+        guild_budget: int = MESSAGE_STORE_GUILD_BUDGET,
+        total_budget: int = MESSAGE_STORE_TOTAL_BUDGET,
+    ):
+        self.guild_budget = guild_budget
+        self.total_budget = total_budget
+        self.bytes = 0  # 전체 서버 합계
+        self._guilds: dict[int, _GuildMessages] = {}
+        self.hits = 0
+        self.misses = 0
+        self.started_at = time.monotonic()
+
+    def add(self, guild_id: int, record: StoredMessage) -> None:
+        """메시지 저장 (같은 ID는 교체, 예산 초과 시 오래된 것부터 제거)"""
+        guild = self._guilds.get(guild_id)
+        if guild is None:
+            guild = self._guilds[guild_id] = _GuildMessages()
+
+        previous = guild.messages.pop(record.message_id, None)
+        if previous:
+            self._discount(guild, previous)
+        guild.messages[record.message_id] = record
+        guild.bytes += record.size
+        self.bytes += record.size
+
+        while guild.bytes > self.guild_budget and len(guild.messages) > 1:
+            self._evict(guild)
+        while self.bytes > self.total_budget:
+            largest = max(self._guilds.values(), key=lambda g: g.bytes)
+            if len(largest.messages) <= 1:
+                break
+            self._evict(largest)
+
+    def _evict(self, guild: _GuildMessages) -> None:
+        _, evicted = guild.messages.popitem(last=False)
+        self._discount(guild, evicted)
+        guild.evictions += 1
+
+    def _discount(self, guild: _GuildMessages, record: StoredMessage) -> None:
+        guild.bytes -= record.size
+        self.bytes -= record.size
+
+    def get(self, guild_id: int, message_id: int) -> StoredMessage | None:
+        """저장된 메시지 조회 (가장 최근으로 옮김)"""
+        guild = self._guilds.get(guild_id)
+        record = guild.messages.get(message_id) if guild else None
+        if record is None:
+            self.misses += 1
+            return None
+        guild.messages.move_to_end(message_id)
+        self.hits += 1
+        return record
+
+    def pop(self, guild_id: int, message_id: int) -> StoredMessage | None:
+        """삭제된 메시지 꺼내기"""
+        guild = self._guilds.get(guild_id)
+        record = guild.messages.pop(message_id, None) if guild else None
+        if record is None:
+            self.misses += 1
+            return None
+        self._discount(guild, record)
+        self.hits += 1
+        return record
+
+    def update_content(self, guild_id: int, message_id: int, content: str) -> None:
+        """수정된 내용으로 교체"""
+        guild = self._guilds.get(guild_id)
+        record = guild.messages.get(message_id) if guild else None
+        if record is None:
+            return
+        self.add(guild_id, StoredMessage(
+            record.message_id, record.channel_id, record.author_id, record.author_name,
+            record.avatar_url, content, record.attachments,
+        ))
+
+    def remove_guild(self, guild_id: int) -> None:
+        guild = self._guilds.pop(guild_id, None)
+        if guild:
+            self.bytes -= guild.bytes
+
+    def stats(self, guild_id: int | None = None) -> dict[str, Any]:
+        """메시지 수, 메모리 사용량, 제거 횟수 (guild_id가 없으면 전체 합계)"""
+        if guild_id is None:
+            guilds = list(self._guilds.values())
+        else:
+            guilds = [self._guilds[guild_id]] if guild_id in self._guilds else []
+        evictions = sum(guild.evictions for guild in guilds)
+        hours = max(time.monotonic() - self.started_at, 1.0) / 3600
+        return {
+            "guilds": len(guilds),
+            "messages": sum(len(guild.messages) for guild in guilds),
+            "bytes": sum(guild.bytes for guild in guilds),
+            "budget": self.guild_budget * max(len(guilds), 1),
+            "total_bytes": self.bytes,
+            "total_budget": self.total_budget,
+            "evictions": evictions,
+            "evictions_per_hour": evictions / hours,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
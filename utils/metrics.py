@@ -0,0 +1,196 @@
+"""DataManager 쿼리 지연 시간 측정"""
+from __future__ import annotations
+import functools
+import logging
+import re
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, Awaitable, Callable, TypeVar
+
+from .constants import SLOW_QUERY_HISTORY, SLOW_QUERY_THRESHOLD_MS
+
+__all__ = ["LatencyHistogram", "QueryMetrics", "SlowQuery", "format_ms", "instrumented", "redact_sql"]
+
+# 느린 쿼리 전용 로거 (logging_config에서 파일 핸들러 연결)
+slow_query_logger = logging.getLogger("slow_query")
+
+F = TypeVar("F", bound=Callable[..., Awaitable[Any]])
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+\b")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def redact_sql(sql: str) -> str:
+    """SQL의 리터럴 값을 가리고 한 줄로 정리"""
+    sql = _STRING_LITERAL.sub("'?'", sql)
+    sql = _NUMBER_LITERAL.sub("?", sql)
+    return _WHITESPACE.sub(" ", sql).strip()
+
+
+def _describe_params(parameters: Any, many: bool = False) -> str:
+    """파라미터 값 대신 개수와 타입만 표시"""
+    if parameters is None:
+        return "없음"
+    if many:
+        try:
+            return f"{len(parameters)}행"
+        except TypeError:
+            return "여러 행"
+    if isinstance(parameters, dict):
+        return ", ".join(f":{key}={type(value).__name__}" for key, value in parameters.items())
+    return ", ".join(type(value).__name__ for value in parameters)
+
+
+def format_ms(value: float) -> str:
+    """ms 값을 짧은 문자열로 변환"""
+    if value >= 1000:
+        return f"{value / 1000:.1f}s"
+    if value >= 10:
+        return f"{value:.0f}ms"
+    return f"{value:.2f}ms"
+
+
+class LatencyHistogram:
+    """로그 간격 버킷 지연 시간 히스토그램 (ms)
+
+    버킷 경계는 0.01ms부터 2배씩 커지며, 백분위수는 해당 버킷의 상한으로
+    근사합니다.
+    """
+
+    BOUNDS: tuple[float, ...] = tuple(0.01 * 2 ** i for i in range(21))  # ~10.5초
+
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(self.BOUNDS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, elapsed_ms: float) -> None:
+        """측정값 기록"""
+        index = 0
+        while index < len(self.BOUNDS) and elapsed_ms > self.BOUNDS[index]:
+            index += 1
+        self.counts[index] += 1
+        self.count += 1
+        self.total += elapsed_ms
+        if elapsed_ms > self.max:
+            self.max = elapsed_ms
+
+    def percentile(self, q: float) -> float:
+        """백분위수 근사값 (q: 0~1)"""
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        cumulative = 0
+        for index, bucket in enumerate(self.counts):
+            cumulative += bucket
+            if cumulative >= target:
+                upper = self.BOUNDS[index] if index < len(self.BOUNDS) else self.max
+                return min(upper, self.max)
+        return self.max
+
+    @property
+    def mean(self) -> float:
+        """평균"""
+        return self.total / self.count if self.count else 0.0
+
+
+class SlowQuery:
+    """느린 쿼리 기록"""
+
+    __slots__ = ("at", "elapsed_ms", "sql", "params")
+
+    def __init__(self, elapsed_ms: float, sql: str, params: str):
+        self.at = datetime.now()
+        self.elapsed_ms = elapsed_ms
+        self.sql = sql
+        self.params = params
+
+
+class QueryMetrics:
+    """메서드별 지연 시간/오류 및 느린 쿼리 집계"""
+
+    def __init__(self, slow_threshold_ms: float = SLOW_QUERY_THRESHOLD_MS):
+        self.slow_threshold_ms = slow_threshold_ms
+        self.methods: dict[str, LatencyHistogram] = {}
+        self.errors: dict[str, int] = {}
+        self.statements = LatencyHistogram()
+        self.slow_count = 0
+        self.recent_slow: deque[SlowQuery] = deque(maxlen=SLOW_QUERY_HISTORY)
+        self.started_at = datetime.now()
+
+    def record(self, name: str, elapsed_ms: float, error: bool = False) -> None:
+        """메서드 호출 기록"""
+        histogram = self.methods.get(name)
+        if histogram is None:
+            histogram = self.methods[name] = LatencyHistogram()
+        histogram.observe(elapsed_ms)
+        if error:
+            self.errors[name] = self.errors.get(name, 0) + 1
+
+    def record_statement(self, sql: str, parameters: Any, elapsed_ms: float, many: bool = False) -> None:
+        """SQL 문 실행 기록 (임계값을 넘으면 느린 쿼리 로그에 남김)"""
+        self.statements.observe(elapsed_ms)
+        if elapsed_ms < self.slow_threshold_ms:
+            return
+
+        entry = SlowQuery(elapsed_ms, redact_sql(sql), _describe_params(parameters, many))
+        self.slow_count += 1
+        self.recent_slow.append(entry)
+        slow_query_logger.warning(f"{elapsed_ms:.1f}ms | {entry.sql} | 파라미터: {entry.params}")
+
+    def summary(self) -> list[dict[str, Any]]:
+        """메서드별 요약 (호출 수 많은 순)"""
+        rows = [
+            {
+                "name": name,
+                "calls": histogram.count,
+                "errors": self.errors.get(name, 0),
+                "mean": histogram.mean,
+                "p50": histogram.percentile(0.5),
+                "p99": histogram.percentile(0.99),
+                "max": histogram.max,
+            }
+            for name, histogram in self.methods.items()
+        ]
+        rows.sort(key=lambda row: row["calls"], reverse=True)
+        return rows
+
+    def reset(self) -> None:
+        """통계 초기화"""
+        self.methods.clear()
+        self.errors.clear()
+        self.statements = LatencyHistogram()
+        self.slow_count = 0
+        self.recent_slow.clear()
+        self.started_at = datetime.now()
+
+
+def instrumented(label: str, default: Any = None) -> Callable[[F], F]:
+    """비동기 메서드 실행 시간을 self.metrics에 기록하고, 예외는 로그 후 기본값 반환
+
+    default가 호출 가능하면(list, dict 등) 매번 새 값을 만들어 반환합니다.
+    """
+    def decorator(func: F) -> F:
+        name = func.__name__
+        logger = logging.getLogger(func.__module__)
+
+        @functools.wraps(func)
+        async def wrapper(self, *args: Any, **kwargs: Any) -> Any:
+            started = time.perf_counter()
+            try:
+                result = await func(self, *args, **kwargs)
+            except Exception as e:
+                self.metrics.record(name, (time.perf_counter() - started) * 1000, error=True)
+                logger.error(f"{label} 실패: {e}")
+                return default() if callable(default) else default
+            self.metrics.record(name, (time.perf_counter() - started) * 1000)
+            return result
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
@@ -0,0 +1,223 @@
+"""PRAGMA user_version 기반 스키마 마이그레이션"""
+from __future__ import annotations
+import logging
+from typing import Awaitable, Callable
+
+import aiosqlite
+
+from .db_pool import ConnectionPool
+
+__all__ = ["MIGRATIONS", "SCHEMA_VERSION", "get_schema_version", "migrate"]
+
+logger = logging.getLogger(__name__)
+
+Migration = Callable[[aiosqlite.Connection], Awaitable[None]]
+
+
+async def _create_base_schema(db: aiosqlite.Connection) -> None:
+    """v1: 초기 스키마 (기존 DB에는 영향 없음)"""
+    await db.execute("""
+        CREATE TABLE IF NOT EXISTS user_profiles (
+            user_id TEXT PRIMARY KEY,
+            username TEXT NOT NULL,
+            display_name TEXT,
+            birth_year TEXT,
+            gender TEXT,
+            region TEXT,
+            registered_at TEXT,
+            updated_at TEXT
+        )
+    """)
+
+    await db.execute("""
+        CREATE TABLE IF NOT EXISTS admin_info (
+            user_id TEXT PRIMARY KEY,
+            warning_count INTEGER DEFAULT 0,
+            admin_memo TEXT,
+            updated_at TEXT,
+            FOREIGN KEY (user_id) REFERENCES user_profiles (user_id)
+        )
+    """)
+
+    await db.execute("""
+        CREATE TABLE IF NOT EXISTS server_settings (
+            guild_id TEXT PRIMARY KEY,
+            log_channel_id TEXT,
+            updated_at TEXT
+        )
+    """)
+
+    await db.execute("""
+        CREATE TABLE IF NOT EXISTS reaction_roles (
+            reaction_id TEXT PRIMARY KEY,
+            message_id TEXT NOT NULL,
+            channel_id TEXT NOT NULL,
+            emoji TEXT NOT NULL,
+            role_id TEXT NOT NULL,
+            created_at TEXT
+        )
+    """)
+
+
+async def _integer_snowflakes(db: aiosqlite.Connection) -> None:
+    """v2: Discord ID를 INTEGER로 변환하고 복합/서버 인덱스 추가"""
+    await db.execute("""
+        CREATE TABLE user_profiles_new (
+            user_id INTEGER PRIMARY KEY,
+            username TEXT NOT NULL,
+            display_name TEXT NOT NULL,
+            birth_year TEXT,
+            gender TEXT,
+            region TEXT,
+            registered_at TEXT,
+            updated_at TEXT
+        )
+    """)
+    await db.execute("""
+        INSERT INTO user_profiles_new
+        SELECT CAST(user_id AS INTEGER), username, COALESCE(display_name, username),
+               birth_year, gender, region, registered_at, updated_at
+        FROM user_profiles
+    """)
+    await db.execute("DROP TABLE user_profiles")
+    await db.execute("ALTER TABLE user_profiles_new RENAME TO user_profiles")
+    await db.execute("""
+        CREATE INDEX idx_profile_display_name
+        ON user_profiles(display_name, user_id)
+    """)
+
+    await db.execute("""
+        CREATE TABLE admin_info_new (
+            user_id INTEGER PRIMARY KEY,
+            warning_count INTEGER NOT NULL DEFAULT 0,
+            admin_memo TEXT,
+            updated_at TEXT,
+            FOREIGN KEY (user_id) REFERENCES user_profiles (user_id)
+        )
+    """)
+    await db.execute("""
+        INSERT INTO admin_info_new
+        SELECT CAST(user_id AS INTEGER), COALESCE(warning_count, 0), admin_memo, updated_at
+        FROM admin_info
+    """)
+    await db.execute("DROP TABLE admin_info")
+    await db.execute("ALTER TABLE admin_info_new RENAME TO admin_info")
+
+    await db.execute("""
+        CREATE TABLE server_settings_new (
+            guild_id INTEGER PRIMARY KEY,
+            log_channel_id INTEGER,
+            updated_at TEXT
+        )
+    """)
+    await db.execute("""
+        INSERT INTO server_settings_new
+        SELECT CAST(guild_id AS INTEGER), CAST(log_channel_id AS INTEGER), updated_at
+        FROM server_settings
+    """)
+    await db.execute("DROP TABLE server_settings")
+    await db.execute("ALTER TABLE server_settings_new RENAME TO server_settings")
+
+    # guild_id는 기존 행에 없으므로 NULL로 두고 시작 시 채널 정보로 채움
+    await db.execute("""
+        CREATE TABLE reaction_roles_new (
+            reaction_id TEXT PRIMARY KEY,
+            guild_id INTEGER,
+            message_id INTEGER NOT NULL,
+            channel_id INTEGER NOT NULL,
+            emoji TEXT NOT NULL,
+            role_id INTEGER NOT NULL,
+            created_at TEXT
+        )
+    """)
+    # 같은 메시지/이모지 중복은 먼저 등록된 매핑만 유지
+    await db.execute("""
+        INSERT INTO reaction_roles_new
+        SELECT reaction_id, NULL, CAST(message_id AS INTEGER), CAST(channel_id AS INTEGER),
+               emoji, CAST(role_id AS INTEGER), created_at
+        FROM reaction_roles
+        WHERE rowid IN (SELECT MIN(rowid) FROM reaction_roles GROUP BY message_id, emoji)
+    """)
+    await db.execute("DROP TABLE reaction_roles")
+    await db.execute("ALTER TABLE reaction_roles_new RENAME TO reaction_roles")
+    await db.execute("""
+        CREATE UNIQUE INDEX idx_reaction_message_emoji
+        ON reaction_roles(message_id, emoji)
+    """)
+    await db.execute("""
+        CREATE INDEX idx_reaction_guild
+        ON reaction_roles(guild_id, channel_id)
+    """)
+
+
+async def _profile_search_index(db: aiosqlite.Connection) -> None:
+    """v3: 닉네임/유저명/지역 FTS5 trigram 검색 인덱스 및 지역 인덱스"""
+    # user_profiles를 원본으로 쓰는 external content 테이블 (rowid = user_id)
+    await db.execute("""
+        CREATE VIRTUAL TABLE profile_search USING fts5(
+            display_name, username, region,
+            content='user_profiles', content_rowid='user_id',
+            tokenize='trigram'
+        )
+    """)
+    await db.execute("""
+        CREATE TRIGGER profile_search_insert AFTER INSERT ON user_profiles BEGIN
+            INSERT INTO profile_search (rowid, display_name, username, region)
+            VALUES (new.user_id, new.display_name, new.username, new.region);
+        END
+    """)
+    await db.execute("""
+        CREATE TRIGGER profile_search_delete AFTER DELETE ON user_profiles BEGIN
+            INSERT INTO profile_search (profile_search, rowid, display_name, username, region)
+            VALUES ('delete', old.user_id, old.display_name, old.username, old.region);
+        END
+    """)
+    await db.execute("""
+        CREATE TRIGGER profile_search_update
+        AFTER UPDATE OF display_name, username, region ON user_profiles BEGIN
+            INSERT INTO profile_search (profile_search, rowid, display_name, username, region)
+            VALUES ('delete', old.user_id, old.display_name, old.username, old.region);
+            INSERT INTO profile_search (rowid, display_name, username, region)
+            VALUES (new.user_id, new.display_name, new.username, new.region);
+        END
+    """)
+    await db.execute("INSERT INTO profile_search (profile_search) VALUES ('rebuild')")
+    # 지역은 대부분 2글자라 trigram 대신 정확히 일치하는 값을 인덱스로 조회
+    await db.execute("CREATE INDEX idx_profile_region ON user_profiles(region, user_id)")
+
+
+# 순서대로 적용되며, 인덱스 + 1이 적용 후의 user_version
+MIGRATIONS: list[Migration] = [
+    _create_base_schema,
+    _integer_snowflakes,
+    _profile_search_index,
+]
+
+SCHEMA_VERSION = len(MIGRATIONS)
+
+
+async def get_schema_version(db: aiosqlite.Connection) -> int:
+    """현재 스키마 버전 조회"""
+    cursor = await db.execute("PRAGMA user_version")
+    row = await cursor.fetchone()
+    return row[0] if row else 0
+
+
+async def migrate(pool: ConnectionPool) -> int:
+    """필요한 마이그레이션을 버전별 트랜잭션으로 적용하고 최종 버전 반환"""
+    async with pool.reader() as db:
+        version = await get_schema_version(db)
+
+    if version >= SCHEMA_VERSION:
+        return version
+
+    for target in range(version + 1, SCHEMA_VERSION + 1):
+        migration = MIGRATIONS[target - 1]
+        async with pool.writer() as db:
+            # DDL은 암묵적 트랜잭션이 열리지 않으므로 명시적으로 시작
+            await db.execute("BEGIN")
+            await migration(db)
+            await db.execute(f"PRAGMA user_version = {target}")
+        logger.info(f"스키마 마이그레이션 적용: v{target} ({migration.__doc__})")
+
+    return SCHEMA_VERSION
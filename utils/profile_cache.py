@@ -0,0 +1,100 @@
+"""프로필 LRU 캐시"""
+from __future__ import annotations
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+from .constants import PROFILE_CACHE_SIZE, PROFILE_CACHE_TTL
+
+__all__ = ["ProfileRecord", "ProfileCache"]
+
+
+@dataclass(frozen=True, slots=True)
+class ProfileRecord:
+    """user_profiles와 admin_info를 합친 프로필 레코드"""
+
+    user_id: int
+    username: str
+    display_name: str
+    birth_year: str | None
+    gender: str | None
+    region: str | None
+    registered_at: str | None
+    warning_count: int | None
+    admin_memo: str | None
+
+    @property
+    def has_admin_info(self) -> bool:
+        """admin_info 행 존재 여부"""
+        return self.warning_count is not None
+
+
+class ProfileCache:
+    """TTL이 있는 크기 제한 LRU 캐시
+
+    조회 시작 시점의 generation을 put에 넘기면, 그 사이 무효화가 있었던 경우
+    오래된 값을 저장하지 않습니다.
+    """
+
+    def __init__(self, maxsize: int = PROFILE_CACHE_SIZE, ttl: float = PROFILE_CACHE_TTL):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.generation = 0
+        self._entries: OrderedDict[int, tuple[float, ProfileRecord]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, user_id: int) -> ProfileRecord | None:
+        """캐시 조회 (만료된 항목은 제거)"""
+        entry = self._entries.get(user_id)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, record = entry
+        if expires_at < time.monotonic():
+            del self._entries[user_id]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(user_id)
+        self.hits += 1
+        return record
+
+    def put(self, record: ProfileRecord, generation: int) -> None:
+        """캐시 저장 (조회 중 무효화가 있었으면 무시)"""
+        if generation != self.generation:
+            return
+
+        self._entries[record.user_id] = (time.monotonic() + self.ttl, record)
+        self._entries.move_to_end(record.user_id)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, user_id: int) -> None:
+        """특정 유저 항목 무효화"""
+        self.generation += 1
+        self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        """전체 무효화"""
+        self.generation += 1
+        self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """캐시 통계"""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
@@ -0,0 +1,119 @@
+"""역할 반응 이벤트 중복 제거/병합"""
+from __future__ import annotations
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable
+
+from .constants import REACTION_COALESCE_WINDOW, REACTION_PROMPT_COOLDOWN
+
+__all__ = ["ReactionDebouncer"]
+
+logger = logging.getLogger(__name__)
+
+_Key = tuple[int, int, int]  # (user_id, message_id, role_id)
+
+
+class _Pending:
+    __slots__ = ("first", "last", "callback", "handle")
+
+    def __init__(self, added: bool, callback: Callable[[], Awaitable[Any]], handle: asyncio.TimerHandle):
+        self.first = added
+        self.last = added
+        self.callback = callback
+        self.handle = handle
+
+
+class ReactionDebouncer:
+    """(유저, 메시지, 역할)별로 반응 추가/제거를 window초 동안 모아서 한 번만 처리
+
+    window 안에서 반응을 여러 번 누르면 마지막 상태만 남고, 추가/제거가 짝을
+    이루면(짝수 번 토글) 아무것도 하지 않습니다. 인증 안내(추가)를 보낸 뒤
+    cooldown초 동안은 같은 메시지에 다시 반응해도 안내를 보내지 않습니다.
+    """
+
+    def __init__(self, window: float = REACTION_COALESCE_WINDOW, cooldown: float = REACTION_PROMPT_COOLDOWN):
+        self.window = window
+        self.cooldown = cooldown
+        self._pending: dict[_Key, _Pending] = {}
+        self._cooldowns: dict[_Key, float] = {}
+        self._tasks: set[asyncio.Task] = set()
+        self.counters = {
+            "received": 0,
+            "coalesced": 0,  # 대기 중인 처리에 합쳐진 이벤트
+            "cancelled": 0,  # 추가/제거가 상쇄되어 처리하지 않은 묶음
+            "suppressed": 0,  # 쿨다운 중이라 보내지 않은 안내
+            "added": 0,
+            "removed": 0,
+            "errors": 0,
+        }
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def _in_cooldown(self, key: _Key, now: float) -> bool:
+        until = self._cooldowns.get(key)
+        if until is None:
+            return False
+        if until <= now:
+            del self._cooldowns[key]
+            return False
+        return True
+
+    def submit(self, key: _Key, added: bool, callback: Callable[[], Awaitable[Any]]) -> None:
+        """반응 이벤트 등록 (callback은 이 묶음의 마지막 이벤트 것만 실행)"""
+        counters = self.counters
+        counters["received"] += 1
+        pending = self._pending.get(key)
+        if pending:
+            counters["coalesced"] += 1
+            pending.last = added
+            pending.callback = callback
+            return
+
+        now = time.monotonic()
+        if added and self._in_cooldown(key, now):
+            counters["suppressed"] += 1
+            return
+        if len(self._cooldowns) > 10000:
+            self._cooldowns = {k: until for k, until in self._cooldowns.items() if until > now}
+
+        handle = asyncio.get_running_loop().call_later(self.window, self._fire, key)
+        self._pending[key] = _Pending(added, callback, handle)
+
+    def _fire(self, key: _Key) -> None:
+        pending = self._pending.pop(key, None)
+        if pending is None:
+            return
+        # 짝수 번 토글이면 처음 상태 그대로이므로 처리할 것이 없음
+        if pending.last != pending.first:
+            self.counters["cancelled"] += 1
+            return
+        if pending.last:
+            if self._in_cooldown(key, time.monotonic()):
+                self.counters["suppressed"] += 1
+                return
+            self._cooldowns[key] = time.monotonic() + self.cooldown
+            self.counters["added"] += 1
+        else:
+            self.counters["removed"] += 1
+
+        task = asyncio.create_task(self._run(pending.callback))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, callback: Callable[[], Awaitable[Any]]) -> None:
+        try:
+            await callback()
+        except Exception as e:
+            self.counters["errors"] += 1
+            logger.error(f"반응 처리 실패: {type(e).__name__}: {e}")
+
+    async def close(self) -> None:
+        """대기 중인 묶음 취소 후 실행 중인 처리 대기"""
+        for pending in self._pending.values():
+            pending.handle.cancel()
+        self._pending.clear()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
@@ -0,0 +1,222 @@
+"""시작 시 반응 역할 동기화 (오프라인 동안 놓친 반응 반영)"""
+from __future__ import annotations
+import asyncio
+import logging
+from datetime import datetime, timezone
+
+import discord
+
+from .constants import (
+    REACTION_RECONCILE_APPLY_INTERVAL,
+    REACTION_RECONCILE_CONCURRENCY,
+    REACTION_RECONCILE_DELAY,
+    REACTION_RECONCILE_REVOKE,
+)
+from .rest_scheduler import Priority
+from .role_service import sync_profile_roles
+
+__all__ = ["ReactionReconciler"]
+
+logger = logging.getLogger(__name__)
+
+_PAGE_SIZE = 100  # 반응 유저 조회 API 한 번에 받을 수 있는 최대 수
+
+
+def _reaction_param(emoji: str) -> str:
+    """저장된 이모지 문자열 → 반응 API 경로 형식 (커스텀 이모지는 name:id)"""
+    partial = discord.PartialEmoji.from_str(emoji)
+    return f"{partial.name}:{partial.id}" if partial.id else partial.name
+
+
+class ReactionReconciler:
+    """reaction_roles의 모든 반응을 훑어 역할을 반응 상태에 맞춤
+
+    - 반응했지만 역할이 없는 멤버: 프로필이 있으면 인증 역할과 프로필 역할을
+      지급하고, 없으면 미인증으로만 집계합니다(안내 DM은 보내지 않음).
+    - 역할이 있지만 반응이 없는 멤버: 기본은 집계(stale)만 합니다. 봇은 "꺼져
+      있는 동안 반응을 지움"과 "처음부터 반응하지 않음"(관리자가 직접 준 역할,
+      반응이 지워진 메시지 등)을 구분할 수 없기 때문입니다. revoke=True일 때만
+      회수하며, 해당 역할의 반응을 하나라도 읽지 못했으면 집계/회수하지 않습니다.
+
+    조회와 수정은 모두 MAINTENANCE 우선순위로 보내 사용자 요청과 로그 전송의
+    슬롯을 쓰지 않고, 수정 요청 사이에는 apply_interval초씩 쉬어 요청 한도를
+    넘지 않게 합니다.
+    """
+
+    def __init__(
+        self,
+        bot: discord.Bot,
+        concurrency: int = REACTION_RECONCILE_CONCURRENCY,
+        delay: float = REACTION_RECONCILE_DELAY,
+        apply_interval: float = REACTION_RECONCILE_APPLY_INTERVAL,
+        revoke: bool = REACTION_RECONCILE_REVOKE,
+    ):
+        self.bot = bot
+        self.revoke = revoke
+        self.concurrency = max(1, concurrency)
+        self.delay = delay
+        self.apply_interval = apply_interval
+        self._task: asyncio.Task | None = None
+        self.started_at: datetime | None = None
+        self.finished_at: datetime | None = None
+        self.last_error: str | None = None
+        self.counters = self._new_counters()
+
+    @staticmethod
+    def _new_counters() -> dict[str, int]:
+        return {
+            "reactions": 0,  # 확인할 반응 설정 수
+            "scanned": 0,  # 확인을 마친 반응 설정 수
+            "skipped": 0,  # 메시지/채널을 찾지 못했거나 조회에 실패한 반응 설정
+            "reactors": 0,
+            "granted": 0,
+            "stale": 0,  # 반응 없이 역할만 가진 멤버
+            "revoked": 0,
+            "unverified": 0,  # 반응했지만 프로필이 없는 멤버
+            "errors": 0,
+        }
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """백그라운드 동기화 시작 (이미 실행 중이면 무시)"""
+        if self.running:
+            return
+        self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        """실행 중인 동기화 취소"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+
+    async def _run(self) -> None:
+        await asyncio.sleep(self.delay)
+        self.counters = self._new_counters()
+        self.started_at = datetime.now(timezone.utc)
+        self.finished_at = None
+        self.last_error = None
+        try:
+            await self.reconcile()
+        except Exception as e:
+            self.last_error = f"{type(e).__name__}: {e}"
+            logger.error(f"반응 역할 동기화 실패: {self.last_error}", exc_info=e)
+        finally:
+            self.finished_at = datetime.now(timezone.utc)
+
+        counters = self.counters
+        logger.info(
+            f"반응 역할 동기화 완료: 반응 {counters['scanned']}/{counters['reactions']} "
+            f"(건너뜀 {counters['skipped']}), 지급 {counters['granted']}, "
+            f"반응 없는 보유자 {counters['stale']} (회수 {counters['revoked']}), "
+            f"미인증 {counters['unverified']}, 오류 {counters['errors']}"
+        )
+
+    async def reconcile(self) -> None:
+        """모든 반응 설정을 조회해 역할 지급/회수"""
+        entries = list((await self.bot.data_manager.get_all_reaction_roles()).values())
+        self.counters["reactions"] = len(entries)
+
+        reactors: dict[int, set[int]] = {}  # 역할 ID → 반응한 유저 ID
+        guilds: dict[int, discord.Guild] = {}  # 역할 ID → 서버
+        incomplete: set[int] = set()  # 반응을 다 읽지 못한 역할 (회수하지 않음)
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def scan(entry: dict) -> None:
+            role_id = entry['role_id']
+            async with semaphore:
+                channel = self.bot.get_channel(entry['channel_id'])
+                guild = getattr(channel, "guild", None)
+                try:
+                    if guild is None:
+                        raise LookupError(f"채널 없음: {entry['channel_id']}")
+                    user_ids = await self._fetch_reactors(entry)
+                except (LookupError, discord.HTTPException) as e:
+                    self.counters["skipped"] += 1
+                    self.last_error = f"{type(e).__name__}: {e}"
+                    incomplete.add(role_id)
+                else:
+                    guilds[role_id] = guild
+                    reactors.setdefault(role_id, set()).update(user_ids)
+                finally:
+                    self.counters["scanned"] += 1
+
+        await asyncio.gather(*(scan(entry) for entry in entries))
+        self.counters["reactors"] = sum(len(user_ids) for user_ids in reactors.values())
+
+        for role_id, guild in guilds.items():
+            role = guild.get_role(role_id)
+            if role is None:
+                continue
+            await self._grant_missing(guild, role, reactors[role_id])
+            if role_id not in incomplete:
+                await self._revoke_stale(role, reactors[role_id])
+
+    async def _fetch_reactors(self, entry: dict) -> set[int]:
+        """반응한 유저 ID (봇 제외), 100명씩 페이지 조회"""
+        channel_id, message_id = entry['channel_id'], entry['message_id']
+        emoji = _reaction_param(entry['emoji'])
+        user_ids: set[int] = set()
+        after = None
+        while True:
+            page = await self.bot.rest_scheduler.submit(
+                Priority.MAINTENANCE, f"reactions:{channel_id}",
+                self.bot.http.get_reaction_users, channel_id, message_id, emoji, _PAGE_SIZE, after=after
+            )
+            user_ids.update(int(user['id']) for user in page if not user.get('bot'))
+            if len(page) < _PAGE_SIZE:
+                return user_ids
+            after = page[-1]['id']
+
+    async def _grant_missing(self, guild: discord.Guild, role: discord.Role, user_ids: set[int]) -> None:
+        members = [
+            member for user_id in user_ids
+            if (member := guild.get_member(user_id)) is not None and role not in member.roles
+        ]
+        if not members:
+            return
+
+        profiles = await self.bot.data_manager.get_profiles_many(member.id for member in members)
+        for member in members:
+            profile = profiles.get(member.id)
+            if profile is None:
+                self.counters["unverified"] += 1
+                continue
+            if await self._apply(
+                sync_profile_roles(
+                    self.bot, member, profile.gender, profile.birth_year,
+                    extra_role_ids=(role.id,), reason="반응 역할 동기화", priority=Priority.MAINTENANCE
+                )
+            ):
+                self.counters["granted"] += 1
+
+    async def _revoke_stale(self, role: discord.Role, user_ids: set[int]) -> None:
+        for member in list(role.members):
+            if member.bot or member.id in user_ids:
+                continue
+            self.counters["stale"] += 1
+            if not self.revoke:
+                continue
+            if await self._apply(
+                self.bot.rest_scheduler.submit(
+                    Priority.MAINTENANCE, f"member:{role.guild.id}",
+                    member.remove_roles, role, reason="반응 역할 동기화"
+                )
+            ):
+                self.counters["revoked"] += 1
+
+    async def _apply(self, request) -> bool:
+        """역할 수정 요청 실행 후 apply_interval초 대기"""
+        try:
+            await request
+            return True
+        except Exception as e:
+            self.counters["errors"] += 1
+            self.last_error = f"{type(e).__name__}: {e}"
+            return False
+        finally:
+            await asyncio.sleep(self.apply_interval)
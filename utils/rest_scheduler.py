@@ -0,0 +1,193 @@
+"""우선순위 기반 REST 요청 스케줄러"""
+from __future__ import annotations
+import asyncio
+import heapq
+import itertools
+import time
+from datetime import datetime
+from enum import IntEnum
+from typing import Any, Awaitable, Callable, TypeVar
+
+from .constants import (
+    REST_BACKGROUND_CONCURRENCY,
+    REST_BUCKET_BACKGROUND_CONCURRENCY,
+    REST_MAINTENANCE_CONCURRENCY,
+    REST_MAX_CONCURRENCY,
+)
+from .metrics import LatencyHistogram
+
+__all__ = ["Priority", "RestScheduler"]
+
+T = TypeVar("T")
+
+
+class Priority(IntEnum):
+    """요청 우선순위 (값이 작을수록 먼저 실행)"""
+
+    INTERACTIVE = 0  # 사용자가 기다리는 응답 (DM 안내, 역할 지급)
+    BACKGROUND = 1  # 로그 전송 등
+    MAINTENANCE = 2  # 시작 시 반응 역할 동기화 등 늦어도 되는 대량 작업
+
+
+class _BucketStats:
+    """버킷별 대기/실행 시간"""
+
+    __slots__ = ("wait", "call", "errors")
+
+    def __init__(self) -> None:
+        self.wait = LatencyHistogram()  # 스케줄러 대기열에서 기다린 시간
+        self.call = LatencyHistogram()  # 요청 시간 (py-cord의 rate limit 대기 포함)
+        self.errors = 0
+
+
+class RestScheduler:
+    """Discord REST 요청의 동시 실행 수와 순서를 제어
+
+    전체 동시 요청은 max_concurrency개로, 백그라운드 요청은 그중
+    background_limit개로, 유지보수 요청은 그보다 적은 maintenance_limit개로,
+    같은 버킷의 백그라운드/유지보수 요청은 bucket_limit개로 제한합니다. 유지보수
+    요청은 백그라운드 슬롯을 쓰지 않으므로 동기화 중에도 로그 전송이 밀리지
+    않습니다. py-cord의 rate limit 대기(429)도 실행 중으로 집계되므로, 버킷별
+    상한이 없으면 한 채널의 대기가 백그라운드 슬롯을 모두 잡아 다른 서버의 로그
+    전송까지 멈춥니다. 슬롯이 비면 대기 중인 사용자 요청이 항상 먼저 실행되고,
+    버킷 상한에 걸린 요청은 건너뛰고 다음 요청을 실행합니다. 이미 전송 중인
+    요청은 중단하지 않습니다.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = REST_MAX_CONCURRENCY,
+        background_limit: int = REST_BACKGROUND_CONCURRENCY,
+        bucket_limit: int = REST_BUCKET_BACKGROUND_CONCURRENCY,
+        maintenance_limit: int = REST_MAINTENANCE_CONCURRENCY,
+    ):
+        self.max_concurrency = max(1, max_concurrency)
+        self.background_limit = max(1, min(background_limit, self.max_concurrency))
+        self.bucket_limit = max(1, min(bucket_limit, self.background_limit))
+        self.maintenance_limit = max(1, min(maintenance_limit, self.background_limit - 1))
+        self._limits = {Priority.BACKGROUND: self.background_limit, Priority.MAINTENANCE: self.maintenance_limit}
+        self._active = {priority: 0 for priority in Priority}
+        self._bucket_active: dict[str, int] = {}  # 버킷별 실행 중인 백그라운드/유지보수 요청
+        self._waiters: list[tuple[int, int, str, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self.buckets: dict[str, _BucketStats] = {}
+        self.priorities = {priority: _BucketStats() for priority in Priority}
+        self.started_at = datetime.now()
+
+    @property
+    def active(self) -> int:
+        return sum(self._active.values())
+
+    def waiting(self, priority: Priority | None = None) -> int:
+        return sum(
+            1 for waiter_priority, _, _, future in self._waiters
+            if not future.done() and (priority is None or waiter_priority == priority)
+        )
+
+    async def submit(
+        self,
+        priority: Priority,
+        bucket: str,
+        func: Callable[..., Awaitable[T]],
+        *args: Any,
+        **kwargs: Any,
+    ) -> T:
+        """슬롯을 받은 뒤 func(*args, **kwargs) 실행
+
+        bucket은 백그라운드/유지보수 동시 실행 상한과 통계의 단위입니다
+        (예: "channel:123", "dm", "member:456").
+        """
+        queued = time.perf_counter()
+        await self._acquire(priority, bucket)
+        started = time.perf_counter()
+        stats = self.buckets.get(bucket)
+        if stats is None:
+            stats = self.buckets[bucket] = _BucketStats()
+        try:
+            return await func(*args, **kwargs)
+        except Exception:
+            stats.errors += 1
+            self.priorities[priority].errors += 1
+            raise
+        finally:
+            self._release(priority, bucket)
+            wait_ms = (started - queued) * 1000
+            call_ms = (time.perf_counter() - started) * 1000
+            for target in (stats, self.priorities[priority]):
+                target.wait.observe(wait_ms)
+                target.call.observe(call_ms)
+
+    def _can_start(self, priority: Priority, bucket: str) -> bool:
+        if self.active >= self.max_concurrency:
+            return False
+        if priority == Priority.INTERACTIVE:
+            return True
+        return (
+            self._active[priority] < self._limits[priority]
+            and self._bucket_active.get(bucket, 0) < self.bucket_limit
+        )
+
+    def _start(self, priority: Priority, bucket: str) -> None:
+        self._active[priority] += 1
+        if priority != Priority.INTERACTIVE:
+            self._bucket_active[bucket] = self._bucket_active.get(bucket, 0) + 1
+
+    async def _acquire(self, priority: Priority, bucket: str) -> None:
+        """실행 슬롯 획득 (먼저 온 대기자가 실행될 수 있으면 그쪽이 먼저)"""
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), bucket, future))
+        self._wake()
+        try:
+            await future
+        except asyncio.CancelledError:
+            # 슬롯을 받은 직후 취소되면 반납
+            if future.done() and not future.cancelled():
+                self._release(priority, bucket)
+            raise
+
+    def _release(self, priority: Priority, bucket: str) -> None:
+        self._active[priority] -= 1
+        if priority != Priority.INTERACTIVE:
+            remaining = self._bucket_active[bucket] - 1
+            if remaining:
+                self._bucket_active[bucket] = remaining
+            else:
+                del self._bucket_active[bucket]
+        self._wake()
+
+    def _wake(self) -> None:
+        """대기자에게 빈 슬롯 배정 (우선순위, 도착 순, 상한에 걸린 요청은 건너뜀)"""
+        if not self._waiters:
+            return
+        pending = []
+        for waiter in sorted(self._waiters):
+            priority, _, bucket, future = waiter
+            if future.done():
+                continue
+            if self.active < self.max_concurrency and self._can_start(priority, bucket):
+                self._start(priority, bucket)
+                future.set_result(None)
+            else:
+                pending.append(waiter)
+        self._waiters = pending  # 정렬된 리스트는 그대로 힙 조건을 만족
+
+    def summary(self) -> list[dict[str, Any]]:
+        """버킷별 통계 (대기 p99 내림차순)"""
+        rows = [
+            {
+                "bucket": bucket,
+                "calls": stats.call.count,
+                "errors": stats.errors,
+                "wait_p50": stats.wait.percentile(0.5),
+                "wait_p99": stats.wait.percentile(0.99),
+                "call_p99": stats.call.percentile(0.99),
+            }
+            for bucket, stats in self.buckets.items()
+        ]
+        rows.sort(key=lambda row: row["wait_p99"], reverse=True)
+        return rows
+
+    def reset(self) -> None:
+        self.buckets.clear()
+        self.priorities = {priority: _BucketStats() for priority in Priority}
+        self.started_at = datetime.now()
@@ -0,0 +1,97 @@
+"""프로필 기반 역할 계산 및 적용"""
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Iterable
+
+import discord
+
+from .constants import AGE_ROLES, GENDER_ROLES, get_age_category
+from .rest_scheduler import Priority
+
+__all__ = ["RoleDiff", "apply_roles", "compute_diff", "profile_role_ids", "sync_profile_roles"]
+
+
+@dataclass(frozen=True, slots=True)
+class RoleDiff:
+    """적용할(또는 적용한) 역할 변경"""
+
+    added: tuple[discord.Role, ...] = ()
+    removed: tuple[discord.Role, ...] = ()
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed)
+
+
+def profile_role_ids(gender: str, birth_year: str) -> set[int]:
+    """성별/나이에 해당하는 역할 ID"""
+    role_ids = set()
+    gender_role_id = GENDER_ROLES.get(gender)
+    if gender_role_id:
+        role_ids.add(gender_role_id)
+    age_role_id = AGE_ROLES.get(get_age_category(birth_year))
+    if age_role_id:
+        role_ids.add(age_role_id)
+    return role_ids
+
+
+def compute_diff(member: discord.Member, target_ids: Iterable[int], remove_ids: Iterable[int] = ()) -> RoleDiff:
+    """현재 역할과 목표 역할의 차이
+
+    target_ids 중 서버에 있고 아직 없는 역할은 추가하고, remove_ids 중 가지고
+    있는 역할은 회수합니다. 그 밖의 역할은 건드리지 않습니다.
+    """
+    guild = member.guild
+    current_ids = {role.id for role in member.roles}
+    added = tuple(
+        role for role_id in sorted(set(target_ids) - current_ids)
+        if (role := guild.get_role(role_id)) is not None
+    )
+    remove_ids = set(remove_ids)
+    removed = tuple(role for role in member.roles if role.id in remove_ids)
+    return RoleDiff(added, removed)
+
+
+async def apply_roles(
+    bot: discord.Bot,
+    member: discord.Member,
+    target_ids: Iterable[int],
+    remove_ids: Iterable[int] = (),
+    reason: str | None = None,
+    priority: Priority = Priority.INTERACTIVE,
+) -> RoleDiff:
+    """바뀌는 역할만 한 번의 멤버 수정 요청으로 적용 (변경 없으면 호출 안 함)
+
+    캐시 기준으로 바뀔 역할이 있을 때만 멤버를 새로 조회해 차이를 다시 계산하고,
+    조회한 역할 목록에 차이만 반영해 보냅니다. 역할별 추가/삭제(역할 하나당
+    요청 하나) 대신 요청 하나로 끝나며, 오래된 캐시로 덮어쓰지 않으므로 다른
+    봇이나 관리자가 준 역할이 사라지지 않습니다. 권한 오류는 호출한 쪽에서
+    처리합니다.
+    """
+    target_ids, remove_ids = set(target_ids), set(remove_ids)
+    if not compute_diff(member, target_ids, remove_ids):
+        return RoleDiff()
+
+    bucket = f"member:{member.guild.id}"
+    fresh = await bot.rest_scheduler.submit(priority, bucket, member.guild.fetch_member, member.id)
+    diff = compute_diff(fresh, target_ids, remove_ids)
+    if not diff:
+        return diff
+    removed_ids = {role.id for role in diff.removed}
+    roles = [role for role in fresh.roles if not role.is_default() and role.id not in removed_ids]
+    roles.extend(diff.added)
+    await bot.rest_scheduler.submit(priority, bucket, fresh.edit, roles=roles, reason=reason)
+    return diff
+
+
+async def sync_profile_roles(
+    bot: discord.Bot,
+    member: discord.Member,
+    gender: str,
+    birth_year: str,
+    extra_role_ids: Iterable[int] = (),
+    reason: str | None = None,
+    priority: Priority = Priority.INTERACTIVE,
+) -> RoleDiff:
+    """프로필(성별/나이) 역할과 추가 역할(예: 반응 인증 역할) 중 없는 것만 지급"""
+    target_ids = profile_role_ids(gender, birth_year) | set(extra_role_ids)
+    return await apply_roles(bot, member, target_ids, reason=reason, priority=priority)
@@ -0,0 +1,130 @@
+"""그룹 커밋 쓰기 큐"""
+from __future__ import annotations
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, TypeVar
+
+import aiosqlite
+
+from .constants import WRITE_QUEUE_INTERVAL, WRITE_QUEUE_MAX_BATCH
+from .db_pool import ConnectionPool
+
+__all__ = ["WriteQueue", "WriteOp"]
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+WriteOp = Callable[[aiosqlite.Connection], Awaitable[Any]]
+
+
+class WriteQueue:
+    """짧은 간격 동안 모인 쓰기 작업을 하나의 트랜잭션으로 커밋
+
+    각 작업은 SAVEPOINT 안에서 실행되므로 한 작업이 실패해도 같은 배치의
+    다른 작업에는 영향을 주지 않으며, 호출자는 자신의 결과(또는 예외)를
+    커밋이 끝난 뒤에 받습니다.
+    """
+
+    def __init__(
+        self,
+        pool: ConnectionPool,
+        interval: float = WRITE_QUEUE_INTERVAL,
+        max_batch: int = WRITE_QUEUE_MAX_BATCH,
+    ):
+        self.pool = pool
+        self.interval = interval
+        self.max_batch = max(1, max_batch)
+        self._queue: asyncio.Queue[tuple[WriteOp, asyncio.Future] | None] = asyncio.Queue()
+        self._task: asyncio.Task | None = None
+        self._closed = False
+        self.batches = 0
+        self.writes = 0
+
+    @property
+    def pending(self) -> int:
+        """대기 중인 쓰기 작업 수"""
+        return self._queue.qsize()
+
+    def start(self) -> None:
+        """워커 시작"""
+        if self._task is None:
+            self._closed = False
+            self._task = asyncio.create_task(self._run(), name="write-queue")
+
+    async def submit(self, op: Callable[[aiosqlite.Connection], Awaitable[T]]) -> T:
+        """쓰기 작업 등록 후 커밋된 결과 대기"""
+        if self._closed or self._task is None:
+            raise RuntimeError("쓰기 큐가 실행 중이 아닙니다")
+
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((op, future))
+        return await future
+
+    async def close(self) -> None:
+        """남은 작업을 모두 커밋한 뒤 워커 종료"""
+        if self._task is None:
+            return
+
+        self._closed = True
+        self._queue.put_nowait(None)
+        try:
+            await self._task
+        finally:
+            self._task = None
+
+    async def _run(self) -> None:
+        """배치 수집 및 커밋 루프"""
+        while True:
+            item = await self._queue.get()
+            if item is None:
+                return
+
+            batch = [item]
+            await asyncio.sleep(self.interval)
+
+            stop = False
+            while len(batch) < self.max_batch and not self._queue.empty():
+                item = self._queue.get_nowait()
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+
+            await self._commit(batch)
+            if stop:
+                return
+
+    async def _commit(self, batch: list[tuple[WriteOp, asyncio.Future]]) -> None:
+        """배치를 하나의 트랜잭션으로 실행"""
+        outcomes: list[tuple[asyncio.Future, Any, BaseException | None]] = []
+        try:
+            async with self.pool.writer() as db:
+                # 바깥 트랜잭션을 명시적으로 열어 RELEASE가 커밋되지 않도록 함
+                await db.execute("BEGIN")
+                for op, future in batch:
+                    await db.execute("SAVEPOINT write_op")
+                    try:
+                        result = await op(db)
+                    except Exception as e:
+                        await db.execute("ROLLBACK TO write_op")
+                        await db.execute("RELEASE write_op")
+                        outcomes.append((future, None, e))
+                    else:
+                        await db.execute("RELEASE write_op")
+                        outcomes.append((future, result, None))
+        except Exception as e:
+            logger.error(f"쓰기 배치 커밋 실패 ({len(batch)}건): {e}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        self.batches += 1
+        self.writes += len(batch)
+        for future, result, error in outcomes:
+            if future.done():
+                continue
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)